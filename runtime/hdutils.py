@@ -15,10 +15,21 @@ from plotly.graph_objects import Figure
 from plotly.utils import PlotlyJSONEncoder
 from pydantic import BaseConfig, BaseModel, Field, ValidationError, create_model
 
+try:
+    # private Pandas API, see parse_decoded_pandas_data
+    from pandas.io.json._json import FrameParser, SeriesParser
+
+    PANDAS_JSON_PARSERS_AVAILABLE = True
+except ImportError:
+    FrameParser = SeriesParser = object  # type: ignore
+    PANDAS_JSON_PARSERS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 MULTITSFRAME_COLUMN_NAMES = ["timestamp", "metric", "value"]
 
+WRAPPED_DATA_OBJECT_KEY = "__hd_wrapped_data_object__"
+
 
 class ComponentException(Exception):
     """Exception to re-raise exceptions with error code raised in the component code."""
@@ -95,6 +106,9 @@ def try_parse_wrapped(
     hd_wrapped_data_object: Literal["SERIES", "DATAFRAME"],
 ) -> MetaDataWrapped:
     if isinstance(data, str):
+        if WRAPPED_DATA_OBJECT_KEY not in data:
+            # cheap check to avoid decoding large unwrapped json strings twice
+            raise TypeError(f"No {WRAPPED_DATA_OBJECT_KEY} key found in json string.")
         wrapped_data = MetaDataWrapped.parse_raw(data)  # model_validate_json in pydantic 2.0
 
         if wrapped_data.hd_wrapped_data_object__ != hd_wrapped_data_object:
@@ -139,6 +153,120 @@ def wrap_metadata_as_attrs(
     return data_object
 
 
+READ_JSON_PARSER_OPTIONS = {
+    "orient",
+    "dtype",
+    "convert_axes",
+    "convert_dates",
+    "keep_default_dates",
+    "precise_float",
+    "date_unit",
+}
+
+
+def frame_from_dict_of_dicts(data: dict) -> pd.DataFrame | None:
+    """Construct DataFrame from columns given as dicts with identical keys
+
+    This is the default json layout of DataFrames. Building the columns directly
+    from the dict values is much faster than letting Pandas align all columns.
+    Returns None if the columns do not share the same keys in the same order.
+    """
+    columns = list(data.values())
+    if len(columns) == 0 or not all(isinstance(column, dict) for column in columns):
+        return None
+    keys = list(columns[0])
+    if not all(len(column) == len(keys) and list(column) == keys for column in columns[1:]):
+        return None
+    return pd.DataFrame(
+        {name: list(column.values()) for name, column in data.items()},
+        index=pd.Index(keys, dtype=object),
+    )
+
+
+class DecodedSeriesParser(SeriesParser):
+    """Parser of pd.read_json for Series working on already decoded json"""
+
+    def __init__(self, decoded: dict | list, **kwargs: Any) -> None:
+        super().__init__("", **kwargs)
+        self.decoded = decoded
+
+    def _parse(self) -> None:
+        if self.orient == "split" and isinstance(self.decoded, dict):
+            decoded = {str(k): v for k, v in self.decoded.items()}
+            self.check_keys_split(decoded)
+            self.obj = pd.Series(**decoded)
+        else:
+            self.obj = pd.Series(self.decoded)
+
+
+class DecodedFrameParser(FrameParser):
+    """Parser of pd.read_json for DataFrames working on already decoded json
+
+    A DataFrame of decoded but not yet converted values is used as it is.
+    """
+
+    def __init__(self, decoded: dict | list | pd.DataFrame, **kwargs: Any) -> None:
+        super().__init__("", **kwargs)
+        self.decoded = decoded
+
+    def _parse(self) -> None:
+        if isinstance(self.decoded, pd.DataFrame):
+            self.obj = self.decoded
+        elif self.orient == "index":
+            self.obj = pd.DataFrame.from_dict(self.decoded, dtype=None, orient="index")
+        elif self.orient in ("split", "table"):
+            raise NotImplementedError(f"Orient {self.orient} is not handled for decoded json.")
+        else:
+            self.obj = (
+                frame_from_dict_of_dicts(self.decoded) if isinstance(self.decoded, dict) else None
+            )
+            if self.obj is None:
+                self.obj = pd.DataFrame(self.decoded, dtype=None)
+
+
+def parse_decoded_pandas_data(
+    data_content: dict | list | pd.DataFrame,
+    typ: Literal["series", "frame"],
+    parsing_options: dict,
+) -> pd.DataFrame | pd.Series:
+    """Parse already decoded json like pd.read_json parses the json string
+
+    Avoids serializing the data to json again just for pd.read_json to decode it.
+    The same type conversions as in pd.read_json are applied, hence the results are
+    identical up to the precision of float parsing, which is always precise here.
+
+    This relies on the private parser classes of pd.read_json, whose behaviour is pinned
+    for the Pandas version in use by tests comparing the results with pd.read_json.
+    Raises NotImplementedError if these classes are not available or for parsing options
+    that are not handled. Callers then fall back to pd.read_json.
+    """
+    if not PANDAS_JSON_PARSERS_AVAILABLE:
+        raise NotImplementedError("The json parsers of this Pandas version are not available.")
+    if not set(parsing_options).issubset(READ_JSON_PARSER_OPTIONS):
+        raise NotImplementedError(
+            "Parsing options "
+            + ", ".join(set(parsing_options) - READ_JSON_PARSER_OPTIONS)
+            + " are not handled for decoded json."
+        )
+    parser_kwargs = {
+        "orient": parsing_options.get("orient"),
+        "dtype": parsing_options.get("dtype"),
+        "convert_axes": parsing_options.get("convert_axes"),
+        "convert_dates": parsing_options.get("convert_dates", True),
+        "keep_default_dates": parsing_options.get("keep_default_dates", True),
+        "date_unit": parsing_options.get("date_unit"),
+    }
+    # defaults of pd.read_json
+    if parser_kwargs["dtype"] is None:
+        parser_kwargs["dtype"] = True
+    if parser_kwargs["convert_axes"] is None:
+        parser_kwargs["convert_axes"] = True
+
+    if typ == "frame":
+        return DecodedFrameParser(data_content, **parser_kwargs).parse()  # type: ignore
+    return DecodedSeriesParser(data_content, **parser_kwargs).parse()  # type: ignore
+
+
 def parse_pandas_data_content(
     data_content: str | dict | list, typ: Literal["series", "frame"], parsing_options: dict
 ) -> pd.DataFrame | pd.Series:
@@ -148,9 +276,10 @@ def parse_pandas_data_content(
                 io.StringIO(data_content), typ=typ, **parsing_options
             )
         else:
-            parsed_pandas_object = pd.read_json(data_content, typ=typ, **parsing_options)
+            parsed_pandas_object = parse_decoded_pandas_data(data_content, typ, parsing_options)
 
-    except Exception:  # noqa: BLE001
+    except Exception as e:  # noqa: BLE001
+        logger.debug("Falling back to parsing json string with pd.read_json: %s", str(e))
         try:
             parsed_pandas_object = pd.read_json(
                 io.StringIO(json.dumps(data_content)), typ=typ, **parsing_options
@@ -339,6 +468,8 @@ class PydanticMultiTimeseriesPandasDataFrame:
                 f'Got {str(df["timestamp"].dt.tz)} timezone instead.'
             )
 
+        if df["timestamp"].is_monotonic_increasing:
+            return df
         return df.sort_values("timestamp")
 
 
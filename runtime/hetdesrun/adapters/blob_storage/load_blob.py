@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import pickle
 from io import BytesIO
@@ -10,6 +11,7 @@ from mypy_boto3_s3.type_defs import GetObjectOutputTypeDef
 from hetdesrun.adapters.blob_storage.config import get_blob_adapter_config
 from hetdesrun.adapters.blob_storage.exceptions import StructureObjectNotFound
 from hetdesrun.adapters.blob_storage.models import (
+    BucketName,
     FileExtension,
     IdString,
     ObjectKey,
@@ -19,6 +21,7 @@ from hetdesrun.adapters.blob_storage.service import ensure_bucket_exists, get_s3
 from hetdesrun.adapters.blob_storage.structure import (
     get_source_by_thing_node_id_and_metadata_key,
 )
+from hetdesrun.adapters.concurrency import adapter_request_slot, load_concurrently
 from hetdesrun.adapters.exceptions import (
     AdapterClientWiringInvalidError,
     AdapterConnectionError,
@@ -70,18 +73,24 @@ async def load_blob_from_storage(thing_node_id: str, metadata_key: str) -> Any:
         object_key.string,
     )
     s3_client = await get_s3_client()
+    # boto3 and unpickling are blocking, hence done in a thread
+    return await asyncio.to_thread(load_object_from_storage, s3_client, bucket.name, object_key)
 
-    ensure_bucket_exists(s3_client=s3_client, bucket_name=bucket.name)
+
+def load_object_from_storage(
+    s3_client: S3Client, bucket_name: BucketName, object_key: ObjectKey
+) -> Any:
+    ensure_bucket_exists(s3_client=s3_client, bucket_name=bucket_name)
 
     try:
         response = get_object(
             s3_client=s3_client,
-            bucket_name=bucket.name,
+            bucket_name=bucket_name,
             object_key_string=object_key.string,
         )
     except s3_client.exceptions.NoSuchKey as error:
         raise AdapterConnectionError(
-            f"The bucket '{bucket.name}' contains no object " f"with the key '{object_key.string}'!"
+            f"The bucket '{bucket_name}' contains no object " f"with the key '{object_key.string}'!"
         ) from error
 
     if object_key.file_extension == FileExtension.H5:
@@ -102,7 +111,7 @@ async def load_blob_from_storage(thing_node_id: str, metadata_key: str) -> Any:
             try:
                 custom_objects_response = get_object(
                     s3_client=s3_client,
-                    bucket_name=bucket.name,
+                    bucket_name=bucket_name,
                     object_key_string=custom_objects_object_key.string,
                 )
             except s3_client.exceptions.NoSuchKey:
@@ -121,19 +130,14 @@ async def load_blob_from_storage(thing_node_id: str, metadata_key: str) -> Any:
 
 async def load_data(
     wf_input_name_to_filtered_source_mapping_dict: dict[str, FilteredSource],
-    adapter_key: str,  # noqa: ARG001
+    adapter_key: str,
 ) -> dict[str, Any]:
     """Load data for filtered sources from BLOB storage.
 
     A AdapterHandlingException or AdapterConnectionError raised in
     load_blob_from_storage may occur.
     """
-    wf_input_name_to_data_dict: dict[str, Any] = {}
-
-    for (
-        wf_input_name,
-        filtered_source,
-    ) in wf_input_name_to_filtered_source_mapping_dict.items():
+    for filtered_source in wf_input_name_to_filtered_source_mapping_dict.values():
         if filtered_source.ref_id is None or filtered_source.ref_key is None:
             msg = (
                 "To use the BLOB storage adapter each filtered "
@@ -143,8 +147,16 @@ async def load_data(
             logger.error(msg)
             raise AdapterClientWiringInvalidError(msg)
 
-        wf_input_name_to_data_dict[wf_input_name] = await load_blob_from_storage(
-            filtered_source.ref_id, filtered_source.ref_key
-        )
+    async def load_blob_in_request_slot(filtered_source: FilteredSource) -> Any:
+        async with adapter_request_slot(adapter_key):
+            return await load_blob_from_storage(
+                str(filtered_source.ref_id), str(filtered_source.ref_key)
+            )
 
-    return wf_input_name_to_data_dict
+    loaded_blobs = await load_concurrently(
+        load_blob_in_request_slot(filtered_source)
+        for filtered_source in wf_input_name_to_filtered_source_mapping_dict.values()
+    )
+    return dict(
+        zip(wf_input_name_to_filtered_source_mapping_dict.keys(), loaded_blobs, strict=True)
+    )
@@ -0,0 +1,69 @@
+"""Limits for concurrent requests to adapters
+
+Data is loaded from all adapters of a wiring concurrently and the adapters load independent
+sources concurrently as well. To not overload adapters and the systems behind them, every
+request to an adapter waits for a free slot: per worker process, at most
+adapter_max_concurrent_requests_per_adapter requests to the same adapter and
+adapter_max_concurrent_requests requests in total run at the same time.
+
+Blocking adapter requests, e.g. of the SQL adapter, are run in threads so that they do not
+block requests to other adapters.
+
+Concurrent loads are run via load_concurrently: if one of them fails, the others are cancelled
+instead of being left running in the background.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterable
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+from hetdesrun.webservice.config import get_config
+
+T = TypeVar("T")
+
+_global_semaphore: asyncio.Semaphore | None = None
+_adapter_semaphores: dict[str, asyncio.Semaphore] = {}
+_semaphores_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_adapter_semaphores(adapter_key: str) -> tuple[asyncio.Semaphore, asyncio.Semaphore]:
+    global _global_semaphore, _semaphores_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if loop is not _semaphores_loop or _global_semaphore is None:
+        # semaphores cannot be shared between event loops
+        _adapter_semaphores.clear()
+        _global_semaphore = asyncio.Semaphore(get_config().adapter_max_concurrent_requests)
+        _semaphores_loop = loop
+    if adapter_key not in _adapter_semaphores:
+        _adapter_semaphores[adapter_key] = asyncio.Semaphore(
+            get_config().adapter_max_concurrent_requests_per_adapter
+        )
+    return _adapter_semaphores[adapter_key], _global_semaphore
+
+
+@asynccontextmanager
+async def adapter_request_slot(adapter_key: str) -> AsyncIterator[None]:
+    """Wait until a request to the adapter is allowed and hold the slot while it runs"""
+    adapter_semaphore, global_semaphore = get_adapter_semaphores(adapter_key)
+    async with adapter_semaphore, global_semaphore:
+        yield
+
+
+async def run_blocking_adapter_request(adapter_key: str, func: Callable[..., T], *args: Any) -> T:
+    async with adapter_request_slot(adapter_key):
+        return await asyncio.to_thread(func, *args)
+
+
+async def load_concurrently(loads: Iterable[Coroutine[Any, Any, T]]) -> list[T]:
+    """Run the loads concurrently and return their results in order
+
+    If a load fails, the pending loads are cancelled and the exception of the first failed
+    load is raised, so callers handle the same exceptions as for a single load.
+    """
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(load) for load in loads]
+    except ExceptionGroup as exception_group:
+        raise exception_group.exceptions[0] from None
+    return [task.result() for task in tasks]
@@ -16,6 +16,7 @@ from hetdesrun.backend.models.adapter import AdapterFrontendDto
 from hetdesrun.backend.service.adapter_router import get_all_adapters
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import pooled_async_client
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +81,7 @@ async def load_generic_adapter_base_urls() -> list[BackendRegisteredGenericRestA
             raise AdapterHandlingException(msg) from e
     else:
         # call backend service "adapters" endpoint
-        async with httpx.AsyncClient(
+        async with pooled_async_client(
             verify=get_config().hd_backend_verify_certs,
             timeout=get_config().external_request_timeout,
         ) as client:
@@ -4,16 +4,21 @@ Common utilities for loading data that is frame-like (tabular), i.e. dataframes
 timeseries (where the later can be understood as special dataframe/table)
 """
 
+import asyncio
 import base64
 import datetime
+import io
 import json
 import logging
+from collections.abc import AsyncIterator
 from posixpath import join as posix_urljoin
 from typing import Any, Literal
 
+import httpx
 import pandas as pd
-import requests
 
+from hdutils import parse_decoded_pandas_data
+from hetdesrun.adapters.concurrency import adapter_request_slot
 from hetdesrun.adapters.exceptions import (
     AdapterConnectionError,
     AdapterHandlingException,
@@ -24,9 +29,12 @@ from hetdesrun.adapters.generic_rest.external_types import ExternalType, df_empt
 from hetdesrun.models.data_selection import FilteredSource
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import pooled_async_client
 
 logger = logging.getLogger(__name__)
 
+NDJSON_PARSE_CHUNK_BYTES = 8 * 2**20
+
 
 def create_empty_ts_df(data_type: ExternalType, attrs: Any | None = None) -> pd.DataFrame:
     """Create empty timeseries dataframe with explicit dtypes"""
@@ -54,6 +62,67 @@ def decode_attributes(data_attributes: str) -> Any:
     return df_attrs
 
 
+class NdjsonFrameBuilder:
+    """Incremental parser of newline delimited json records
+
+    Complete lines of the received chunks are decoded to DataFrames without any type
+    conversion. At the end, these are concatenated and the type conversions of
+    pd.read_json are applied once to the complete DataFrame.
+    """
+
+    def __init__(self) -> None:
+        self.frames: list[pd.DataFrame] = []
+        self.incomplete_line = b""
+
+    def parse_lines(self, lines: bytes) -> None:
+        if lines.strip() == b"":
+            return
+        self.frames.append(
+            pd.read_json(
+                io.BytesIO(lines),
+                lines=True,
+                dtype=False,
+                convert_axes=False,
+                convert_dates=False,
+            )
+        )
+
+    def feed(self, chunk: bytes) -> None:
+        complete_lines, separator, self.incomplete_line = (self.incomplete_line + chunk).rpartition(
+            b"\n"
+        )
+        self.parse_lines(complete_lines + separator)
+
+    def build(self) -> pd.DataFrame:
+        self.parse_lines(self.incomplete_line)
+        self.incomplete_line = b""
+        if len(self.frames) == 0:
+            return pd.DataFrame()
+        df = self.frames[0] if len(self.frames) == 1 else pd.concat(self.frames, ignore_index=True)
+        self.frames = []
+        return parse_decoded_pandas_data(df, "frame", {})
+
+
+async def read_ndjson_stream(
+    byte_chunks: AsyncIterator[bytes], parse_chunk_bytes: int = NDJSON_PARSE_CHUNK_BYTES
+) -> pd.DataFrame:
+    """Parse newline delimited json records into a DataFrame while receiving them
+
+    Received bytes are parsed in chunks of about parse_chunk_bytes in a separate thread,
+    so the event loop is not blocked while large responses are downloaded.
+    The result is the same as from pd.read_json(..., lines=True).
+    """
+    builder = NdjsonFrameBuilder()
+    buffer = bytearray()
+    async for chunk in byte_chunks:
+        buffer += chunk
+        if len(buffer) >= parse_chunk_bytes:
+            await asyncio.to_thread(builder.feed, bytes(buffer))
+            buffer.clear()
+    await asyncio.to_thread(builder.feed, bytes(buffer))
+    return await asyncio.to_thread(builder.build)
+
+
 def are_valid_sources(filtered_sources: list[FilteredSource]) -> tuple[bool, str]:
     if len({fs.type for fs in filtered_sources}) > 1:
         return False, "Got more than one datatype in same grouped data"
@@ -66,7 +135,7 @@ def are_valid_sources(filtered_sources: list[FilteredSource]) -> tuple[bool, str
     return True, ""
 
 
-async def load_framelike_data(  # noqa: PLR0915
+async def load_framelike_data(  # noqa: PLR0912,PLR0915
     filtered_sources: list[FilteredSource],
     additional_params: list[
         tuple[str, str]
@@ -106,25 +175,31 @@ async def load_framelike_data(  # noqa: PLR0915
         logger.info(msg)
         raise AdapterHandlingException(msg) from e
 
-    with requests.Session() as session:
-        try:
-            start_time = datetime.datetime.now(datetime.timezone.utc)
-            logger.info(
-                "Start receiving generic rest adapter %s framelike data at %s",
-                adapter_key,
-                start_time.isoformat(),
-            )
-            resp = session.get(
-                url,
-                params=[
-                    ("id", (str(filtered_source.ref_id))) for filtered_source in filtered_sources
-                ]
-                + additional_params,
-                stream=True,
-                headers=headers,
+    params: list[tuple[str, Any]] = [
+        ("id", (str(filtered_source.ref_id))) for filtered_source in filtered_sources
+    ] + additional_params
+    try:
+        start_time = datetime.datetime.now(datetime.timezone.utc)
+        logger.info(
+            "Start receiving generic rest adapter %s framelike data at %s",
+            adapter_key,
+            start_time.isoformat(),
+        )
+        async with (
+            adapter_request_slot(adapter_key),
+            pooled_async_client(
                 verify=get_config().hd_adapters_verify_certs,
                 timeout=get_config().external_request_timeout,
-            )
+            ) as client,
+            client.stream(
+                "GET",
+                url,
+                params=params,
+                headers=headers,
+            ) as resp,
+        ):
+            if resp.status_code != 200:
+                await resp.aread()
             if (
                 resp.status_code == 404
                 and "errorCode" in resp.text
@@ -152,7 +227,7 @@ async def load_framelike_data(  # noqa: PLR0915
                 raise AdapterConnectionError(msg)
             logger.info("Start reading in and parsing framelike data")
 
-            df: pd.DataFrame = pd.read_json(resp.raw, lines=True)
+            df = await read_ndjson_stream(resp.aiter_bytes())
             end_time = datetime.datetime.now(datetime.timezone.utc)
             logger.info(
                 (
@@ -182,14 +257,14 @@ async def load_framelike_data(  # noqa: PLR0915
                 str(df.shape) if len(df) > 0 else "EMPTY RESULT",
                 str(df) if len(df) > 0 else "EMPTY RESULT",
             )
-        except requests.HTTPError as e:
-            msg = (
-                f"Requesting framelike data from generic rest adapter endpoint {url}"
-                f" failed with Exception {str(e)}"
-            )
+    except httpx.HTTPError as e:
+        msg = (
+            f"Requesting framelike data from generic rest adapter endpoint {url}"
+            f" failed with Exception {str(e)}"
+        )
 
-            logger.info(msg)
-            raise AdapterConnectionError(msg) from e
+        logger.info(msg)
+        raise AdapterConnectionError(msg) from e
     logger.info("Complete generic rest adapter %s framelike request", adapter_key)
     if len(df) == 0:
         if endpoint == "timeseries":
@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 from pydantic import BaseModel, ValidationError
 
+from hetdesrun.adapters.concurrency import adapter_request_slot
 from hetdesrun.adapters.exceptions import (
     AdapterConnectionError,
     AdapterHandlingException,
@@ -18,6 +19,7 @@ from hetdesrun.models.adapter_data import RefIdType
 from hetdesrun.models.data_selection import FilteredSource
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import pooled_async_client
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +50,8 @@ async def load_single_metadatum_from_adapter(
         urllib.parse.quote(str(filtered_source.ref_key)),
     )
     try:
-        resp = await client.get(url, params=filtered_source.filters)
+        async with adapter_request_slot(adapter_key):
+            resp = await client.get(url, params=filtered_source.filters)
     except httpx.HTTPError as e:
         msg = (
             f"Requesting metadata data from generic rest adapter endpoint {url}"
@@ -126,7 +129,7 @@ async def load_multiple_metadata(
         logger.info(msg)
         raise AdapterHandlingException(msg) from e
 
-    async with httpx.AsyncClient(
+    async with pooled_async_client(
         headers=headers,
         verify=get_config().hd_adapters_verify_certs,
         timeout=get_config().external_request_timeout,
@@ -6,6 +6,7 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
+from hetdesrun.adapters.concurrency import load_concurrently
 from hetdesrun.adapters.exceptions import (
     AdapterClientWiringInvalidError,
     AdapterHandlingException,
@@ -31,10 +32,7 @@ async def load_ts_data_from_adapter(
     a "value" column with automatically inferred dtype
     and a timeseriesId column with dtype str.
 
-    This uses request with stream=True in combination with the raw response as file-like together
-    with Pandas read_json class method to get some minor performance out of the streaming.
-
-    It therefore currently isn't async.
+    The response is streamed and parsed while it is received, see load_framelike_data.
     """
 
     df = await load_framelike_data(
@@ -50,17 +48,20 @@ async def load_ts_data_from_adapter(
     return df
 
 
-def extract_one_channel_series_from_loaded_data(df: pd.DataFrame, ts_id: str) -> pd.Series:
+def split_loaded_data_by_timeseries_id(
+    df: pd.DataFrame, ts_ids: Iterable[str]
+) -> dict[str, pd.Series]:
+    """Partition loaded timeseries records into one Series per timeseries id
+
+    The ids are mapped to categorical codes and the rows are ordered by code and timestamp
+    with two stable argsorts. The rows of each id then form one contiguous block, from which
+    its Series is built without copying the block again. Rows with ids that are not in
+    ts_ids are discarded.
+    """
     try:
-        extracted_df = df[df["timeseriesId"] == ts_id].copy()
-        extracted_df.index = extracted_df["timestamp"]
-        extracted_series = extracted_df["value"].sort_index()
-        extracted_series.attrs = df.attrs.get(ts_id, {})
-        logger.debug(
-            "extracted attributes %s for series with id %s",
-            extracted_series.attrs,
-            ts_id,
-        )
+        ids = df["timeseriesId"]
+        timestamps = df["timestamp"]
+        values = df["value"]
     except KeyError as e:
         msg = (
             f"Missing keys in received timeseries records. Got columns {str(df.columns)}"
@@ -69,8 +70,33 @@ def extract_one_channel_series_from_loaded_data(df: pd.DataFrame, ts_id: str) ->
         logger.info(msg)
         raise AdapterHandlingException(msg) from e
 
-    extracted_series.name = ts_id
-
+    unique_ts_ids = list(dict.fromkeys(ts_ids))
+    codes = pd.Categorical(ids, categories=unique_ts_ids).codes
+
+    time_order = np.asarray(timestamps.array.argsort(kind="stable"))
+    order = time_order[np.argsort(codes[time_order], kind="stable")]
+    sorted_codes = codes[order]
+    block_starts = np.searchsorted(sorted_codes, np.arange(len(unique_ts_ids) + 1))
+
+    sorted_timestamps = timestamps.array.take(order)
+    sorted_values = values.array.take(order)
+
+    extracted_series = {}
+    for code, ts_id in enumerate(unique_ts_ids):
+        block = slice(block_starts[code], block_starts[code + 1])
+        series = pd.Series(
+            sorted_values[block],
+            index=pd.Index(sorted_timestamps[block], name="timestamp"),
+            name=ts_id,
+            copy=False,
+        )
+        series.attrs = df.attrs.get(ts_id, {})
+        logger.debug(
+            "extracted attributes %s for series with id %s",
+            series.attrs,
+            ts_id,
+        )
+        extracted_series[ts_id] = series
     return extracted_series
 
 
@@ -84,7 +110,7 @@ async def load_grouped_timeseries_data_together(
 
     This function expects data refs of the timeseries type,
     groups them together if they have same filter timestamp pairs and same value type,
-    loads each such group in one request
+    loads each such group in one request, with the requests of all groups running concurrently,
     and returns all results gathered.
     """
     loaded_data = {}
@@ -111,23 +137,33 @@ async def load_grouped_timeseries_data_together(
             )
         ][key] = filtered_source
 
-    # load each group together:
-    for group_tuple, grouped_source_dict in group_by_filters_and_external_type.items():
-        loaded_ts_data_from_adapter = await load_ts_data_from_adapter(
-            list(grouped_source_dict.values()),
-            group_tuple[0],
-            adapter_key=adapter_key,
+    # load each group together, all groups concurrently:
+    loaded_ts_data_of_groups = await load_concurrently(
+        (
+            load_ts_data_from_adapter(
+                list(grouped_source_dict.values()),
+                group_tuple[0],
+                adapter_key=adapter_key,
+            )
+            for group_tuple, grouped_source_dict in group_by_filters_and_external_type.items()
         )
+    )
 
-        loaded_data.update(
-            {
-                key: extract_one_channel_series_from_loaded_data(
-                    loaded_ts_data_from_adapter,
-                    filtered_source.ref_id,  # type: ignore
-                )
-                for key, filtered_source in grouped_source_dict.items()
-            }
+    for grouped_source_dict, loaded_ts_data_from_adapter in zip(
+        group_by_filters_and_external_type.values(), loaded_ts_data_of_groups, strict=True
+    ):
+        series_by_id = split_loaded_data_by_timeseries_id(
+            loaded_ts_data_from_adapter,
+            [str(filtered_source.ref_id) for filtered_source in grouped_source_dict.values()],
         )
+        assigned_ts_ids: set[str] = set()
+        for key, filtered_source in grouped_source_dict.items():
+            ts_id = str(filtered_source.ref_id)
+            # inputs wired to the same timeseries must not share one Series object
+            loaded_data[key] = (
+                series_by_id[ts_id].copy() if ts_id in assigned_ts_ids else series_by_id[ts_id]
+            )
+            assigned_ts_ids.add(ts_id)
 
         try:
             received_ids = loaded_ts_data_from_adapter["timeseriesId"].unique()
@@ -14,6 +14,7 @@ from typing import Any, Literal
 import httpx
 from httpx import AsyncClient
 
+from hetdesrun.adapters.concurrency import adapter_request_slot
 from hetdesrun.adapters.exceptions import AdapterConnectionError
 from hetdesrun.adapters.generic_rest.auth import get_generic_rest_adapter_auth_headers
 from hetdesrun.adapters.generic_rest.baseurl import get_generic_rest_adapter_base_url
@@ -67,16 +68,17 @@ async def post_framelike_records(
     )
 
     try:
-        response = await client.post(
-            url,
-            params=[
-                ("timeseriesId" if endpoint == "timeseries" else "id", ref_id),
-                *additional_params,
-            ],
-            json=list_of_records,
-            headers=headers,
-            timeout=60,
-        )
+        async with adapter_request_slot(adapter_key):
+            response = await client.post(
+                url,
+                params=[
+                    ("timeseriesId" if endpoint == "timeseries" else "id", ref_id),
+                    *additional_params,
+                ],
+                json=list_of_records,
+                headers=headers,
+                timeout=60,
+            )
     except httpx.HTTPError as e:
         msg = f"Http error while posting framelike data to {url} for id {ref_id}: {str(e)}"
         logger.info(msg)
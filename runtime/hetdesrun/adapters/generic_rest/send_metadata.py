@@ -6,6 +6,7 @@ from typing import Any
 
 import httpx
 
+from hetdesrun.adapters.concurrency import adapter_request_slot
 from hetdesrun.adapters.exceptions import AdapterConnectionError, AdapterOutputDataError
 from hetdesrun.adapters.generic_rest.auth import get_generic_rest_adapter_auth_headers
 from hetdesrun.adapters.generic_rest.baseurl import get_generic_rest_adapter_base_url
@@ -14,6 +15,7 @@ from hetdesrun.models.adapter_data import RefIdType
 from hetdesrun.models.data_selection import FilteredSink
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import pooled_async_client
 
 logger = logging.getLogger(__name__)
 
@@ -61,18 +63,19 @@ async def send_single_metadatum_to_adapter(
         ) from error
 
     try:
-        resp = await post_json_with_open_client(
-            open_client=client,
-            url=url,
-            params=filtered_sink.filters,
-            json_payload=(
-                {
-                    "key": filtered_sink.ref_key,
-                    "value": metadatum_value,
-                    "dataType": value_datatype.value,
-                }
-            ),
-        )
+        async with adapter_request_slot(adapter_key):
+            resp = await post_json_with_open_client(
+                open_client=client,
+                url=url,
+                params=filtered_sink.filters,
+                json_payload=(
+                    {
+                        "key": filtered_sink.ref_key,
+                        "value": metadatum_value,
+                        "dataType": value_datatype.value,
+                    }
+                ),
+            )
     except httpx.HTTPError as e:
         msg = (
             f"Posting metadata to generic rest adapter endpoint {url}"
@@ -106,7 +109,7 @@ async def send_multiple_metadata_to_adapter(
         logger.info(msg)
         raise AdapterConnectionError(msg) from e
 
-    async with httpx.AsyncClient(
+    async with pooled_async_client(
         headers=headers,
         verify=get_config().hd_adapters_verify_certs,
         timeout=get_config().external_request_timeout,
@@ -10,6 +10,7 @@ from hetdesrun.adapters.exceptions import AdapterOutputDataError
 from hetdesrun.adapters.generic_rest.send_framelike import post_framelike_records
 from hetdesrun.models.data_selection import FilteredSink
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import pooled_async_client
 
 
 def multitsframe_to_list_of_dicts(df: pd.DataFrame) -> list[dict]:
@@ -108,7 +109,7 @@ async def post_multitsframes(
     sink_filters: list[dict[str, str]],
     adapter_key: str,
 ) -> None:
-    async with AsyncClient(
+    async with pooled_async_client(
         verify=get_config().hd_adapters_verify_certs,
         timeout=get_config().external_request_timeout,
     ) as client:
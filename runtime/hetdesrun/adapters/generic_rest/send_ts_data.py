@@ -11,6 +11,7 @@ from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.adapters.generic_rest.send_framelike import post_framelike_records
 from hetdesrun.models.data_selection import FilteredSink
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import pooled_async_client
 
 
 def validate_series_dtype(series: pd.Series, sink_type: ExternalType) -> None:
@@ -121,7 +122,7 @@ async def post_multiple_timeseries(
     sink_types: list[ExternalType],
     adapter_key: str,
 ) -> None:
-    async with AsyncClient(
+    async with pooled_async_client(
         verify=get_config().hd_adapters_verify_certs,
         timeout=get_config().external_request_timeout,
     ) as client:
@@ -0,0 +1,188 @@
+"""Long-lived Kafka producers and consumers of the Kafka adapter
+
+Starting an aiokafka producer or consumer bootstraps the connection to the cluster, fetches
+metadata and, for consumers with a group_id, joins the consumer group. Instead of doing this
+for every message, the Kafka adapter keeps one started producer and one started consumer per
+kafka_config_key and per process. They are created lazily on first use.
+
+Before a client is handed out it is checked to not have been stopped. This check does not
+detect lost connections: clients which failed during a send or receive are discarded via
+discard_kafka_producer and discard_kafka_consumer by the callers and recreated on next use.
+
+The clients are bound to the event loop they are created in. The FastAPI lifespan closes them
+on shutdown. If a different event loop is used later, the clients of the previous event loop
+are stopped on that loop if it is still running and new clients are created for the new one.
+
+Pooled clients rely on their event loop running continuously, e.g. for the heartbeats of
+consumers in a consumer group. Runtime worker processes only run their event loop during an
+execution, hence they close all clients at the end of each execution (see
+hetdesrun.runtime.worker_pool).
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import aiokafka
+
+from hetdesrun.adapters.kafka.models import KafkaConfig
+
+logger = logging.getLogger(__name__)
+
+_producers: dict[str, aiokafka.AIOKafkaProducer] = {}
+_consumers: dict[str, aiokafka.AIOKafkaConsumer] = {}
+_consumer_locks: dict[str, asyncio.Lock] = {}
+_creation_lock: asyncio.Lock | None = None
+_clients_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _stop_clients_of_other_loop(other_loop: asyncio.AbstractEventLoop) -> None:
+    clients: list[tuple[str, aiokafka.AIOKafkaProducer | aiokafka.AIOKafkaConsumer]] = [
+        *_producers.items(),
+        *_consumers.items(),
+    ]
+    if len(clients) == 0:
+        return
+    if other_loop.is_running():
+        # a running loop other than the current one runs in another thread
+        for kafka_config_key, client in clients:
+            asyncio.run_coroutine_threadsafe(_stop_client(kafka_config_key, client), other_loop)
+    else:
+        logger.warning(
+            "Dropping %d Kafka clients without stopping them, since their event loop"
+            " is not running anymore.",
+            len(clients),
+        )
+
+
+def _bind_to_running_loop() -> asyncio.Lock:
+    global _creation_lock, _clients_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if loop is not _clients_loop or _creation_lock is None:
+        # clients of another event loop cannot be used in this one
+        if _clients_loop is not None and _clients_loop is not loop:
+            _stop_clients_of_other_loop(_clients_loop)
+        _producers.clear()
+        _consumers.clear()
+        _consumer_locks.clear()
+        _creation_lock = asyncio.Lock()
+        _clients_loop = loop
+    return _creation_lock
+
+
+def kafka_client_is_healthy(
+    client: aiokafka.AIOKafkaProducer | aiokafka.AIOKafkaConsumer,
+) -> bool:
+    """Whether the client was started and not stopped yet
+
+    aiokafka does not expose this via its public API, hence its private _closed attribute is
+    read. A client which lost its connection to the cluster is still considered healthy.
+    """
+    return getattr(client, "_closed", True) is False
+
+
+async def _stop_client(
+    kafka_config_key: str, client: aiokafka.AIOKafkaProducer | aiokafka.AIOKafkaConsumer
+) -> None:
+    try:
+        await client.stop()
+    except Exception:  # noqa: BLE001
+        logger.warning(
+            "Error stopping Kafka %s for config key %s",
+            type(client).__name__,
+            kafka_config_key,
+            exc_info=True,
+        )
+
+
+async def get_kafka_producer(
+    kafka_config_key: str, kafka_config: KafkaConfig
+) -> aiokafka.AIOKafkaProducer:
+    """Started producer for the kafka config, created on first use"""
+    creation_lock = _bind_to_running_loop()
+    async with creation_lock:
+        producer = _producers.get(kafka_config_key)
+        if producer is not None and kafka_client_is_healthy(producer):
+            return producer
+        if producer is not None:
+            logger.info("Recreating unhealthy Kafka producer for config key %s", kafka_config_key)
+            del _producers[kafka_config_key]
+            await _stop_client(kafka_config_key, producer)
+
+        logger.debug("Starting Kafka producer for config key %s", kafka_config_key)
+        producer = aiokafka.AIOKafkaProducer(**(kafka_config.producer_config))
+        await producer.start()
+        _producers[kafka_config_key] = producer
+        return producer
+
+
+async def get_kafka_consumer(
+    kafka_config_key: str, kafka_config: KafkaConfig
+) -> aiokafka.AIOKafkaConsumer:
+    """Started consumer for the topic of the kafka config, created on first use"""
+    creation_lock = _bind_to_running_loop()
+    async with creation_lock:
+        consumer = _consumers.get(kafka_config_key)
+        if consumer is not None and kafka_client_is_healthy(consumer):
+            return consumer
+        if consumer is not None:
+            logger.info("Recreating unhealthy Kafka consumer for config key %s", kafka_config_key)
+            del _consumers[kafka_config_key]
+            await _stop_client(kafka_config_key, consumer)
+
+        logger.debug("Starting Kafka consumer for config key %s", kafka_config_key)
+        consumer = aiokafka.AIOKafkaConsumer(kafka_config.topic, **(kafka_config.consumer_config))
+        await consumer.start()
+        _consumers[kafka_config_key] = consumer
+        return consumer
+
+
+@asynccontextmanager
+async def exclusive_kafka_consumer(
+    kafka_config_key: str, kafka_config: KafkaConfig
+) -> AsyncIterator[aiokafka.AIOKafkaConsumer]:
+    """Pooled consumer which is not used by other executions meanwhile
+
+    Concurrent executions receiving from the same kafka config wait for each other, so that
+    every message is handed out to exactly one of them.
+    """
+    _bind_to_running_loop()
+    consumer_lock = _consumer_locks.setdefault(kafka_config_key, asyncio.Lock())
+    async with consumer_lock:
+        yield await get_kafka_consumer(kafka_config_key, kafka_config)
+
+
+async def discard_kafka_producer(kafka_config_key: str) -> None:
+    """Stop and forget the producer, e.g. after it failed, so that it is recreated"""
+    _bind_to_running_loop()
+    producer = _producers.pop(kafka_config_key, None)
+    if producer is not None:
+        await _stop_client(kafka_config_key, producer)
+
+
+async def discard_kafka_consumer(kafka_config_key: str) -> None:
+    """Stop and forget the consumer, e.g. after it failed, so that it is recreated"""
+    _bind_to_running_loop()
+    consumer = _consumers.pop(kafka_config_key, None)
+    if consumer is not None:
+        await _stop_client(kafka_config_key, consumer)
+
+
+async def close_kafka_clients() -> None:
+    """Stop all pooled producers and consumers
+
+    Stopping consumers commits their offsets if enable_auto_commit is set and leaves their
+    consumer groups.
+    """
+    global _creation_lock, _clients_loop  # noqa: PLW0603
+    if _clients_loop is asyncio.get_running_loop():
+        for kafka_config_key, producer in _producers.items():
+            await _stop_client(kafka_config_key, producer)
+        for kafka_config_key, consumer in _consumers.items():
+            await _stop_client(kafka_config_key, consumer)
+    _producers.clear()
+    _consumers.clear()
+    _consumer_locks.clear()
+    _creation_lock = None
+    _clients_loop = None
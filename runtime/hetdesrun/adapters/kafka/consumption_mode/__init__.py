@@ -1,10 +1,14 @@
 import asyncio
 import logging
+from collections.abc import AsyncIterator, Hashable, Iterable
 from uuid import uuid4
 
 import aiokafka
+from aiokafka.errors import CommitFailedError, IllegalStateError
+from aiokafka.structs import TopicPartition
 from pydantic import ValidationError
 
+from hetdesrun.adapters.kafka.clients import close_kafka_clients
 from hetdesrun.adapters.kafka.context import bind_kafka_messages
 from hetdesrun.adapters.kafka.id_parsing import (
     KafkaAdapterIdParsingException,
@@ -127,17 +131,35 @@ def extract_consumption_mode_config_info() -> tuple[str, KafkaConfig, bool]:
     return relevant_kafka_config_key, relevant_kafka_config, multi
 
 
-async def handle_message(
-    kafka_msg: aiokafka.structs.ConsumerRecord, kafka_config_key: str, multi: bool
+def describe_kafka_message_position(kafka_msg: aiokafka.structs.ConsumerRecord) -> str:
+    return (
+        f"topic={kafka_msg.topic}:partition={kafka_msg.partition:d}:offset={kafka_msg.offset:d}:"
+        f" key={kafka_msg.key} timestamp={kafka_msg.timestamp}"
+    )
+
+
+async def handle_messages(
+    kafka_msgs: list[aiokafka.structs.ConsumerRecord],
+    kafka_config_key: str,
+    multi: bool,
+    batched: bool = False,
 ) -> None:
+    """Run the consumption mode execution for one message or for a batch of messages
+
+    If batched is True, the transformation is executed once for all messages and the kafka
+    adapter combines their values.
+    """
     try:
-        msg_obj = parse_message(kafka_msg.value, multi=multi)
+        msg_objs = [
+            parse_message(kafka_msg.value, multi=multi, headers=kafka_msg.headers)
+            for kafka_msg in kafka_msgs
+        ]
     except ValidationError as e:
         raise e
 
     # bind to context in order for kafka adapter processing to use the message
     # from context instead of fetching another one.
-    bind_kafka_messages({kafka_config_key: msg_obj})
+    bind_kafka_messages({kafka_config_key: msg_objs if batched else msg_objs[0]})
 
     consumption_mode_exec_base = get_config().hd_kafka_consumption_mode
 
@@ -155,17 +177,18 @@ async def handle_message(
         job_id=new_job_id,
     )
 
+    message_job_ids = ", ".join(str(msg_obj.job_id) for msg_obj in msg_objs)
+    message_positions = "\n".join(
+        describe_kafka_message_position(kafka_msg) for kafka_msg in kafka_msgs
+    )
     logger.info(
-        f"Trigger execution of trafo {str(exec_input.id)} via Kakfa consumption mode from message "
-        f"with message job id {str(msg_obj.job_id)} with job_id={str(new_job_id)}.\n"
-        "Kafka message: "
-        "topic={}:partition={:d}:offset={:d}: key={} timestamp={}".format(
-            kafka_msg.topic,
-            kafka_msg.partition,
-            kafka_msg.offset,
-            kafka_msg.key,
-            kafka_msg.timestamp,
-        ),
+        "Trigger execution of trafo %s via Kakfa consumption mode from %d message(s) "
+        "with message job id(s) %s with job_id=%s.\nKafka message(s): %s",
+        str(exec_input.id),
+        len(kafka_msgs),
+        message_job_ids,
+        str(new_job_id),
+        message_positions,
     )
 
     try:
@@ -178,20 +201,279 @@ async def handle_message(
     # Outputs wired to direct provisioning go nowhere in kafka consumption mode.
     # That's why we log properly here
     result_msg = (
-        f"Finished execution of trafo {str(exec_input.id)} via Kakfa consumption mode from message"
-        f" with message job id {str(msg_obj.job_id)} with job_id={str(new_job_id)}.\n"
-        "Kafka message:"
-    ) + (
-        f"topic={kafka_msg.topic}:partition={kafka_msg.partition:d}:offset={kafka_msg.offset:d}: key={kafka_msg.key} timestamp={kafka_msg.timestamp}"  # noqa: E501, ISC003
-        + "\nExecution Result:\n"
-        + exec_response.json(indent=2)
+        f"Finished execution of trafo {str(exec_input.id)} via Kakfa consumption mode from "
+        f"{len(kafka_msgs)} message(s) "
+        f"with message job id(s) {message_job_ids} with job_id={str(new_job_id)}.\n"
+        f"Kafka message(s): {message_positions}"
+        "\nExecution Result:\n" + exec_response.json(indent=2)
     )
 
     logger.info(result_msg)
 
 
-def create_aiokafka_consumer(topic: str, consumer_config: dict) -> aiokafka.AIOKafkaConsumer:
-    return aiokafka.AIOKafkaConsumer(topic, **(consumer_config))
+def create_aiokafka_consumer(
+    topic: str,
+    consumer_config: dict,
+    listener: aiokafka.ConsumerRebalanceListener | None = None,
+) -> aiokafka.AIOKafkaConsumer:
+    if listener is None:
+        return aiokafka.AIOKafkaConsumer(topic, **(consumer_config))
+    consumer = aiokafka.AIOKafkaConsumer(**(consumer_config))
+    consumer.subscribe(topics=[topic], listener=listener)
+    return consumer
+
+
+def manual_commits_required(kafka_config: KafkaConfig) -> bool:
+    """Whether offsets must be committed via PartitionOffsetTracker instead of auto commit
+
+    With more than one concurrent message, auto commit could commit messages which are still
+    being handled, which would be lost on a crash.
+    """
+    return (
+        kafka_config.consumption_mode_max_concurrent_messages > 1
+        and kafka_config.consumer_config.get("group_id", None) is not None
+    )
+
+
+def describe_kafka_message(kafka_msg: aiokafka.structs.ConsumerRecord) -> str:
+    return (
+        f"topic={kafka_msg.topic}:partition={kafka_msg.partition:d}:offset={kafka_msg.offset:d}:"
+        f" key={kafka_msg.key} timestamp={kafka_msg.timestamp} value=\n{kafka_msg.value}"
+    )
+
+
+class PartitionOffsetTracker:
+    """Offsets which may be committed while messages are handled concurrently
+
+    For every partition, the committable offset is the one of the lowest message which is
+    still being handled or, if all received messages are completed, the one after the last
+    received message. So a commit never skips a message which is not completed yet.
+    """
+
+    def __init__(self) -> None:
+        self.pending: dict[TopicPartition, set[int]] = {}
+        self.next_offsets: dict[TopicPartition, int] = {}
+        self.committed: dict[TopicPartition, int] = {}
+
+    def received(self, partition: TopicPartition, offset: int) -> None:
+        self.pending.setdefault(partition, set()).add(offset)
+        self.next_offsets[partition] = max(self.next_offsets.get(partition, 0), offset + 1)
+
+    def completed(self, partition: TopicPartition, offset: int) -> None:
+        # the partition may have been revoked meanwhile
+        self.pending.get(partition, set()).discard(offset)
+
+    def revoked(self, partitions: Iterable[TopicPartition]) -> None:
+        """Forget partitions assigned to another consumer, which must not be committed"""
+        for partition in partitions:
+            self.pending.pop(partition, None)
+            self.next_offsets.pop(partition, None)
+            self.committed.pop(partition, None)
+
+    def offsets_to_commit(self) -> dict[TopicPartition, int]:
+        offsets = {}
+        for partition, next_offset in self.next_offsets.items():
+            pending = self.pending[partition]
+            offset = min(pending) if len(pending) > 0 else next_offset
+            if offset > self.committed.get(partition, -1):
+                offsets[partition] = offset
+        return offsets
+
+    def mark_committed(self, offsets: dict[TopicPartition, int]) -> None:
+        self.committed.update(offsets)
+
+
+async def collect_batch(
+    kafka_msgs: AsyncIterator[aiokafka.structs.ConsumerRecord],
+    first_kafka_msg: aiokafka.structs.ConsumerRecord,
+    max_messages: int,
+    max_wait_ms: int,
+) -> tuple[list[aiokafka.structs.ConsumerRecord], bool]:
+    """Collect further messages until the batch is full or the wait time is over
+
+    Returns the batch and whether the messages are exhausted.
+    """
+    batch = [first_kafka_msg]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait_ms / 1000
+    while len(batch) < max_messages and (remaining := deadline - loop.time()) > 0:
+        try:
+            batch.append(await asyncio.wait_for(anext(kafka_msgs), remaining))
+        except TimeoutError:
+            break
+        except StopAsyncIteration:
+            return batch, True
+    return batch, False
+
+
+class ConcurrentMessageProcessor:
+    """Handles consumed messages concurrently
+
+    Messages are submitted in batches, which consist of a single message unless
+    consumption_mode_batch_max_messages is set. At most
+    consumption_mode_max_concurrent_messages batches of the kafka config are handled at the
+    same time. Depending on consumption_mode_ordering, messages of the same partition or with
+    the same key are handled one after another in the order of their offsets.
+
+    If consumer_commit_after is set or more than one message is handled at the same time,
+    offsets are only committed up to the lowest message which is not completed yet. A message
+    which failed is considered completed if continue_consumption_after_exception is set and
+    otherwise is never committed. Offsets of partitions revoked in a rebalance are not
+    committed, their messages which are still being handled are received again by the
+    consumer the partitions are assigned to.
+    """
+
+    def __init__(
+        self,
+        consumer: aiokafka.AIOKafkaConsumer,
+        kafka_config_key: str,
+        kafka_config: KafkaConfig,
+        multi: bool,
+    ) -> None:
+        self.consumer = consumer
+        self.kafka_config_key = kafka_config_key
+        self.kafka_config = kafka_config
+        self.multi = multi
+        self.commit_after = manual_commits_required(kafka_config) or (
+            kafka_config.consumer_commit_after
+            and kafka_config.consumer_config.get("group_id", None) is not None
+        )
+        self.slots = asyncio.Semaphore(kafka_config.consumption_mode_max_concurrent_messages)
+        self.offset_tracker = PartitionOffsetTracker()
+        self.commit_lock = asyncio.Lock()
+        self.last_tasks: dict[Hashable, asyncio.Task] = {}
+        self.running_tasks: set[asyncio.Task] = set()
+        self.batched = kafka_config.consumption_mode_batch_max_messages > 1
+        self.exception_occured = False
+        self.failure: Exception | None = None
+
+    def ordering_key(self, kafka_msg: aiokafka.structs.ConsumerRecord) -> Hashable | None:
+        if self.kafka_config.consumption_mode_ordering == "partition":
+            return (kafka_msg.topic, kafka_msg.partition)
+        if self.kafka_config.consumption_mode_ordering == "key":
+            return (kafka_msg.topic, kafka_msg.partition, kafka_msg.key)
+        return None
+
+    async def submit(self, kafka_msgs: list[aiokafka.structs.ConsumerRecord]) -> None:
+        """Start handling the batch of messages as soon as a slot is free"""
+        await self.slots.acquire()
+        for kafka_msg in kafka_msgs:
+            self.offset_tracker.received(
+                TopicPartition(kafka_msg.topic, kafka_msg.partition), kafka_msg.offset
+            )
+        ordering_keys = {
+            ordering_key
+            for kafka_msg in kafka_msgs
+            if (ordering_key := self.ordering_key(kafka_msg)) is not None
+        }
+        previous_tasks = [
+            self.last_tasks[ordering_key]
+            for ordering_key in ordering_keys
+            if ordering_key in self.last_tasks
+        ]
+        # handle in asyncio task in order to open new context for message context storing
+        task = asyncio.create_task(self.process(kafka_msgs, previous_tasks))
+        self.running_tasks.add(task)
+        task.add_done_callback(self.running_tasks.discard)
+        for ordering_key in ordering_keys:
+            self.last_tasks[ordering_key] = task
+        task.add_done_callback(self.forget_last_task)
+
+    def forget_last_task(self, done_task: asyncio.Task) -> None:
+        for ordering_key in [key for key, task in self.last_tasks.items() if task is done_task]:
+            del self.last_tasks[ordering_key]
+
+    async def wait_for_free_slot(self) -> None:
+        async with self.slots:
+            pass
+
+    async def drain(self) -> None:
+        """Wait until all submitted messages are handled"""
+        if len(self.running_tasks) > 0:
+            await asyncio.wait(list(self.running_tasks))
+
+    def completed(self, kafka_msgs: list[aiokafka.structs.ConsumerRecord]) -> None:
+        for kafka_msg in kafka_msgs:
+            self.offset_tracker.completed(
+                TopicPartition(kafka_msg.topic, kafka_msg.partition), kafka_msg.offset
+            )
+
+    async def process(
+        self,
+        kafka_msgs: list[aiokafka.structs.ConsumerRecord],
+        previous_tasks: list[asyncio.Task],
+    ) -> None:
+        try:
+            if len(previous_tasks) > 0:
+                await asyncio.wait(previous_tasks)
+            if self.failure is not None:
+                # messages after a failed one are not handled, like in sequential consumption
+                return
+            try:
+                await handle_messages(
+                    kafka_msgs, self.kafka_config_key, self.multi, batched=self.batched
+                )
+            except Exception as e:  # noqa: BLE001
+                self.exception_occured = True
+                described_msgs = "\n".join(
+                    describe_kafka_message(kafka_msg) for kafka_msg in kafka_msgs
+                )
+                msg = (
+                    "An unexpected exception occured during handling of a kafka message in "
+                    "kafka adapter consumption mode. kafka config key: "
+                    f"{self.kafka_config_key}. Multi: {str(self.multi)}."
+                    "Kafka message:\n"
+                    f"{described_msgs}\nError was:\n{str(e)}"
+                )
+                logger.error(msg)
+                if not self.kafka_config.continue_consumption_after_exception:
+                    self.failure = e
+                    return
+                self.completed(kafka_msgs)
+                return
+            self.completed(kafka_msgs)
+            if self.commit_after:
+                await self.commit()
+        except Exception as e:  # noqa: BLE001
+            # e.g. failing commits stop the consumption mode
+            self.failure = e
+        finally:
+            self.slots.release()
+
+    def partitions_revoked(self, revoked: Iterable[TopicPartition]) -> None:
+        self.offset_tracker.revoked(revoked)
+
+    async def commit(self) -> None:
+        async with self.commit_lock:
+            offsets = self.offset_tracker.offsets_to_commit()
+            if len(offsets) == 0:
+                return
+            try:
+                await self.consumer.commit(offsets)
+            except (IllegalStateError, CommitFailedError):
+                # a rebalance revoked partitions while committing, their messages are
+                # received again by the consumer the partitions are now assigned to
+                logger.warning(
+                    "Could not commit offsets %s in kafka consumption mode due to a rebalance.",
+                    offsets,
+                    exc_info=True,
+                )
+                return
+            self.offset_tracker.mark_committed(offsets)
+
+
+class RevokedPartitionsListener(aiokafka.ConsumerRebalanceListener):
+    """Drops the offsets of revoked partitions from the offset tracker of a processor"""
+
+    def __init__(self) -> None:
+        self.processor: ConcurrentMessageProcessor | None = None
+
+    async def on_partitions_revoked(self, revoked: Iterable[TopicPartition]) -> None:
+        if self.processor is not None:
+            self.processor.partitions_revoked(revoked)
+
+    async def on_partitions_assigned(self, assigned: Iterable[TopicPartition]) -> None:
+        pass
 
 
 async def start_consumption_mode() -> None:
@@ -203,12 +485,24 @@ async def start_consumption_mode() -> None:
         multi,
     ) = extract_consumption_mode_config_info()  # may raise ValueError on invalid config
 
+    group_id = relevant_kafka_config.consumer_config.get("group_id", None)
+
+    consumer_config = relevant_kafka_config.consumer_config
+    if manual_commits_required(relevant_kafka_config):
+        if consumer_config.get("enable_auto_commit", True):
+            logger.info(
+                "Kafka consumption mode handles messages concurrently. Disabling"
+                " enable_auto_commit, offsets of completed messages are committed instead."
+            )
+        consumer_config = {**consumer_config, "enable_auto_commit": False}
+
+    rebalance_listener = RevokedPartitionsListener()
     consumer = create_aiokafka_consumer(
-        relevant_kafka_config.topic, relevant_kafka_config.consumer_config
+        relevant_kafka_config.topic,
+        consumer_config,
+        listener=rebalance_listener if group_id is not None else None,
     )
 
-    group_id = relevant_kafka_config.consumer_config.get("group_id", None)
-
     consumption_mode_exec_base = get_config().hd_kafka_consumption_mode
 
     assert consumption_mode_exec_base is not None  # noqa: S101 # for mypy
@@ -222,54 +516,46 @@ async def start_consumption_mode() -> None:
         str(multi),
         consumption_mode_exec_base.json(indent=2),
     )
+    processor = ConcurrentMessageProcessor(
+        consumer, relevant_kafka_config_key, relevant_kafka_config, multi
+    )
+    rebalance_listener.processor = processor
     await consumer.start()
 
-    msg_handling_exception_occured = False
+    kafka_msgs = aiter(consumer)
+    exhausted = False
     try:
-        async for kafka_msg in consumer:
-            # need to handle in asyncio task in order to open new context for
-            # message context storing
-
+        while not exhausted:
             try:
-                if relevant_kafka_config.consumer_commit_before and group_id is not None:
-                    await consumer.commit()
-                await asyncio.create_task(
-                    handle_message(
-                        kafka_msg,
-                        relevant_kafka_config_key,
-                        multi,
-                    )
-                )
-            except Exception as e:
-                msg_handling_exception_occured = True
-                msg = (
-                    "An unexpected exception occured during handling of a kafka message in "
-                    "kafka adapter consumption mode. kafka config key: "
-                    f"{relevant_kafka_config_key}. Multi: {str(multi)}."
-                    f"Kafka message:\n"
-                    "topic={}:partition={:d}:offset={:d}: key={} timestamp={} value=\n{}{}".format(
-                        kafka_msg.topic,
-                        kafka_msg.partition,
-                        kafka_msg.offset,
-                        kafka_msg.key,
-                        kafka_msg.timestamp,
-                        kafka_msg.value,
-                        f"\nError was:\n{str(e)}",
-                    )
-                )
-                logger.error(msg)
-                if relevant_kafka_config.continue_consumption_after_exception:
-                    continue
-                raise e
-            if relevant_kafka_config.consumer_commit_after and group_id is not None:
+                first_kafka_msg = await anext(kafka_msgs)
+            except StopAsyncIteration:
+                break
+            batch, exhausted = await collect_batch(
+                kafka_msgs,
+                first_kafka_msg,
+                relevant_kafka_config.consumption_mode_batch_max_messages,
+                relevant_kafka_config.consumption_mode_batch_max_wait_ms,
+            )
+            if relevant_kafka_config.consumer_commit_before and group_id is not None:
                 await consumer.commit()
+            await processor.submit(batch)
+            # do not fetch more messages than can be handled
+            await processor.wait_for_free_slot()
+            if processor.failure is not None:
+                break
+        await processor.drain()
+        if processor.failure is not None:
+            raise processor.failure
 
     finally:
+        await processor.drain()
         # This will
         # * commit if enable_auto_commit is True
         # * Leave group if group_id is set
 
         if (
-            not msg_handling_exception_occured
+            not processor.exception_occured
         ) or relevant_kafka_config.call_consumer_stop_method_after_exception:
             await consumer.stop()
+        # producers of Kafka sinks wired in the consumption mode execution
+        await close_kafka_clients()
@@ -3,7 +3,8 @@
 In consumption mode, messages are received before adapters are called. Hence the Kafka
 adapter is required to obtain the message from memory instead of receiving a new message.
 
-This module handles intermediate storingof such message.
+This module handles intermediate storingof such message. If consumption mode batches messages,
+a list of all messages of the batch is stored instead.
 """
 
 from contextvars import ContextVar
@@ -13,14 +14,16 @@ from hetdesrun.adapters.kafka.models import (
     KafkaSingleValueMessage,
 )
 
-kafka_messages: ContextVar[dict[str, None | KafkaSingleValueMessage | KafkaMultiValueMessage]] = (
-    ContextVar("kafka_messages")
+KafkaContextMessage = (
+    KafkaSingleValueMessage
+    | KafkaMultiValueMessage
+    | list[KafkaSingleValueMessage | KafkaMultiValueMessage]
 )
 
+kafka_messages: ContextVar[dict[str, None | KafkaContextMessage]] = ContextVar("kafka_messages")
 
-def _get_kafka_messages_context() -> (
-    dict[str, None | KafkaSingleValueMessage | KafkaMultiValueMessage]
-):
+
+def _get_kafka_messages_context() -> dict[str, None | KafkaContextMessage]:
     try:
         return kafka_messages.get()
     except LookupError:
@@ -29,7 +32,7 @@ def _get_kafka_messages_context() -> (
 
 
 def bind_kafka_messages(
-    message_by_kafka_config_key: dict[str, KafkaSingleValueMessage | KafkaMultiValueMessage],
+    message_by_kafka_config_key: dict[str, KafkaContextMessage],
 ) -> None:
     _get_kafka_messages_context().update(**message_by_kafka_config_key)
 
@@ -0,0 +1,233 @@
+"""Encodings of Kafka messages
+
+By default, messages are encoded as JSON, like in the examples of the Kafka adapter
+documentation. The message_encoding of a Kafka config selects a binary encoding for messages
+sent with this config instead:
+
+* msgpack: the message is encoded as msgpack, values have the same structure as in JSON.
+* arrow: like msgpack, but Series, DataFrames and MULTITSFRAMEs are embedded as msgpack
+  extension types containing Arrow IPC streams, see hetdesrun.runtime.transport.
+* parquet: like arrow, but Pandas objects are embedded as Parquet files.
+
+Additionally, the encoded message can be compressed via message_compression with one of the
+codecs of pyarrow. Encoding and compression are written to the Kafka message headers, such
+that receivers decode every message according to its headers, regardless of the
+message_encoding of their Kafka config. Messages without these headers are decoded as JSON,
+so messages from other producers are received as before.
+"""
+
+import logging
+from collections.abc import Sequence
+from typing import Any, get_args
+
+import msgpack
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi.encoders import jsonable_encoder
+
+from hetdesrun.adapters.kafka.models import (
+    KafkaMessageCompression,
+    KafkaMessageEncoding,
+    KafkaMultiValueMessage,
+    KafkaSingleValueMessage,
+    message_compression_available,
+)
+from hetdesrun.datatypes import AdvancedTypesOutputSerializationConfig
+from hetdesrun.runtime.transport import (
+    DATAFRAME_EXT_TYPE,
+    SERIES_EXT_TYPE,
+    arrow_table_to_ipc_stream,
+    arrow_table_to_pandas,
+    pandas_to_arrow_table,
+)
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+ENCODING_HEADER = "hd-encoding"
+COMPRESSION_HEADER = "hd-compression"
+UNCOMPRESSED_SIZE_HEADER = "hd-uncompressed-size"
+
+PARQUET_SERIES_EXT_TYPE = 3
+PARQUET_DATAFRAME_EXT_TYPE = 4
+
+KafkaHeaders = list[tuple[str, bytes]]
+# headers of received messages may come from other producers and lack values
+ReceivedKafkaHeaders = Sequence[tuple[str, bytes | None]]
+
+
+def _jsonable(value: Any) -> Any:
+    return jsonable_encoder(
+        value, custom_encoder=AdvancedTypesOutputSerializationConfig.json_encoders
+    )
+
+
+def _arrow_ext_type(value: pd.Series | pd.DataFrame) -> msgpack.ExtType:
+    return msgpack.ExtType(
+        SERIES_EXT_TYPE if isinstance(value, pd.Series) else DATAFRAME_EXT_TYPE,
+        arrow_table_to_ipc_stream(pandas_to_arrow_table(value)),
+    )
+
+
+def _parquet_ext_type(value: pd.Series | pd.DataFrame) -> msgpack.ExtType:
+    sink = pa.BufferOutputStream()
+    pq.write_table(pandas_to_arrow_table(value), sink)
+    return msgpack.ExtType(
+        PARQUET_SERIES_EXT_TYPE if isinstance(value, pd.Series) else PARQUET_DATAFRAME_EXT_TYPE,
+        bytes(sink.getvalue()),
+    )
+
+
+def encode_message_value(value: Any, encoding: KafkaMessageEncoding) -> Any:
+    """msgpack serializable representation of a message value
+
+    Pandas objects which cannot be represented in Arrow, e.g. columns with mixed types,
+    are encoded like in JSON.
+    """
+    if encoding in ("arrow", "parquet") and isinstance(value, pd.Series | pd.DataFrame):
+        try:
+            return (_arrow_ext_type if encoding == "arrow" else _parquet_ext_type)(value)
+        except (pa.ArrowException, TypeError, ValueError):
+            logger.debug("Pandas object cannot be encoded via Arrow, using JSON.", exc_info=True)
+    return _jsonable(value)
+
+
+def _decode_ext_type(code: int, data: bytes) -> Any:
+    if code in (SERIES_EXT_TYPE, DATAFRAME_EXT_TYPE):
+        return arrow_table_to_pandas(pa.ipc.open_stream(data).read_all())
+    if code in (PARQUET_SERIES_EXT_TYPE, PARQUET_DATAFRAME_EXT_TYPE):
+        return arrow_table_to_pandas(pq.read_table(pa.BufferReader(data)))
+    return msgpack.ExtType(code, data)
+
+
+def _check_compression(compression: str) -> None:
+    if compression not in get_args(KafkaMessageCompression):
+        raise ValueError(f"Unknown Kafka message compression {compression}.")
+    if not message_compression_available(compression):
+        raise ValueError(f"Kafka message compression {compression} is not supported by pyarrow.")
+
+
+def encode_message(
+    msg_object: KafkaSingleValueMessage | KafkaMultiValueMessage,
+    encoding: KafkaMessageEncoding = "json",
+    compression: KafkaMessageCompression | None = None,
+) -> tuple[bytes, KafkaHeaders | None]:
+    """Encode a message and create the headers describing its encoding
+
+    JSON encoded messages without compression are sent without headers, like before
+    encodings were configurable.
+    """
+    if encoding == "json":
+        encoded_message = msg_object.json().encode("utf8")
+    elif isinstance(msg_object, KafkaSingleValueMessage):
+        message_dict = jsonable_encoder(msg_object, exclude={"value": {"value"}})
+        message_dict["value"]["value"] = encode_message_value(msg_object.value.value, encoding)
+        encoded_message = msgpack.packb(message_dict)
+    else:
+        message_dict = jsonable_encoder(msg_object, exclude={"values": {"__all__": {"value"}}})
+        for value_key, value_representation in msg_object.values.items():  # noqa: PD011
+            message_dict["values"][value_key]["value"] = encode_message_value(
+                value_representation.value, encoding
+            )
+        encoded_message = msgpack.packb(message_dict)
+
+    if encoding == "json" and compression is None:
+        return encoded_message, None
+
+    headers: KafkaHeaders = [(ENCODING_HEADER, encoding.encode("utf8"))]
+    if compression is not None:
+        _check_compression(compression)
+        headers.extend(
+            [
+                (COMPRESSION_HEADER, compression.encode("utf8")),
+                (UNCOMPRESSED_SIZE_HEADER, str(len(encoded_message)).encode("utf8")),
+            ]
+        )
+        encoded_message = pa.compress(encoded_message, codec=compression, asbytes=True)
+    return encoded_message, headers
+
+
+def _header_values(headers: ReceivedKafkaHeaders | None) -> dict[str, str]:
+    """Values of the headers describing encoding and compression
+
+    Other headers, e.g. binary headers of other producers, are ignored. Headers without
+    value are treated as missing.
+    """
+    header_values: dict[str, str] = {}
+    for key, value in headers or []:
+        if key not in (ENCODING_HEADER, COMPRESSION_HEADER, UNCOMPRESSED_SIZE_HEADER):
+            continue
+        if value is None:
+            continue
+        try:
+            header_values[key] = value.decode("utf8")
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Kafka message header {key} is not valid UTF-8.") from e
+    return header_values
+
+
+def _uncompressed_size(header_values: dict[str, str], max_uncompressed_size: int) -> int:
+    size_value = header_values[UNCOMPRESSED_SIZE_HEADER]
+    try:
+        uncompressed_size = int(size_value)
+    except ValueError:
+        uncompressed_size = -1
+    if uncompressed_size < 0:
+        raise ValueError(
+            f"Invalid {UNCOMPRESSED_SIZE_HEADER} header {size_value} of Kafka message."
+        )
+    if uncompressed_size > max_uncompressed_size:
+        raise ValueError(
+            f"Uncompressed size {uncompressed_size} of Kafka message exceeds the maximum of"
+            f" {max_uncompressed_size} bytes."
+        )
+    return uncompressed_size
+
+
+def decode_message(
+    message_bytes: bytes,
+    headers: ReceivedKafkaHeaders | None = None,
+    multi: bool = False,
+    max_uncompressed_size: int | None = None,
+) -> KafkaSingleValueMessage | KafkaMultiValueMessage:
+    """Decode a message according to the encoding and compression in its headers
+
+    Only the hd-* headers are read. Compressed messages announcing an uncompressed size
+    above max_uncompressed_size (by default hd_kafka_max_uncompressed_message_size of the
+    runtime config) are rejected before decompression.
+
+    Raises ValueError if the message cannot be decoded, in particular pydantic's
+    ValidationError if it does not match the expected message model.
+    """
+    header_values = _header_values(headers)
+    encoding = header_values.get(ENCODING_HEADER, "json")
+    compression = header_values.get(COMPRESSION_HEADER)
+
+    if compression is not None:
+        _check_compression(compression)
+        if UNCOMPRESSED_SIZE_HEADER not in header_values:
+            raise ValueError(
+                f"Kafka message compressed with {compression} lacks the"
+                f" {UNCOMPRESSED_SIZE_HEADER} header."
+            )
+        message_bytes = pa.decompress(
+            message_bytes,
+            decompressed_size=_uncompressed_size(
+                header_values,
+                get_config().hd_kafka_max_uncompressed_message_size
+                if max_uncompressed_size is None
+                else max_uncompressed_size,
+            ),
+            codec=compression,
+            asbytes=True,
+        )
+
+    message_model: type[KafkaMultiValueMessage] | type[KafkaSingleValueMessage] = (
+        KafkaMultiValueMessage if multi else KafkaSingleValueMessage
+    )
+    if encoding == "json":
+        return message_model.parse_raw(message_bytes.decode("utf8"))
+    if encoding in ("msgpack", "arrow", "parquet"):
+        return message_model.parse_obj(msgpack.unpackb(message_bytes, ext_hook=_decode_ext_type))
+    raise ValueError(f"Unknown Kafka message encoding {encoding}.")
@@ -1,7 +1,8 @@
 import datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+import pyarrow as pa
+from pydantic import BaseModel, Field, validator
 
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.datatypes import AdvancedTypesOutputSerializationConfig, DataType
@@ -60,6 +61,15 @@ class StructureResponse(BaseModel):
     sinks: list[KafkaAdapterStructureSink]
 
 
+KafkaMessageEncoding = Literal["json", "msgpack", "arrow", "parquet"]
+KafkaMessageCompression = Literal["zstd", "lz4", "gzip"]
+
+
+def message_compression_available(compression: str) -> bool:
+    # the codecs available depend on how pyarrow was built
+    return pa.Codec.is_available(compression)  # type: ignore[no-any-return]
+
+
 class KafkaConfig(BaseModel):
     display_name: str = Field(
         ...,
@@ -105,8 +115,57 @@ class KafkaConfig(BaseModel):
             " handling. Note that this will commit messages thath triggered exceptions."
         ),
     )
+    consumption_mode_max_concurrent_messages: int = Field(
+        1,
+        ge=1,
+        description="In consumption mode, how many messages are handled at the same time."
+        " With more than one and a group_id in consumer_config, enable_auto_commit is"
+        " disabled and offsets are committed after messages are handled, only up to the"
+        " lowest message which is still being handled, as with consumer_commit_after.",
+    )
+    consumption_mode_ordering: Literal["partition", "key", "none"] = Field(
+        "partition",
+        description="In consumption mode with more than one concurrent message, messages of"
+        " the same partition ('partition') or with the same key in the same partition ('key')"
+        " are still handled one after another in the order of their offsets. With 'none',"
+        " any messages may be handled concurrently.",
+    )
+    consumption_mode_batch_max_messages: int = Field(
+        1,
+        ge=1,
+        description="In consumption mode, collect up to this many messages and run the"
+        " transformation once for all of them. Frame-like and Series values of the messages"
+        " are concatenated, other values are passed as list. 1 disables batching.",
+    )
+    consumption_mode_batch_max_wait_ms: int = Field(
+        100,
+        ge=0,
+        description="In consumption mode with batching, how long to wait for further messages"
+        " after the first message of a batch was received.",
+    )
+    message_encoding: KafkaMessageEncoding = Field(
+        "json",
+        description="Encoding of the messages sent with this config. 'msgpack' encodes the"
+        " JSON structure as msgpack, 'arrow' and 'parquet' additionally embed Series,"
+        " DataFrames and MULTITSFRAMEs as Arrow IPC streams or Parquet files. Received"
+        " messages are decoded according to their headers, independent of this option.",
+    )
+    message_compression: KafkaMessageCompression | None = Field(
+        None,
+        description="Compression of the encoded messages sent with this config. Unlike the"
+        " compression_type of the producer_config, this does not require additional"
+        " Python packages and is applied to every message on its own.",
+    )
     offer_sources_and_sinks: bool = True
 
+    @validator("message_compression")
+    def message_compression_is_available(
+        cls, v: KafkaMessageCompression | None
+    ) -> KafkaMessageCompression | None:
+        if v is not None and not message_compression_available(v):
+            raise ValueError(f"Kafka message compression {v} is not supported by pyarrow.")
+        return v
+
     def type_allowed(self, external_type: ExternalType) -> bool:
         allowed_types = [e.value for e in ExternalType] if self.types is None else self.types
         return external_type in allowed_types
@@ -2,37 +2,159 @@ import logging
 from typing import Any, cast
 
 import aiokafka
+import pandas as pd
 from pydantic import ValidationError
 
 from hetdesrun.adapters.exceptions import AdapterHandlingException
+from hetdesrun.adapters.generic_rest.external_types import ExternalType, GeneralType
+from hetdesrun.adapters.kafka.clients import discard_kafka_consumer, exclusive_kafka_consumer
 from hetdesrun.adapters.kafka.context import (
     _get_kafka_messages_context,
 )
+from hetdesrun.adapters.kafka.encoding import ReceivedKafkaHeaders, decode_message
 from hetdesrun.adapters.kafka.models import (
     KafkaMultiValueMessage,
     KafkaReceiveValue,
     KafkaSingleValueMessage,
 )
+from hetdesrun.datatypes import DataType, parse_single_value_dynamically
 
 logger = logging.getLogger(__name__)
 
 
-async def receive_encoded_message(consumer: aiokafka.AIOKafkaConsumer) -> Any:
-    await consumer.start()
-    try:
-        message = await consumer.getone()
-    finally:
-        await consumer.stop()
-
+async def receive_encoded_message(consumer: aiokafka.AIOKafkaConsumer, commit: bool = False) -> Any:
+    message = await consumer.getone()
+    if commit:
+        # long-lived consumers are not stopped after each message, which would commit
+        await consumer.commit()
     return message
 
 
 def parse_message(
-    message_bytes: bytes, multi: bool = False
+    message_bytes: bytes, multi: bool = False, headers: ReceivedKafkaHeaders | None = None
 ) -> KafkaMultiValueMessage | KafkaSingleValueMessage:
-    if multi:
-        return KafkaMultiValueMessage.parse_raw(message_bytes.decode("utf8"))
-    return KafkaSingleValueMessage.parse_raw(message_bytes.decode("utf8"))
+    return decode_message(message_bytes, headers=headers, multi=multi)
+
+
+def check_context_message(
+    msg_object: KafkaSingleValueMessage | KafkaMultiValueMessage,
+    multi: bool,
+    kafka_config_key: str,
+    message_identifier: str,
+) -> KafkaSingleValueMessage | KafkaMultiValueMessage:
+    if multi and isinstance(msg_object, KafkaSingleValueMessage):
+        msg = (
+            f"Found kafka message stored in context for kafka_config_key {kafka_config_key}, "
+            f"and message identifier {message_identifier} "
+            " but it is a single value message and a multi value message is expected!"
+        )
+        logger.error(msg)
+        raise AdapterHandlingException(msg)
+    if (not multi) and isinstance(msg_object, KafkaMultiValueMessage):
+        msg = (
+            f"Found kafka message stored in context for kafka_config_key {kafka_config_key}, "
+            f"and message identifier {message_identifier} "
+            " but it is a multi value message and a single value message is expected!"
+        )
+        logger.error(msg)
+        raise AdapterHandlingException(msg)
+    return msg_object
+
+
+def extract_message_values(
+    msg_object: KafkaSingleValueMessage | KafkaMultiValueMessage,
+    receive_message_dict: dict[str | None, KafkaReceiveValue],
+    multi: bool,
+) -> dict[str | None, Any]:
+    if not multi:
+        return {None: cast(KafkaSingleValueMessage, msg_object).value.value}
+
+    # multi value message from now onwards
+    first_val = next(iter(receive_message_dict.values()))
+    msg_object = cast(KafkaMultiValueMessage, msg_object)
+    multi_val_keys = set(msg_object.values.keys())  # noqa: PD011
+    expected_keys = set(receive_message_dict.keys())
+    if not multi_val_keys.issuperset(expected_keys):
+        msg = (
+            f"Missing expected multi value key s in received message "
+            f"{first_val.message_identifier} "
+            f"from Kafka with config key {first_val.kafka_config_key}"
+            f"from topic {first_val.kafka_config.topic}:\n"
+            f"Got {str(multi_val_keys)}. "
+            f"Expected {str(expected_keys)}. "
+        )
+        logger.error(msg)
+        raise AdapterHandlingException(msg)
+
+    return {
+        key: (
+            msg_object.values[  # noqa: PD011
+                cast(str, key)  # key cannot be None since None should only occur once,
+                # i.e. in the SingleValue case
+            ]
+        ).value
+        for key in receive_message_dict
+    }
+
+
+BATCHED_DATA_TYPES = {
+    GeneralType.MULTITSFRAME: DataType.MultiTSFrame,
+    GeneralType.DATAFRAME: DataType.DataFrame,
+    GeneralType.TIMESERIES: DataType.Series,
+    GeneralType.SERIES: DataType.Series,
+}
+
+
+def combine_batched_values(values: list[Any], external_type: ExternalType) -> Any:
+    """Combine the values of all messages of a batch into one value
+
+    MULTITSFRAMEs and DataFrames are concatenated row-wise and Series are concatenated in the
+    order of the messages. Values of other types are returned as list.
+    """
+    data_type = BATCHED_DATA_TYPES.get(external_type.general_type)
+    if data_type is None:
+        return values
+    parsed_values = [
+        parse_single_value_dynamically("value", value, data_type, nullable=False)
+        for value in values
+    ]
+    if len(parsed_values) == 0:
+        return None
+    return pd.concat(parsed_values, ignore_index=data_type is DataType.MultiTSFrame)
+
+
+def receive_batched_values(
+    msg_objects: list[KafkaSingleValueMessage | KafkaMultiValueMessage],
+    receive_message_dict: dict[str | None, KafkaReceiveValue],
+    multi: bool,
+) -> dict[str | None, Any]:
+    first_val = next(iter(receive_message_dict.values()))
+    values_by_message = [
+        extract_message_values(
+            check_context_message(
+                msg_object, multi, first_val.kafka_config_key, first_val.message_identifier
+            ),
+            receive_message_dict,
+            multi,
+        )
+        for msg_object in msg_objects
+    ]
+    try:
+        return {
+            key: combine_batched_values(
+                [message_values[key] for message_values in values_by_message],
+                receive_value.external_type,
+            )
+            for key, receive_value in receive_message_dict.items()
+        }
+    except (ValidationError, ValueError, TypeError) as e:
+        msg = (
+            f"Error combining the values of a batch of {len(msg_objects)} messages "
+            f"{first_val.message_identifier} from Kafka with config key "
+            f"{first_val.kafka_config_key}:\n{str(e)}"
+        )
+        logger.error(msg)
+        raise AdapterHandlingException(msg) from e
 
 
 async def receive_kafka_message(
@@ -48,28 +170,21 @@ async def receive_kafka_message(
         len(receive_message_dict) == 1 and next(iter(receive_message_dict.keys())) is None
     )
 
-    if (msg_object := _get_kafka_messages_context().get(kafka_config_key, None)) is not None:
-        if multi and isinstance(msg_object, KafkaSingleValueMessage):
-            msg = (
-                f"Found kafka message stored in context for kafka_config_key {kafka_config_key}, "
-                f"and message identifier {message_identifier} "
-                " but it is a single value message and a multi value message is expected!"
-            )
-            logger.error(msg)
-            raise AdapterHandlingException(msg)
-        if (not multi) and isinstance(msg_object, KafkaMultiValueMessage):
-            msg = (
-                f"Found kafka message stored in context for kafka_config_key {kafka_config_key}, "
-                f"and message identifier {message_identifier} "
-                " but it is a multi value message and a single value message is expected!"
-            )
-            logger.error(msg)
-            raise AdapterHandlingException(msg)
+    context_message = _get_kafka_messages_context().get(kafka_config_key, None)
+    if isinstance(context_message, list):
+        logger.debug(
+            "Found batch of %d kafka messages stored in context for kafka_config_key %s"
+            " and message identifier %s. Combining their values.",
+            len(context_message),
+            kafka_config_key,
+            message_identifier,
+        )
+        return receive_batched_values(context_message, receive_message_dict, multi)
 
-        if multi:
-            msg_object = cast(KafkaMultiValueMessage, msg_object)
-        else:
-            msg_object = cast(KafkaSingleValueMessage, msg_object)
+    if context_message is not None:
+        msg_object = check_context_message(
+            context_message, multi, kafka_config_key, message_identifier
+        )
 
         logger.debug(
             "Found kafka message stored in context for kafka_config_key %s"
@@ -86,11 +201,15 @@ async def receive_kafka_message(
             topic,
         )
 
-        consumer = aiokafka.AIOKafkaConsumer(topic, **(kafka_config.consumer_config))
-
+        group_id = kafka_config.consumer_config.get("group_id", None)
+        auto_commit = kafka_config.consumer_config.get("enable_auto_commit", True)
+        commit = group_id is not None and auto_commit
         try:
-            message = await receive_encoded_message(consumer)
+            async with exclusive_kafka_consumer(kafka_config_key, kafka_config) as consumer:
+                message = await receive_encoded_message(consumer, commit=commit)
         except Exception as e:  # noqa: BLE001
+            # the consumer may be unusable, e.g. after losing the connection to the cluster
+            await discard_kafka_consumer(kafka_config_key)
             msg = (
                 f"Error consuming message {message_identifier} from Kafka with "
                 f"config key {kafka_config_key}"
@@ -107,8 +226,10 @@ async def receive_kafka_message(
         )
 
         try:
-            msg_object = parse_message(message.value, multi=multi)
-        except ValidationError as e:
+            msg_object = parse_message(
+                message.value, multi=multi, headers=getattr(message, "headers", None)
+            )
+        except ValueError as e:
             msg = (
                 f'Error parsing/validating {"multi" if multi else "single"} value message '
                 f"{message_identifier} "
@@ -118,30 +239,4 @@ async def receive_kafka_message(
             logger.error(msg)
             raise AdapterHandlingException(msg) from e
 
-    if not multi:
-        return {None: cast(KafkaSingleValueMessage, msg_object).value.value}
-
-    # multi value message from now onwards
-    msg_object = cast(KafkaMultiValueMessage, msg_object)
-    multi_val_keys = set(msg_object.values.keys())  # noqa: PD011
-    expected_keys = set(receive_message_dict.keys())
-    if not multi_val_keys.issuperset(expected_keys):
-        msg = (
-            f"Missing expected multi value key s in received message {message_identifier} "
-            f"from Kafka with config key {kafka_config_key}"
-            f"from topic {topic}:\n"
-            f"Got {str(multi_val_keys)}. "
-            f"Expected {str(expected_keys)}. "
-        )
-        logger.error(msg)
-        raise AdapterHandlingException(msg)
-
-    return {
-        key: (
-            msg_object.values[  # noqa: PD011
-                cast(str, key)  # key cannot be None since None should only occur once,
-                # i.e. in the SingleValue case
-            ]
-        ).value
-        for key in receive_message_dict
-    }
+    return extract_message_values(msg_object, receive_message_dict, multi)
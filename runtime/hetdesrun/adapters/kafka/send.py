@@ -3,8 +3,11 @@ import logging
 import aiokafka
 
 from hetdesrun.adapters.exceptions import AdapterHandlingException
+from hetdesrun.adapters.kafka.clients import discard_kafka_producer, get_kafka_producer
+from hetdesrun.adapters.kafka.encoding import KafkaHeaders, encode_message
 from hetdesrun.adapters.kafka.message import create_message
 from hetdesrun.adapters.kafka.models import (
+    KafkaConfig,
     KafkaMessageValue,
     KafkaMultiValueMessage,
     KafkaSingleValueMessage,
@@ -15,8 +18,13 @@ logger = logging.getLogger(__name__)
 
 def serialize_message(
     msg_object: KafkaSingleValueMessage | KafkaMultiValueMessage,
-) -> bytes:
-    return msg_object.json().encode("utf8")
+    kafka_config: KafkaConfig,
+) -> tuple[bytes, KafkaHeaders | None]:
+    return encode_message(
+        msg_object,
+        encoding=kafka_config.message_encoding,
+        compression=kafka_config.message_compression,
+    )
 
 
 async def send_encoded_message(
@@ -24,12 +32,9 @@ async def send_encoded_message(
     topic: str,
     encoded_message: bytes,
     key: str | None,
+    headers: KafkaHeaders | None = None,
 ) -> None:
-    await producer.start()
-    try:
-        await producer.send_and_wait(topic, key=key, value=encoded_message)
-    finally:
-        await producer.stop()
+    await producer.send_and_wait(topic, key=key, value=encoded_message, headers=headers)
 
 
 async def send_kafka_message(message_dict: dict[str | None, KafkaMessageValue]) -> None:
@@ -42,7 +47,7 @@ async def send_kafka_message(message_dict: dict[str | None, KafkaMessageValue])
     # prepare message
     message = create_message(message_dict)
     try:
-        encoded_message = serialize_message(message)
+        encoded_message, headers = serialize_message(message, kafka_config)
     except Exception as e:  # noqa: BLE001
         msg = (
             f"Error serializing and encoding message {message_identifier}"
@@ -61,13 +66,18 @@ async def send_kafka_message(message_dict: dict[str | None, KafkaMessageValue])
         topic,
     )
 
-    producer = aiokafka.AIOKafkaProducer(**(kafka_config.producer_config))
-
     try:
+        producer = await get_kafka_producer(kafka_config_key, kafka_config)
         await send_encoded_message(
-            producer=producer, topic=topic, encoded_message=encoded_message, key=None
+            producer=producer,
+            topic=topic,
+            encoded_message=encoded_message,
+            key=None,
+            headers=headers,
         )
     except Exception as e:  # noqa: BLE001
+        # the producer may be unusable, e.g. after losing the connection to the cluster
+        await discard_kafka_producer(kafka_config_key)
         msg = (
             f"Error producing message {message_identifier} to Kafka with "
             f"config key {kafka_config_key}"
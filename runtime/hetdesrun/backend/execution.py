@@ -1,8 +1,10 @@
 """Handle execution of transformation revisions."""
 
+import asyncio
 import json
 import logging
 import os
+from collections.abc import AsyncIterator
 from copy import deepcopy
 from posixpath import join as posix_urljoin
 from uuid import UUID, uuid4
@@ -14,15 +16,17 @@ from hetdesrun.adapters.exceptions import AdapterHandlingException
 from hetdesrun.adapters.virtual_structure_adapter.resolve_wirings import (
     resolve_virtual_structure_wirings,
 )
-from hetdesrun.backend.models.info import ExecutionResponseFrontendDto
+from hetdesrun.backend.models.info import ExecutionBatchItemResponse, ExecutionResponseFrontendDto
 from hetdesrun.models.component import ComponentNode
-from hetdesrun.models.execution import ExecByIdInput
+from hetdesrun.models.execution import ExecByIdBatchInput, ExecByIdInput
+from hetdesrun.models.repr_reference import ReproducibilityReference
 from hetdesrun.models.run import (
     ConfigurationInput,
     PerformanceMeasuredStep,
     WorkflowExecutionInput,
     WorkflowExecutionResult,
 )
+from hetdesrun.models.wiring import WorkflowWiring
 from hetdesrun.models.workflow import WorkflowNode
 from hetdesrun.persistence.dbservice.exceptions import DBIntegrityError, DBNotFoundError
 from hetdesrun.persistence.dbservice.revision import (
@@ -37,11 +41,18 @@ from hetdesrun.reference_context import (
     set_reproducibility_reference_context,
 )
 from hetdesrun.runtime.logging import execution_context_filter
-from hetdesrun.runtime.service import runtime_service
+from hetdesrun.runtime.transport import (
+    BINARY_RESULT_MEDIA_TYPE,
+    decode_execution_result,
+    encode_execution_result_json,
+    encode_output_results_json_or_error,
+)
+from hetdesrun.runtime.worker_pool import dispatch_runtime_service
 from hetdesrun.utils import Type
 from hetdesrun.webservice.auth_dependency import get_auth_headers
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import pooled_async_client
 
 logger = logging.getLogger(__name__)
 logger.addFilter(execution_context_filter)
@@ -123,32 +134,35 @@ def nested_nodes(
     return children_nodes(tr_workflow.content, ancestor_children)
 
 
-def prepare_execution_input(exec_by_id_input: ExecByIdInput) -> WorkflowExecutionInput:
-    """Loads trafo revision and prepares execution input from it.
+def load_transformation_revision_for_execution(trafo_id: UUID) -> TransformationRevision:
+    """Loads the trafo revision to execute, from cache if configured
 
-    Loads the trafo revision specified by id and prepares
-    an workflow execution input object which can be executed by the runtime
-    -- either code or by calling runtime rest endpoint for running
-    workflows.
-
-    Note that trafo revisions of type components will be wrapped in
-    an ad-hoc workflow structure for execution.
+    Raises TrafoExecutionNotFoundError if the trafo revision does not exist.
     """
+    transformation_revision: TransformationRevision
     try:
         if get_config().enable_caching_for_non_draft_trafos_for_execution:
-            transformation_revision = read_single_transformation_revision_with_caching(
-                exec_by_id_input.id
-            )
+            transformation_revision = read_single_transformation_revision_with_caching(trafo_id)
             logger.info(
                 "found possibly cached transformation revision with id %s",
-                str(exec_by_id_input.id),
+                str(trafo_id),
             )
         else:
-            transformation_revision = read_single_transformation_revision(exec_by_id_input.id)
-            logger.info("found transformation revision with id %s", str(exec_by_id_input.id))
+            transformation_revision = read_single_transformation_revision(trafo_id)
+            logger.info("found transformation revision with id %s", str(trafo_id))
     except DBNotFoundError as e:
         raise TrafoExecutionNotFoundError() from e
+    return transformation_revision
+
 
+def obtain_workflow_node_and_components(
+    transformation_revision: TransformationRevision,
+) -> tuple[TransformationRevision, WorkflowNode, dict[UUID, TransformationRevision]]:
+    """Workflow structure of a trafo revision as needed for its execution input
+
+    Returns the trafo revision of the workflow, which wraps the trafo revision if it is a
+    component, its workflow node and all components nested in it by id.
+    """
     if transformation_revision.type == Type.COMPONENT:
         tr_workflow = transformation_revision.wrap_component_in_tr_workflow()
         assert isinstance(  # noqa: S101
@@ -166,7 +180,22 @@ def prepare_execution_input(exec_by_id_input: ExecByIdInput) -> WorkflowExecutio
         operator_id=uuid4(),
         sub_nodes=nested_nodes(tr_workflow, nested_transformations),
     )
+    return tr_workflow, workflow_node, nested_components
 
+
+def build_execution_input(
+    exec_by_id_input: ExecByIdInput,
+    transformation_revision: TransformationRevision,
+    workflow_node_and_components: tuple[
+        TransformationRevision, WorkflowNode, dict[UUID, TransformationRevision]
+    ],
+) -> WorkflowExecutionInput:
+    """Execution input from the result of obtain_workflow_node_and_components
+
+    Raises TrafoExecutionInputValidationError if the execution input is invalid, e.g. since
+    the wiring is incomplete.
+    """
+    tr_workflow, workflow_node, nested_components = workflow_node_and_components
     try:
         execution_input = WorkflowExecutionInput(
             code_modules=[
@@ -179,6 +208,7 @@ def prepare_execution_input(exec_by_id_input: ExecByIdInput) -> WorkflowExecutio
             configuration=ConfigurationInput(
                 name=str(tr_workflow.id),
                 run_pure_plot_operators=exec_by_id_input.run_pure_plot_operators,
+                profile_operators=exec_by_id_input.profile_operators,
             ),
             workflow_wiring=(
                 exec_by_id_input.wiring
@@ -194,6 +224,25 @@ def prepare_execution_input(exec_by_id_input: ExecByIdInput) -> WorkflowExecutio
     return execution_input
 
 
+def prepare_execution_input(exec_by_id_input: ExecByIdInput) -> WorkflowExecutionInput:
+    """Loads trafo revision and prepares execution input from it.
+
+    Loads the trafo revision specified by id and prepares
+    an workflow execution input object which can be executed by the runtime
+    -- either code or by calling runtime rest endpoint for running
+    workflows.
+
+    Note that trafo revisions of type components will be wrapped in
+    an ad-hoc workflow structure for execution.
+    """
+    transformation_revision = load_transformation_revision_for_execution(exec_by_id_input.id)
+    return build_execution_input(
+        exec_by_id_input,
+        transformation_revision,
+        obtain_workflow_node_and_components(transformation_revision),
+    )
+
+
 async def run_execution_input(
     execution_input: WorkflowExecutionInput,
 ) -> ExecutionResponseFrontendDto:
@@ -212,9 +261,14 @@ async def run_execution_input(
     output_types = {output.name: output.type for output in execution_input.workflow.outputs}
 
     execution_result: WorkflowExecutionResult
+    output_results_json: list[bytes] | None = None
 
     if get_config().is_runtime_service:
-        execution_result = await runtime_service(execution_input)
+        # the result is sent to the client as JSON, hence serialisation errors are reported
+        # here. The encoded outputs are reused for the response, see execution_response_json.
+        execution_result, output_results_json = encode_output_results_json_or_error(
+            await dispatch_runtime_service(execution_input)
+        )
     else:
         try:
             headers = await get_auth_headers(external=False)
@@ -226,11 +280,16 @@ async def run_execution_input(
             logger.info(msg)
             raise TrafoExecutionRuntimeConnectionError(msg) from e
 
-        async with httpx.AsyncClient(
+        async with pooled_async_client(
             verify=get_config().hd_runtime_verify_certs,
             timeout=get_config().external_request_timeout,
         ) as client:
             url = posix_urljoin(get_config().hd_runtime_engine_url, "runtime")
+            if get_config().hd_runtime_binary_result_transport:
+                headers = {
+                    **headers,
+                    "Accept": f"{BINARY_RESULT_MEDIA_TYPE}, application/json;q=0.9",
+                }
             try:
                 response = await client.post(
                     url,
@@ -247,7 +306,11 @@ async def run_execution_input(
                 logger.info(msg)
                 raise TrafoExecutionRuntimeConnectionError(msg) from e
             try:
-                json_obj = response.json()
+                json_obj = (
+                    decode_execution_result(response.content)
+                    if response.headers.get("content-type", "").startswith(BINARY_RESULT_MEDIA_TYPE)
+                    else response.json()
+                )
                 execution_result = WorkflowExecutionResult(**json_obj)
             except ValidationError as e:
                 msg = (
@@ -261,6 +324,7 @@ async def run_execution_input(
         **execution_result.dict(),
         output_types_by_output_name=output_types,
     )
+    execution_response._output_results_json = output_results_json
 
     run_execution_input_measured_step.stop()
 
@@ -268,6 +332,31 @@ async def run_execution_input(
     return execution_response
 
 
+def execution_response_json(execution_response: ExecutionResponseFrontendDto) -> list[bytes]:
+    """Encode an execution response as JSON chunks for the response body
+
+    Outputs which were already encoded in run_execution_input are not encoded again.
+    """
+    return encode_execution_result_json(execution_response, execution_response._output_results_json)
+
+
+def batch_item_response_json(item_response: ExecutionBatchItemResponse) -> list[bytes]:
+    """Encode the response for one wiring of a batch as line of newline delimited JSON
+
+    The execution response is encoded via execution_response_json, such that outputs like
+    Series and DataFrames are serialized and outputs already encoded are not encoded again.
+    """
+    if item_response.execution_response is None:
+        return [item_response.json().encode("utf8") + b"\n"]
+    envelope = item_response.json(exclude={"execution_response"}, separators=(",", ":"))
+    return [
+        envelope[:-1].encode("utf8"),
+        b',"execution_response":',
+        *execution_response_json(item_response.execution_response),
+        b"}\n",
+    ]
+
+
 async def execute_transformation_revision(
     exec_by_id_input: ExecByIdInput,
 ) -> ExecutionResponseFrontendDto:
@@ -350,3 +439,120 @@ async def perf_measured_execute_trafo_rev(
         )
 
     return exec_response
+
+
+def prepare_batch_execution_input(batch_input: ExecByIdBatchInput) -> WorkflowExecutionInput:
+    """Loads trafo revision and prepares one execution input for all wirings of a batch
+
+    The trafo revision and its nested trafo revisions are loaded only once. The execution
+    input is prepared with the first wiring of the batch which is valid. It is
+    reused for all wirings via bind_wiring_to_execution_input.
+
+    Raises TrafoExecutionNotFoundError if the trafo revision does not exist and
+    TrafoExecutionInputValidationError if none of the wirings is valid.
+    """
+    transformation_revision = load_transformation_revision_for_execution(batch_input.id)
+    workflow_node_and_components = obtain_workflow_node_and_components(transformation_revision)
+    validation_error: TrafoExecutionInputValidationError | None = None
+    for wiring in batch_input.wirings:
+        try:
+            return build_execution_input(
+                ExecByIdInput(
+                    id=batch_input.id,
+                    wiring=wiring.copy(deep=True),
+                    run_pure_plot_operators=batch_input.run_pure_plot_operators,
+                    profile_operators=batch_input.profile_operators,
+                ),
+                transformation_revision,
+                workflow_node_and_components,
+            )
+        except TrafoExecutionInputValidationError as e:
+            validation_error = e
+    assert validation_error is not None  # noqa: S101 # hint for mypy, wirings is not empty
+    raise validation_error
+
+
+def bind_wiring_to_execution_input(
+    execution_input: WorkflowExecutionInput, wiring: WorkflowWiring
+) -> WorkflowExecutionInput:
+    """Execution input with another wiring and a new job id
+
+    Only the wiring is validated, the workflow, components and code modules are reused
+    without validating them again.
+    """
+    try:
+        WorkflowExecutionInput.check_wiring_complete(
+            {"workflow_wiring": wiring, "workflow": execution_input.workflow}
+        )
+    except ValueError as e:
+        raise TrafoExecutionInputValidationError(e) from e
+    return execution_input.copy(update={"workflow_wiring": wiring, "job_id": uuid4()})
+
+
+async def execute_wiring_of_batch(
+    index: int, wiring: WorkflowWiring, execution_input: WorkflowExecutionInput
+) -> ExecutionBatchItemResponse:
+    # every wiring gets its own reproducibility reference, tasks run in copies of the context
+    set_reproducibility_reference_context(ReproducibilityReference())
+    wiring = wiring.copy(deep=True)
+    try:
+        resolve_virtual_structure_wirings(wiring)
+        wiring_execution_input = bind_wiring_to_execution_input(execution_input, wiring)
+    except (AdapterHandlingException, TrafoExecutionInputValidationError) as exc:
+        logger.info("Could not prepare execution of wiring %d of batch", index, exc_info=True)
+        return ExecutionBatchItemResponse(index=index, job_id=uuid4(), error=str(exc))
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Unexpected error preparing execution of wiring %d of batch", index)
+        return ExecutionBatchItemResponse(
+            index=index, job_id=uuid4(), error=f"Unexpected error: {str(exc)}"
+        )
+
+    execution_context_filter.bind_context(job_id=wiring_execution_input.job_id)
+    try:
+        execution_response = await run_execution_input(wiring_execution_input)
+    except TrafoExecutionError as exc:
+        logger.info("Execution of wiring %d of batch failed", index, exc_info=True)
+        return ExecutionBatchItemResponse(
+            index=index, job_id=wiring_execution_input.job_id, error=str(exc)
+        )
+    except Exception as exc:  # noqa: BLE001
+        # other items of the batch are still executed and streamed to the client
+        logger.exception("Unexpected error during execution of wiring %d of batch", index)
+        return ExecutionBatchItemResponse(
+            index=index,
+            job_id=wiring_execution_input.job_id,
+            error=f"Unexpected error: {str(exc)}",
+        )
+    return ExecutionBatchItemResponse(
+        index=index,
+        job_id=wiring_execution_input.job_id,
+        execution_response=execution_response,
+    )
+
+
+async def execute_transformation_revision_batch(
+    batch_input: ExecByIdBatchInput, execution_input: WorkflowExecutionInput
+) -> AsyncIterator[ExecutionBatchItemResponse]:
+    """Execute the prepared execution input for all wirings of the batch
+
+    At most max_concurrent_executions wirings are executed at the same time. The responses are
+    yielded in the order in which the executions finish, their index refers to the position of
+    the wiring in the batch input. If the iteration is stopped early, e.g. because the client
+    disconnected, the remaining executions are cancelled.
+    """
+    semaphore = asyncio.Semaphore(batch_input.max_concurrent_executions)
+
+    async def bounded_execution(index: int, wiring: WorkflowWiring) -> ExecutionBatchItemResponse:
+        async with semaphore:
+            return await execute_wiring_of_batch(index, wiring, execution_input)
+
+    tasks = [
+        asyncio.create_task(bounded_execution(index, wiring))
+        for index, wiring in enumerate(batch_input.wirings)
+    ]
+    try:
+        for next_finished in asyncio.as_completed(tasks):
+            yield await next_finished
+    finally:
+        for task in tasks:
+            task.cancel()
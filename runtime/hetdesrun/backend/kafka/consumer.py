@@ -15,7 +15,7 @@ from hetdesrun.backend.models.info import ExecutionResponseFrontendDto
 from hetdesrun.models.execution import ExecByIdInput, ExecLatestByGroupIdInput
 from hetdesrun.persistence.dbservice.revision import (
     DBNotFoundError,
-    get_latest_revision_id,
+    get_latest_revision_id_with_caching,
 )
 from hetdesrun.webservice.config import get_config
 
@@ -62,7 +62,10 @@ class KafkaWorkerContext:
         )
 
     def _init_producer(self) -> None:
-        self._producer = aiokafka.AIOKafkaProducer(**(self.producer_options))
+        # results of concurrently handled messages are sent to the response topic together
+        self._producer = aiokafka.AIOKafkaProducer(
+            **{"linger_ms": get_config().hd_kafka_response_linger_ms, **(self.producer_options)}
+        )
 
     def __init__(
         self,
@@ -117,6 +120,8 @@ class KafkaWorkerContext:
         if self.consumer_task is None:
             raise ValueError("No consumer_task active. Cannot stop non-existing task!")
         self.consumer_task.cancel()
+        # messages which are already being handled are completed before stopping
+        await asyncio.wait([self.consumer_task])
         await self.consumer.stop()
 
     async def _stop_producer(self) -> None:
@@ -142,90 +147,114 @@ def get_kafka_worker_context() -> KafkaWorkerContext:
 async def consume_execution_trigger_message(
     kafka_ctx: KafkaWorkerContext,
 ) -> None:
-    """Executes transformation revisions as requested by Kafka messages to the respective topic"""
-    async for msg in kafka_ctx.consumer:
+    """Executes transformation revisions as requested by Kafka messages to the respective topic
+
+    Up to hd_kafka_consumer_max_concurrent_executions messages are handled at the same time.
+    """
+    slots = asyncio.Semaphore(get_config().hd_kafka_consumer_max_concurrent_executions)
+    running_tasks: set[asyncio.Task] = set()
+
+    async def handle_in_slot(msg: aiokafka.structs.ConsumerRecord) -> None:
         try:
-            logger.debug("Consumed msg: %s", str(msg))
-            logger.info(
-                (
-                    "Consumer %s is with partition assignment %s is starting"
-                    " to consume message from Kafka."
-                ),
-                kafka_ctx.consumer_id,
-                str(kafka_ctx.consumer.assignment()),
-            )
+            await handle_execution_trigger_message(kafka_ctx, msg)
+        finally:
+            slots.release()
+
+    try:
+        async for msg in kafka_ctx.consumer:
+            await slots.acquire()
+            task = asyncio.create_task(handle_in_slot(msg))
+            running_tasks.add(task)
+            task.add_done_callback(running_tasks.discard)
+            # do not fetch more messages than can be handled
+            async with slots:
+                pass
+    finally:
+        if len(running_tasks) > 0:
+            await asyncio.wait(list(running_tasks))
+
+
+async def handle_execution_trigger_message(
+    kafka_ctx: KafkaWorkerContext, msg: aiokafka.structs.ConsumerRecord
+) -> None:
+    try:
+        logger.debug("Consumed msg: %s", str(msg))
+        logger.info(
+            (
+                "Consumer %s is with partition assignment %s is starting"
+                " to consume message from Kafka."
+            ),
+            kafka_ctx.consumer_id,
+            str(kafka_ctx.consumer.assignment()),
+        )
+        try:
+            exec_by_id_input = ExecByIdInput.parse_raw(msg.value.decode("utf8"))
+        except ValidationError as validate_exec_by_id_input_error:
             try:
-                exec_by_id_input = ExecByIdInput.parse_raw(msg.value.decode("utf8"))
-            except ValidationError as validate_exec_by_id_input_error:
-                try:
-                    exec_latest_by_group_id_input = ExecLatestByGroupIdInput.parse_raw(
-                        msg.value.decode("utf8")
-                    )
-                except ValidationError as validate_exec_latest_by_group_id_input_error:
-                    log_msg = (
-                        f"Kafka consumer {kafka_ctx.consumer_id} failed to parse message"
-                        f" payload for execution.\n"
-                        f"Validation Error assuming ExecByIdInput was\n"
-                        f"{str(validate_exec_by_id_input_error)}\n"
-                        f"Validation Error assuming ExecLatestByGroupIdInput was\n"
-                        f"{str(validate_exec_latest_by_group_id_input_error)}\n"
-                        f"Aborting."
-                    )
-                    kafka_ctx.last_unhandled_exception = (
-                        validate_exec_latest_by_group_id_input_error
-                    )
-                    logger.error(log_msg)
-                    continue
-                try:
-                    latest_id = get_latest_revision_id(
-                        exec_latest_by_group_id_input.revision_group_id
-                    )
-                except DBNotFoundError as e:
-                    log_msg = (
-                        f"Kafka consumer {kafka_ctx.consumer_id} failed to receive"
-                        f" id of latest revision of revision group "
-                        f"{exec_latest_by_group_id_input.revision_group_id} from datatbase.\n"
-                        f"Aborting."
-                    )
-                    kafka_ctx.last_unhandled_exception = e
-                    logger.error(log_msg)
-                    continue
-                exec_by_id_input = ExecByIdInput(
-                    id=latest_id,
-                    wiring=exec_latest_by_group_id_input.wiring,
-                    run_pure_plot_operators=exec_latest_by_group_id_input.run_pure_plot_operators,
-                    job_id=exec_latest_by_group_id_input.job_id,
+                exec_latest_by_group_id_input = ExecLatestByGroupIdInput.parse_raw(
+                    msg.value.decode("utf8")
                 )
-            logger.info(
-                "Start execution of trafo rev %s with job_id=%s from Kafka consumer %s",
-                str(exec_by_id_input.id),
-                str(exec_by_id_input.job_id),
-                kafka_ctx.consumer_id,
-            )
+            except ValidationError as validate_exec_latest_by_group_id_input_error:
+                log_msg = (
+                    f"Kafka consumer {kafka_ctx.consumer_id} failed to parse message"
+                    f" payload for execution.\n"
+                    f"Validation Error assuming ExecByIdInput was\n"
+                    f"{str(validate_exec_by_id_input_error)}\n"
+                    f"Validation Error assuming ExecLatestByGroupIdInput was\n"
+                    f"{str(validate_exec_latest_by_group_id_input_error)}\n"
+                    f"Aborting."
+                )
+                kafka_ctx.last_unhandled_exception = validate_exec_latest_by_group_id_input_error
+                logger.error(log_msg)
+                return
             try:
-                exec_result = await perf_measured_execute_trafo_rev(exec_by_id_input)
-            except TrafoExecutionError as e:
+                latest_id = get_latest_revision_id_with_caching(
+                    exec_latest_by_group_id_input.revision_group_id
+                )
+            except DBNotFoundError as e:
                 log_msg = (
-                    f"Kafka consumer failed to execute trafo rev {exec_by_id_input.id}"
-                    f" for job_id={exec_by_id_input.job_id}. Error Message: {str(e)}. Aborting."
+                    f"Kafka consumer {kafka_ctx.consumer_id} failed to receive"
+                    f" id of latest revision of revision group "
+                    f"{exec_latest_by_group_id_input.revision_group_id} from datatbase.\n"
+                    f"Aborting."
                 )
                 kafka_ctx.last_unhandled_exception = e
                 logger.error(log_msg)
-                continue
-            logger.info(
-                "Kafka consumer %s finished execution for job_id=%s with result status %s."
-                "Error: %s",
-                kafka_ctx.consumer_id,
-                str(exec_by_id_input.job_id),
-                str(exec_result.result),
-                str(exec_result.error),
+                return
+            exec_by_id_input = ExecByIdInput(
+                id=latest_id,
+                wiring=exec_latest_by_group_id_input.wiring,
+                run_pure_plot_operators=exec_latest_by_group_id_input.run_pure_plot_operators,
+                job_id=exec_latest_by_group_id_input.job_id,
+            )
+        logger.info(
+            "Start execution of trafo rev %s with job_id=%s from Kafka consumer %s",
+            str(exec_by_id_input.id),
+            str(exec_by_id_input.job_id),
+            kafka_ctx.consumer_id,
+        )
+        try:
+            exec_result = await perf_measured_execute_trafo_rev(exec_by_id_input)
+        except TrafoExecutionError as e:
+            log_msg = (
+                f"Kafka consumer failed to execute trafo rev {exec_by_id_input.id}"
+                f" for job_id={exec_by_id_input.job_id}. Error Message: {str(e)}. Aborting."
             )
-            logger.debug("Kafka consumer execution result: \n%s", str(exec_result))
-            await producer_send_result_msg(kafka_ctx, exec_result)
-        except Exception as e:  # noqa: BLE001
             kafka_ctx.last_unhandled_exception = e
-            logger.error("Unexpected Error during Kafka execution: %s. Aborting.", str(e))
-            continue
+            logger.error(log_msg)
+            return
+        logger.info(
+            "Kafka consumer %s finished execution for job_id=%s with result status %s. Error: %s",
+            kafka_ctx.consumer_id,
+            str(exec_by_id_input.job_id),
+            str(exec_result.result),
+            str(exec_result.error),
+        )
+        logger.debug("Kafka consumer execution result: \n%s", str(exec_result))
+        await producer_send_result_msg(kafka_ctx, exec_result)
+    except Exception as e:  # noqa: BLE001
+        kafka_ctx.last_unhandled_exception = e
+        logger.error("Unexpected Error during Kafka execution: %s. Aborting.", str(e))
 
 
 async def producer_send_result_msg(
@@ -1,7 +1,7 @@
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
 from hetdesrun.backend.service.utils import to_camel
 from hetdesrun.datatypes import DataType
@@ -61,3 +61,20 @@ class ExecutionResponseFrontendDto(WorkflowExecutionInfo):
             "if advanced performance measuring is configured."
         ),
     )
+    # JSON of the outputs, if they were already encoded when checking their serializability
+    _output_results_json: list[bytes] | None = PrivateAttr(None)
+
+
+class ExecutionBatchItemResponse(BaseModel):
+    """Result of the execution for one wiring of a batch execution"""
+
+    index: int = Field(..., description="Position of the wiring in the batch execution input.")
+    job_id: UUID
+    execution_response: ExecutionResponseFrontendDto | None = None
+    error: str | None = Field(
+        None,
+        description=(
+            "Set if the execution could not be run, e.g. due to an invalid wiring."
+            " Errors occurring during the execution are contained in execution_response."
+        ),
+    )
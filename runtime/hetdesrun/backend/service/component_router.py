@@ -2,6 +2,7 @@ import logging
 from uuid import UUID
 
 from fastapi import HTTPException, Path, status
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
 from hetdesrun.backend.execution import ExecByIdInput
@@ -9,6 +10,7 @@ from hetdesrun.backend.models.component import ComponentRevisionFrontendDto
 from hetdesrun.backend.models.info import ExecutionResponseFrontendDto
 from hetdesrun.backend.models.wiring import WiringFrontendDto
 from hetdesrun.backend.service.transformation_router import (
+    execution_json_response,
     handle_trafo_revision_execution_request,
 )
 from hetdesrun.component.code import update_code
@@ -266,7 +268,7 @@ async def execute_component_revision(
     wiring_dto: WiringFrontendDto,
     run_pure_plot_operators: bool = False,
     job_id: UUID | None = None,
-) -> ExecutionResponseFrontendDto:
+) -> StreamingResponse:
     """Execute a transformation revision of type component.
 
     This endpoint is deprecated and will be removed soon,
@@ -287,7 +289,7 @@ async def execute_component_revision(
             job_id=job_id,
         )
 
-    return await handle_trafo_revision_execution_request(exec_by_id)
+    return execution_json_response(await handle_trafo_revision_execution_request(exec_by_id))
 
 
 @component_router.post(
@@ -1,10 +1,12 @@
 import logging
 
 from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from hetdesrun.backend.execution import ExecByIdInput
 from hetdesrun.backend.models.info import ExecutionResponseFrontendDto
 from hetdesrun.backend.service.transformation_router import (
+    execution_json_response,
     handle_trafo_revision_execution_request,
 )
 from hetdesrun.webservice.config import get_config
@@ -37,7 +39,7 @@ restricted_transformation_router = HandleTrailingSlashAPIRouter(
 )
 async def restricted_execute_transformation_revision_endpoint(
     exec_by_id: ExecByIdInput,
-) -> ExecutionResponseFrontendDto:
+) -> StreamingResponse:
     """Execute a transformation revision in restrict_to_trafo_exec_service mode
 
     If allowed, the transformation will be loaded from the DB and executed with
@@ -56,4 +58,4 @@ async def restricted_execute_transformation_revision_endpoint(
 
     logger.debug("Restricted execution called with allowed trafo id %s.", str(exec_by_id.id))
 
-    return await handle_trafo_revision_execution_request(exec_by_id)
+    return execution_json_response(await handle_trafo_revision_execution_request(exec_by_id))
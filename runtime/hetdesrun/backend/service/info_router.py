@@ -5,6 +5,7 @@ from fastapi import status
 from hetdesrun import VERSION
 from hetdesrun.backend.kafka.consumer import get_kafka_worker_context
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import http_client_pool_metrics
 from hetdesrun.webservice.router import HandleTrailingSlashAPIRouter
 
 logger = logging.getLogger(__name__)
@@ -34,6 +35,9 @@ async def get_info() -> dict:
     If Kafka consumer execution is enabled this will also show
     some information of the consumer instance running in the web service worker
     instance which is selected to answer this http request.
+
+    The metrics of the connection pools for outgoing requests are shown for the
+    web service worker instance as well.
     """
     logger.info("Get sign of life")
 
@@ -42,6 +46,7 @@ async def get_info() -> dict:
     info_dict = {
         "msg": "Here I am",
         "version": VERSION,
+        "http_client_pools": [pool_metrics.dict() for pool_metrics in http_client_pool_metrics()],
     }
 
     if get_config().hd_kafka_consumer_enabled and get_config().is_backend_service:
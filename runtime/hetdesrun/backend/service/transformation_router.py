@@ -1,6 +1,7 @@
 import datetime
 import json
 import logging
+from collections.abc import AsyncIterator
 from copy import deepcopy
 from typing import Annotated, Any
 from uuid import UUID
@@ -17,7 +18,7 @@ from fastapi import (
     Response,
     status,
 )
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from pydantic import HttpUrl, StrictInt, StrictStr
 
 from hetdesrun.backend.execution import (
@@ -25,7 +26,11 @@ from hetdesrun.backend.execution import (
     TrafoExecutionNotFoundError,
     TrafoExecutionResultValidationError,
     TrafoExecutionRuntimeConnectionError,
+    batch_item_response_json,
+    execute_transformation_revision_batch,
+    execution_response_json,
     perf_measured_execute_trafo_rev,
+    prepare_batch_execution_input,
 )
 from hetdesrun.backend.models.info import ExecutionResponseFrontendDto
 from hetdesrun.backend.service.dashboarding import (
@@ -46,7 +51,7 @@ from hetdesrun.exportimport.importing import (
     import_importable,
 )
 from hetdesrun.models.code import NonEmptyValidStr, ValidStr
-from hetdesrun.models.execution import ExecByIdInput, ExecLatestByGroupIdInput
+from hetdesrun.models.execution import ExecByIdBatchInput, ExecByIdInput, ExecLatestByGroupIdInput
 from hetdesrun.models.wiring import GridstackItemPositioning, WorkflowWiring
 from hetdesrun.persistence.dbservice.exceptions import DBIntegrityError, DBNotFoundError
 from hetdesrun.persistence.dbservice.revision import (
@@ -74,6 +79,7 @@ from hetdesrun.webservice.auth_dependency import (
 )
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import pooled_async_client
 from hetdesrun.webservice.router import HandleTrailingSlashAPIRouter
 
 logger = logging.getLogger(__name__)
@@ -808,6 +814,13 @@ async def handle_trafo_revision_execution_request(
     return exec_response
 
 
+def execution_json_response(exec_response: ExecutionResponseFrontendDto) -> StreamingResponse:
+    """Response with the JSON of an execution response, encoding its outputs only once"""
+    return StreamingResponse(
+        iter(execution_response_json(exec_response)), media_type="application/json"
+    )
+
+
 @transformation_router.post(
     "/execute",
     response_model=ExecutionResponseFrontendDto,
@@ -819,7 +832,7 @@ async def handle_trafo_revision_execution_request(
 )
 async def execute_transformation_revision_endpoint(
     exec_by_id: ExecByIdInput,
-) -> ExecutionResponseFrontendDto:
+) -> StreamingResponse:
     """Execute a transformation revision.
 
     The transformation will be loaded from the DB and executed with the wiring sent in the request
@@ -827,7 +840,59 @@ async def execute_transformation_revision_endpoint(
 
     The test wiring will not be updated.
     """
-    return await handle_trafo_revision_execution_request(exec_by_id)
+    return execution_json_response(await handle_trafo_revision_execution_request(exec_by_id))
+
+
+@transformation_router.post(
+    "/execute-batch",
+    response_class=StreamingResponse,
+    summary="Executes a transformation revision for many wirings",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "description": (
+                "Stream of newline delimited JSON objects, one per wiring, each as soon as"
+                " the respective execution finished"
+            ),
+            "content": {"application/x-ndjson": {}},
+        }
+    },
+)
+async def execute_transformation_revision_batch_endpoint(
+    batch_input: ExecByIdBatchInput,
+) -> StreamingResponse:
+    """Execute a transformation revision for each wiring of a batch.
+
+    The transformation will be loaded from the DB once and executed with every wiring sent in the
+    request body, running at most max_concurrent_executions executions at the same time.
+
+    The results are streamed back as newline delimited JSON in the order in which the executions
+    finish. Each line contains the index of the wiring in the request and either the execution
+    response or an error if the execution could not be run for this wiring.
+
+    The test wiring will not be updated.
+    """
+    try:
+        execution_input = prepare_batch_execution_input(batch_input)
+
+    except TrafoExecutionInputValidationError as err:
+        msg = f"Could not validate execution input for any wiring of the batch:\n{str(err)}"
+        logger.error(msg)
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=msg) from err
+
+    except TrafoExecutionNotFoundError as err:
+        msg = f"Could not find transformation revision {batch_input.id}:\n{str(err)}"
+        logger.error(msg)
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail=msg) from err
+
+    async def ndjson_lines() -> AsyncIterator[bytes]:
+        async for item_response in execute_transformation_revision_batch(
+            batch_input, execution_input
+        ):
+            for chunk in batch_item_response_json(item_response):
+                yield chunk
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
 
 
 callback_router = APIRouter()
@@ -852,7 +917,7 @@ async def send_result_to_callback_url(
         )
         logger.error(msg)
 
-    async with httpx.AsyncClient(
+    async with pooled_async_client(
         verify=get_config().hd_backend_verify_certs,
         timeout=get_config().external_request_timeout,
     ) as client:
@@ -962,7 +1027,7 @@ async def handle_latest_trafo_revision_execution_request(
 )
 async def execute_latest_transformation_revision_endpoint(
     exec_latest_by_group_id_input: ExecLatestByGroupIdInput,
-) -> ExecutionResponseFrontendDto:
+) -> StreamingResponse:
     """Execute the latest transformation revision of a revision group.
 
     WARNING: Even when the input is not changed, the execution response might change if a new latest
@@ -980,7 +1045,9 @@ async def execute_latest_transformation_revision_endpoint(
     The test wiring will not be updated.
     """
 
-    return await handle_latest_trafo_revision_execution_request(exec_latest_by_group_id_input)
+    return execution_json_response(
+        await handle_latest_trafo_revision_execution_request(exec_latest_by_group_id_input)
+    )
 
 
 async def execute_latest_and_post(
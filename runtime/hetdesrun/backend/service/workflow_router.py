@@ -2,6 +2,7 @@ import logging
 from uuid import UUID
 
 from fastapi import HTTPException, Path, status
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
 from hetdesrun.backend.execution import ExecByIdInput
@@ -9,6 +10,7 @@ from hetdesrun.backend.models.info import ExecutionResponseFrontendDto
 from hetdesrun.backend.models.wiring import WiringFrontendDto
 from hetdesrun.backend.models.workflow import WorkflowRevisionFrontendDto
 from hetdesrun.backend.service.transformation_router import (
+    execution_json_response,
     handle_trafo_revision_execution_request,
 )
 from hetdesrun.persistence.dbservice.exceptions import DBIntegrityError, DBNotFoundError
@@ -297,7 +299,7 @@ async def execute_workflow_revision(
     wiring_dto: WiringFrontendDto,
     run_pure_plot_operators: bool = False,
     job_id: UUID | None = None,
-) -> ExecutionResponseFrontendDto:
+) -> StreamingResponse:
     """Execute a transformation revision of type workflow.
 
     This endpoint is deprecated and will be removed soon,
@@ -317,7 +319,7 @@ async def execute_workflow_revision(
             job_id=job_id,
         )
 
-    return await handle_trafo_revision_execution_request(exec_by_id)
+    return execution_json_response(await handle_trafo_revision_execution_request(exec_by_id))
 
 
 @workflow_router.post(
@@ -7,12 +7,14 @@ to provide a very elementary support system to the designer code editor.
 import json
 import logging
 from keyword import iskeyword
+from typing import Any
 
 import black
 
 from hetdesrun.component.code_utils import (
     CodeParsingException,
     format_code_with_black,
+    get_global_from_code,
     update_module_level_variable,
 )
 from hetdesrun.datatypes import (
@@ -25,6 +27,11 @@ from hetdesrun.utils import State, Type
 
 logger = logging.getLogger(__name__)
 
+# Optional COMPONENT_INFO entries which are not derived from the transformation revision
+# but set by hand in the component code in order to control how the runtime executes
+# the component. These are kept when the function header is regenerated.
+EXECUTION_HINT_KEYS: tuple[str, ...] = ("executor", "deterministic", "side_effects")
+
 imports_template: str = """\
 # add your own imports here, e.g.
 # import pandas as pd
@@ -45,7 +52,7 @@ COMPONENT_INFO = {{
     "version_tag": {version_tag},
     "id": {id},
     "revision_group_id": {revision_group_id},
-    "state": {state},{timestamp}
+    "state": {state},{timestamp}{execution_hints}
 }}
 
 from hdutils import parse_default_value  # noqa: E402, F401
@@ -168,8 +175,26 @@ def default_value_part(inp: TransformationInput) -> str:
     return ', "default_value": ' + default_value_rep_part
 
 
-def generate_function_header(component: TransformationRevision, is_coroutine: bool = False) -> str:
-    """Generate entrypoint function header from the inputs and their types"""
+def execution_hints_from_code(code: str) -> dict[str, Any]:
+    """Extract the execution hint entries of the COMPONENT_INFO dict of existing code"""
+    try:
+        component_info = get_global_from_code(code, "COMPONENT_INFO", default_value={})
+    except CodeParsingException:
+        return {}
+    if not isinstance(component_info, dict):
+        return {}
+    return {key: component_info[key] for key in EXECUTION_HINT_KEYS if key in component_info}
+
+
+def generate_function_header(
+    component: TransformationRevision,
+    is_coroutine: bool = False,
+    execution_hints: dict[str, Any] | None = None,
+) -> str:
+    """Generate entrypoint function header from the inputs and their types
+
+    execution_hints are added as additional entries to the COMPONENT_INFO dict.
+    """
     param_list_str = (
         ""
         if len(component.io_interface.inputs) == 0
@@ -243,6 +268,11 @@ def generate_function_header(component: TransformationRevision, is_coroutine: bo
         timestamp_str = timestamp_str + component.disabled_timestamp.isoformat()
         timestamp_str = timestamp_str + '",'
 
+    execution_hints_str = "".join(
+        "\n    " + json.dumps(key) + ": " + repr(value) + ","
+        for key, value in (execution_hints or {}).items()
+    )
+
     function_header = function_definition_template.format(
         input_dict_content=input_dict_str,
         output_dict_content=output_dict_str,
@@ -257,6 +287,7 @@ def generate_function_header(component: TransformationRevision, is_coroutine: bo
         revision_group_id='"' + str(component.revision_group_id) + '"',
         state='"' + component.state + '"',
         timestamp=timestamp_str,
+        execution_hints=execution_hints_str,
         params_list=param_list_str,
         main_func_declaration_start=main_func_declaration_start,
     )
@@ -339,7 +370,9 @@ def update_code(
     )
     is_coroutine = use_async_def
 
-    new_function_header = generate_function_header(tr, is_coroutine)
+    new_function_header = generate_function_header(
+        tr, is_coroutine, execution_hints=execution_hints_from_code(existing_code)
+    )
 
     return start + new_function_header + end
 
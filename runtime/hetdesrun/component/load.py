@@ -2,10 +2,12 @@
 
 import hashlib
 import importlib
+import inspect
 import logging
 import sys
 from collections.abc import Callable, Coroutine
 from types import ModuleType
+from typing import Any
 
 
 class ComponentCodeImportError(Exception):
@@ -92,3 +94,14 @@ def import_func_from_code(
 
         func = getattr(mod, func_name)
         return func
+
+
+def component_info_from_func(func: Callable | Coroutine) -> dict[str, Any]:
+    """Obtain the COMPONENT_INFO dict of the module in which func was defined
+
+    Returns an empty dict if the module does not contain a COMPONENT_INFO dict.
+    """
+    component_info = getattr(inspect.unwrap(func), "__globals__", {}).get(  # type: ignore
+        "COMPONENT_INFO", {}
+    )
+    return component_info if isinstance(component_info, dict) else {}
@@ -24,6 +24,13 @@ class ExecByIdBase(BaseModel):
     run_pure_plot_operators: bool = Field(
         False, description="Whether pure plot components should be run."
     )
+    profile_operators: bool = Field(
+        False,
+        description=(
+            "Whether time, memory and input/output data sizes of every operator"
+            " should be measured and returned."
+        ),
+    )
 
 
 class ExecByIdInput(ExecByIdBase):
@@ -36,6 +43,28 @@ class ExecByIdInput(ExecByIdBase):
     )
 
 
+class ExecByIdBatchInput(BaseModel):
+    """Payload for executing one transformation revision with many wirings"""
+
+    id: UUID  # noqa: A003
+    wirings: list[WorkflowWiring] = Field(
+        ..., min_items=1, description="The transformation revision is executed for each wiring."
+    )
+    run_pure_plot_operators: bool = Field(
+        False, description="Whether pure plot components should be run."
+    )
+    profile_operators: bool = Field(
+        False,
+        description=(
+            "Whether time, memory and input/output data sizes of every operator"
+            " should be measured and returned."
+        ),
+    )
+    max_concurrent_executions: int = Field(
+        8, gt=0, description="Maximum number of wirings which are executed at the same time."
+    )
+
+
 class ExecLatestByGroupIdInput(BaseModel):
     """Payload for execute-latest kafka endpoint
 
@@ -29,6 +29,15 @@ class ExecutionEngine(Enum):
     Plain = "plain"
 
 
+class NodeSchedulingMode(StrEnum):
+    """How the plain engine schedules the computation nodes of a workflow"""
+
+    # nodes are computed on demand, one after another, starting from the workflow outputs
+    LAZY = "lazy"
+    # nodes are topologically sorted and every ready node is computed concurrently
+    CONCURRENT = "concurrent"
+
+
 class PerformanceMeasuredStep(BaseModel):
     name: str
     start: datetime.datetime | None = None
@@ -74,6 +83,109 @@ class AllMeasuredSteps(BaseModel):
     send_data: PerformanceMeasuredStep | None = None
 
 
+class DataSize(BaseModel):
+    rows: int | None = Field(
+        None, description="Number of rows for Pandas objects, arrays and sequences."
+    )
+    bytes: int = Field(..., description="Estimated memory size in bytes.")  # noqa: A003
+
+
+class OperatorProfile(BaseModel):
+    """Measurements of the computation of one operator"""
+
+    operator_hierarchical_id: str
+    operator_hierarchical_name: str
+    transformation_id: str
+    transformation_name: str
+    transformation_tag: str
+    wall_time_seconds: float = Field(
+        ..., description="Duration of running the component code (or of using a memoized result)."
+    )
+    cpu_time_seconds: float = Field(
+        ...,
+        description=(
+            "CPU time of the runtime process while the component code ran. Includes other"
+            " operators running concurrently and excludes components run in a process executor."
+        ),
+    )
+    peak_memory_bytes: int | None = Field(
+        None,
+        description=(
+            "Peak of memory allocated via Python (traced with tracemalloc) while the component"
+            " code ran, relative to the allocated memory before. Since tracemalloc traces the"
+            " whole process, this is not set if other operators ran at the same time, e.g. with"
+            ' "concurrent" node_scheduling or in concurrent executions.'
+        ),
+    )
+    memoized: bool = False
+    input_sizes: dict[str, DataSize] = {}
+    output_sizes: dict[str, DataSize] = {}
+
+
+class NodeOutputSummary(BaseModel):
+    """Compact description of one output value of an operator"""
+
+    type: str = Field(..., description="Python type of the value.")  # noqa: A003
+    shape: list[int] | None = Field(None, description="Shape of Pandas objects and arrays.")
+    dtypes: dict[str, str] | str | None = Field(
+        None, description="Dtype of Series and arrays or dtypes of DataFrame columns."
+    )
+    min: Any = Field(  # noqa: A003
+        None, description="Minimum of numeric and datetime values, per column for DataFrames."
+    )
+    max: Any = Field(  # noqa: A003
+        None, description="Maximum of numeric and datetime values, per column for DataFrames."
+    )
+    head: Any = Field(None, description="First entries of Pandas objects and arrays.")
+    tail: Any = Field(None, description="Last entries of Pandas objects and arrays.")
+    bytes: int = Field(..., description="Estimated memory size in bytes.")  # noqa: A003
+    preview: str | None = Field(
+        None, description="Shortened str() representation of values which are not included."
+    )
+    value: Any = Field(
+        None,
+        description=(
+            "Complete value. Only included for numbers, booleans, short strings and for"
+            " operators listed in full_node_results_operator_ids."
+        ),
+    )
+
+
+class NodeResultSummary(BaseModel):
+    operator_hierarchical_name: str
+    outputs: dict[str, NodeOutputSummary] = Field(
+        ..., description="Summaries of the outputs of the operator by output name."
+    )
+
+
+class ChunkingConfiguration(BaseModel):
+    """Execute a workflow separately for consecutive windows of the requested time range"""
+
+    window: datetime.timedelta = Field(
+        ...,
+        description="Length of each window, e.g. as ISO 8601 duration like P1D or in seconds.",
+    )
+    overlap: datetime.timedelta = Field(
+        datetime.timedelta(0),
+        description=(
+            "Additional time range loaded before each window, e.g. for moving statistics."
+            " Output rows in the overlap are removed before outputs of windows are merged."
+        ),
+    )
+
+    @validator("window")
+    def window_positive(cls, window: datetime.timedelta) -> datetime.timedelta:
+        if window <= datetime.timedelta(0):
+            raise ValueError("The chunking window must be positive.")
+        return window
+
+    @validator("overlap")
+    def overlap_not_negative(cls, overlap: datetime.timedelta) -> datetime.timedelta:
+        if overlap < datetime.timedelta(0):
+            raise ValueError("The chunking overlap must not be negative.")
+        return overlap
+
+
 class ConfigurationInput(BaseModel):
     """Options changing how a workflow will be executed"""
 
@@ -91,7 +203,83 @@ class ConfigurationInput(BaseModel):
             "to empty dictionaries."
         ),
     )
-    return_individual_node_results: bool = False
+    return_individual_node_results: bool = Field(
+        False,
+        description=(
+            "Whether every operator is run and a summary of its outputs is returned as"
+            " node_results in the execution result."
+        ),
+    )
+    full_node_results_operator_ids: list[str] = Field(
+        [],
+        description=(
+            "Hierarchical ids of operators whose complete output values are included in"
+            " node_results. For all other operators only summaries are returned."
+            " Only used if return_individual_node_results is True."
+        ),
+    )
+    prune_unused_operators: bool = Field(
+        False,
+        description=(
+            "Whether only operators contributing to workflow outputs and operators with side"
+            " effects are run. Operators with side effects are those without outputs and those"
+            ' with "side_effects": True in their COMPONENT_INFO. Only enable this if all'
+            " components with outputs which have side effects, e.g. writing files or calling"
+            " APIs, are marked accordingly. Ignored if return_individual_node_results is True,"
+            " since then every operator is run."
+        ),
+    )
+    node_scheduling: NodeSchedulingMode = Field(
+        NodeSchedulingMode.LAZY,
+        description=(
+            "How the computation nodes of the workflow are scheduled. "
+            '"lazy" computes the operators one after another on demand. '
+            '"concurrent" sorts the operators topologically and runs all operators whose'
+            " inputs are available concurrently, such that independent branches of the"
+            " workflow overlap."
+        ),
+    )
+    max_concurrent_nodes: int = Field(
+        8,
+        gt=0,
+        description=(
+            "Maximum number of operators that are run at the same time"
+            ' if node_scheduling is "concurrent".'
+        ),
+    )
+    profile_operators: bool = Field(
+        False,
+        description=(
+            "Whether to measure time, memory and input/output data sizes of every operator."
+            " The measurements are returned as operator_profiles in the execution result."
+            " Memory is traced via tracemalloc, which slows down the execution."
+        ),
+    )
+    result_handle_min_rows: int | None = Field(
+        None,
+        gt=0,
+        description=(
+            "If set, Series and DataFrame outputs which are returned directly and have at"
+            " least this many rows are stored in the result store of the runtime. The"
+            " execution result then contains a result handle instead of the data, which can"
+            " be downloaded page by page from the /engine/results endpoint of the runtime."
+            " The result store is local to the runtime instance which executed the workflow"
+            " and the backend does not proxy this endpoint. So with several runtime instances"
+            " downloads must reach the same instance, unless the result store directory is"
+            " shared between them."
+        ),
+    )
+    chunking: ChunkingConfiguration | None = Field(
+        None,
+        description=(
+            "If set, the time range given by the timestampFrom and timestampTo filters of the"
+            " input wirings is split into windows and the workflow is executed for each window"
+            " separately. Each input wiring only loads the part of a window within its own"
+            " time range. Series and DataFrame outputs of all windows are concatenated before"
+            " they are sent to sinks. For all other outputs, e.g. scalar aggregates, only the"
+            " value of the last window is kept."
+        ),
+    )
 
 
 class WorkflowExecutionInput(BaseModel):
@@ -203,6 +391,26 @@ class WorkflowExecutionInput(BaseModel):
 
         return values
 
+    @root_validator(skip_on_failure=True)
+    def chunked_time_range_filters_valid(cls, values: dict) -> dict:
+        """Time range filters must be timestamps if the time range is split into windows"""
+        if values["configuration"].chunking is None:
+            return values
+        for input_wiring in values["workflow_wiring"].input_wirings:
+            for filter_key in ("timestampFrom", "timestampTo"):
+                filter_value = input_wiring.filters.get(filter_key, None)
+                if not filter_value:
+                    continue
+                try:
+                    datetime.datetime.fromisoformat(filter_value)
+                except ValueError as e:
+                    raise ValueError(
+                        f"Filter {filter_key} of input wiring for workflow input"
+                        f" '{input_wiring.workflow_input_name}' is not a valid timestamp,"
+                        f" which is required for chunked execution: {filter_value}"
+                    ) from e
+        return values
+
     Config = AdvancedTypesOutputSerializationConfig  # enable Serialization of some advanced types
 
 
@@ -305,6 +513,13 @@ class WorkflowExecutionInfo(BaseModel):
     job_id: UUID
 
     measured_steps: AllMeasuredSteps = AllMeasuredSteps()
+    operator_profiles: dict[str, OperatorProfile] | None = Field(
+        None,
+        description=(
+            "Measurements of every computed operator by hierarchical operator id."
+            " Only provided if profile_operators is set in the execution configuration."
+        ),
+    )
 
     @classmethod
     def from_exception(
@@ -352,13 +567,11 @@ class WorkflowExecutionResult(WorkflowExecutionInfo):
         description="one of " + ", ".join(['"' + x.value + '"' for x in list(Result)]),
         example=Result.OK,
     )
-    node_results: str | None = Field(
+    node_results: dict[str, NodeResultSummary] | None = Field(
         None,
         description=(
-            "Individual results of all executed nodes as concatenated str."
-            " This uses str() on the Python objects which may be an abbreviated representation"
-            " (e.g. Pandas objects). Will only be used if the corresponding configuration flag is"
-            " set to true."
+            "Summaries of the results of all executed nodes by hierarchical operator id."
+            " Will only be used if the corresponding configuration flag is set to true."
         ),
     )
     resolved_reproducibility_references: ReproducibilityReference = Field(
@@ -374,7 +587,7 @@ class WorkflowExecutionResult(WorkflowExecutionInfo):
         process_stage: ProcessStage,
         job_id: UUID,
         cause: BaseException | None = None,
-        node_results: str | None = None,
+        node_results: dict[str, NodeResultSummary] | None = None,
     ) -> "WorkflowExecutionResult":
         # Access the current context to retrieve resolved reproducibility references
         repr_reference = get_deepcopy_of_reproducibility_reference_context()
@@ -1,5 +1,6 @@
 import datetime
 import logging
+import time
 from copy import deepcopy
 from uuid import UUID
 
@@ -27,6 +28,7 @@ from hetdesrun.persistence.models.transformation import TransformationRevision
 from hetdesrun.persistence.models.workflow import WorkflowContent
 from hetdesrun.trafoutils.filter.params import FilterParams
 from hetdesrun.utils import State, Type, cache_conditionally
+from hetdesrun.webservice.config import get_config
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +58,8 @@ def store_single_transformation_revision(
             )  # hint for mypy
             update_nesting(session, transformation_revision.id, transformation_revision.content)
 
+    invalidate_latest_revision_id_cache(transformation_revision.revision_group_id)
+
 
 def select_tr_by_id(
     session: SQLAlchemySession,
@@ -299,48 +303,52 @@ def update_or_create_single_transformation_revision(
         keep_only_release_wirings_with_adapter_ids=keep_only_release_wirings_with_adapter_ids,
     )
 
-    with get_session()() as session, session.begin():
-        try:
-            existing_transformation_revision = select_tr_by_id(
-                session, transformation_revision.id, log_error=False
-            )
-        except DBNotFoundError:
-            if transformation_revision.type == Type.WORKFLOW or update_component_code:
-                transformation_revision = update_content(transformation_revision)
-
-            add_tr(session, transformation_revision)
-        else:
-            modifiable, msg = is_modifiable(
-                existing_transformation_revision=existing_transformation_revision,
-                updated_transformation_revision=transformation_revision,
-                allow_overwrite_released=allow_overwrite_released,
-            )
-
-            if modifiable is False:
-                raise ModifyForbidden(msg)
+    try:
+        with get_session()() as session, session.begin():
+            try:
+                existing_transformation_revision = select_tr_by_id(
+                    session, transformation_revision.id, log_error=False
+                )
+            except DBNotFoundError:
+                if transformation_revision.type == Type.WORKFLOW or update_component_code:
+                    transformation_revision = update_content(transformation_revision)
+
+                add_tr(session, transformation_revision)
+            else:
+                modifiable, msg = is_modifiable(
+                    existing_transformation_revision=existing_transformation_revision,
+                    updated_transformation_revision=transformation_revision,
+                    allow_overwrite_released=allow_overwrite_released,
+                )
 
-            transformation_revision = if_applicable_release_or_deprecate(
-                existing_transformation_revision, transformation_revision
-            )
+                if modifiable is False:
+                    raise ModifyForbidden(msg)
 
-            if transformation_revision.type == Type.WORKFLOW or update_component_code:
-                transformation_revision = update_content(
-                    transformation_revision, existing_transformation_revision
+                transformation_revision = if_applicable_release_or_deprecate(
+                    existing_transformation_revision, transformation_revision
                 )
 
-            update_tr(session, transformation_revision)
+                if transformation_revision.type == Type.WORKFLOW or update_component_code:
+                    transformation_revision = update_content(
+                        transformation_revision, existing_transformation_revision
+                    )
 
-        if transformation_revision.state == State.DISABLED:
-            pass_on_deprecation(session, transformation_revision.id)
-            return select_tr_by_id(session, transformation_revision.id)
+                update_tr(session, transformation_revision)
 
-        if transformation_revision.type == Type.WORKFLOW:
-            assert isinstance(  # noqa: S101
-                transformation_revision.content, WorkflowContent
-            )  # hint for mypy
-            update_nesting(session, transformation_revision.id, transformation_revision.content)
+            if transformation_revision.state == State.DISABLED:
+                pass_on_deprecation(session, transformation_revision.id)
+                return select_tr_by_id(session, transformation_revision.id)
+
+            if transformation_revision.type == Type.WORKFLOW:
+                assert isinstance(  # noqa: S101
+                    transformation_revision.content, WorkflowContent
+                )  # hint for mypy
+                update_nesting(session, transformation_revision.id, transformation_revision.content)
 
-        return select_tr_by_id(session, transformation_revision.id)
+            return select_tr_by_id(session, transformation_revision.id)
+    finally:
+        # after the transaction, since releasing or deprecating may change the latest revision
+        invalidate_latest_revision_id_cache(transformation_revision.revision_group_id)
 
 
 def delete_tr(session: SQLAlchemySession, tr_id: UUID) -> None:
@@ -386,6 +394,8 @@ def delete_single_transformation_revision(
 
         delete_tr(session, transformation_revision.id)
 
+    invalidate_latest_revision_id_cache(transformation_revision.revision_group_id)
+
 
 def is_unused(transformation_id: UUID) -> bool:
     """Determine if transformation revision is unused.
@@ -542,3 +552,38 @@ def get_latest_revision_id(revision_group_id: UUID) -> UUID:
         id_by_released_timestamp[revision.released_timestamp] = revision.id
     _, latest_revision_id = sorted(id_by_released_timestamp.items(), reverse=True)[0]
     return latest_revision_id
+
+
+_latest_revision_ids: dict[UUID, tuple[float, UUID]] = {}
+_latest_revision_ids_generation = 0
+
+
+def invalidate_latest_revision_id_cache(revision_group_id: UUID | None = None) -> None:
+    """Forget cached latest revision ids of one or, if None, all revision groups"""
+    global _latest_revision_ids_generation  # noqa: PLW0603
+    _latest_revision_ids_generation += 1
+    if revision_group_id is None:
+        _latest_revision_ids.clear()
+    else:
+        _latest_revision_ids.pop(revision_group_id, None)
+
+
+def get_latest_revision_id_with_caching(revision_group_id: UUID) -> UUID:
+    """Cached variant of get_latest_revision_id
+
+    Entries expire after latest_revision_id_cache_ttl seconds, so that other processes pick up
+    releases and deprecations. Storing or deleting a revision invalidates the entry of its
+    revision group in this process immediately.
+    """
+    ttl = get_config().latest_revision_id_cache_ttl
+    now = time.monotonic()
+    cached = _latest_revision_ids.get(revision_group_id)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+
+    generation = _latest_revision_ids_generation
+    latest_revision_id = get_latest_revision_id(revision_group_id)
+    # do not cache a result which may have been read before an invalidation
+    if ttl > 0 and generation == _latest_revision_ids_generation:
+        _latest_revision_ids[revision_group_id] = (now, latest_revision_id)
+    return latest_revision_id
@@ -0,0 +1,269 @@
+"""Chunked execution of workflows processing long time ranges
+
+Instead of loading the complete time range given by the timestampFrom and timestampTo filters
+of the input wirings at once, the range is split into consecutive windows. The workflow is
+executed for each window separately, such that only the data of one window (plus the
+configured overlap) is in memory at once.
+
+Each input wiring only loads the part of a window within its own time range. Input wirings
+whose time range does not intersect a window load the zero-length range at the nearest end
+of their own time range.
+
+The outputs of the windows are merged: Pandas objects are concatenated, after removing rows
+belonging to the overlap or to the next window if they have a datetime index or a "timestamp"
+column. For all other outputs, e.g. scalar statistics, the value of the last window is used.
+The merged outputs are sent to the sinks of the output wirings once at the end. Large outputs
+are only stored in the result store after merging.
+"""
+
+import datetime
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import pandas as pd
+
+from hetdesrun.adapters import AdapterHandlingException
+from hetdesrun.models.run import (
+    ChunkingConfiguration,
+    PerformanceMeasuredStep,
+    ProcessStage,
+    WorkflowExecutionInput,
+    WorkflowExecutionResult,
+)
+from hetdesrun.models.wiring import FilterKey, InputWiring, OutputWiring, WorkflowWiring
+from hetdesrun.runtime import runtime_logger
+from hetdesrun.runtime.result_store import store_large_outputs_in_thread
+from hetdesrun.wiring import resolve_and_send_data_from_wiring
+
+TimeWindow = tuple[datetime.datetime, datetime.datetime]
+
+
+def parse_timestamp_filter(value: str) -> datetime.datetime:
+    timestamp = datetime.datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+    return timestamp
+
+
+def format_timestamp_filter(timestamp: datetime.datetime) -> str:
+    return (
+        timestamp.astimezone(datetime.timezone.utc).isoformat(timespec="milliseconds").split("+")[0]
+        + "Z"
+    )
+
+
+def has_time_range_filters(input_wiring: InputWiring) -> bool:
+    return bool(
+        input_wiring.filters.get("timestampFrom", None)  # type: ignore
+        and input_wiring.filters.get("timestampTo", None)  # type: ignore
+    )
+
+
+def wiring_time_range(input_wiring: InputWiring) -> TimeWindow:
+    return (
+        parse_timestamp_filter(input_wiring.filters["timestampFrom"]),  # type: ignore
+        parse_timestamp_filter(input_wiring.filters["timestampTo"]),  # type: ignore
+    )
+
+
+def obtain_time_range(workflow_wiring: WorkflowWiring) -> TimeWindow | None:
+    """Overall time range of all input wirings with timestampFrom and timestampTo filters"""
+    time_ranges = [
+        wiring_time_range(input_wiring)
+        for input_wiring in workflow_wiring.input_wirings
+        if has_time_range_filters(input_wiring)
+    ]
+    if len(time_ranges) == 0:
+        return None
+    return min(start for start, _ in time_ranges), max(end for _, end in time_ranges)
+
+
+def split_time_range(
+    start: datetime.datetime, end: datetime.datetime, window: datetime.timedelta
+) -> list[TimeWindow]:
+    windows = []
+    window_start = start
+    while window_start < end:
+        window_end = min(window_start + window, end)
+        windows.append((window_start, window_end))
+        window_start = window_end
+    return windows if len(windows) > 0 else [(start, end)]
+
+
+def restrict_time_range(
+    time_range: TimeWindow, window: TimeWindow, overlap: datetime.timedelta
+) -> TimeWindow:
+    """Part of the time range of an input wiring to load for a window
+
+    The overlap is not loaded before the start of the time range. If the time range does
+    not intersect the window, the zero-length range at its end nearest to the window is
+    returned.
+    """
+    start = max(time_range[0], window[0] - overlap)
+    end = min(time_range[1], window[1])
+    if start <= end:
+        return start, end
+    nearest_end = time_range[0] if window[1] < time_range[0] else time_range[1]
+    return nearest_end, nearest_end
+
+
+def window_execution_input(
+    runtime_input: WorkflowExecutionInput, window: TimeWindow, overlap: datetime.timedelta
+) -> WorkflowExecutionInput:
+    """Execution input loading the data of one window and directly returning all outputs"""
+    window_wiring = runtime_input.workflow_wiring.copy(deep=True)
+    for input_wiring in window_wiring.input_wirings:
+        if has_time_range_filters(input_wiring):
+            load_start, load_end = restrict_time_range(
+                wiring_time_range(input_wiring), window, overlap
+            )
+            input_wiring.filters[FilterKey("timestampFrom")] = format_timestamp_filter(load_start)
+            input_wiring.filters[FilterKey("timestampTo")] = format_timestamp_filter(load_end)
+    window_wiring.output_wirings = [
+        OutputWiring(workflow_output_name=output_wiring.workflow_output_name)
+        for output_wiring in window_wiring.output_wirings
+    ]
+    return runtime_input.copy(
+        update={
+            "workflow_wiring": window_wiring,
+            "configuration": runtime_input.configuration.copy(
+                update={"chunking": None, "result_handle_min_rows": None}
+            ),
+        }
+    )
+
+
+def restrict_to_window(value: Any, window: TimeWindow, is_last_window: bool) -> Any:
+    """Remove rows outside of the window from Pandas objects with timestamps
+
+    Windows include their start and exclude their end, except for the last window.
+    """
+    if isinstance(value, pd.Series | pd.DataFrame) and isinstance(value.index, pd.DatetimeIndex):
+        timestamps = value.index
+    elif (
+        isinstance(value, pd.DataFrame)
+        and "timestamp" in value.columns
+        and pd.api.types.is_datetime64_any_dtype(value["timestamp"])
+    ):
+        timestamps = pd.DatetimeIndex(value["timestamp"])
+    else:
+        return value
+
+    start = pd.Timestamp(window[0])
+    end = pd.Timestamp(window[1])
+    if timestamps.tz is None:
+        start = start.tz_convert(None)
+        end = end.tz_convert(None)
+    in_window = (timestamps >= start) & (
+        (timestamps <= end) if is_last_window else (timestamps < end)
+    )
+    return value[in_window]
+
+
+class WindowOutputMerger:
+    """Collects outputs of all windows and merges them
+
+    Only Pandas objects are merged. For all other outputs the values of earlier windows are
+    discarded and the value of the last window is kept.
+    """
+
+    def __init__(self) -> None:
+        self.pandas_pieces: dict[str, list[pd.Series | pd.DataFrame]] = {}
+        self.last_values: dict[str, Any] = {}
+
+    def add(self, outputs: dict[str, Any], window: TimeWindow, is_last_window: bool) -> None:
+        for name, value in outputs.items():
+            if isinstance(value, pd.Series | pd.DataFrame):
+                self.pandas_pieces.setdefault(name, []).append(
+                    restrict_to_window(value, window, is_last_window)
+                )
+            else:
+                self.last_values[name] = value
+
+    def merged(self) -> dict[str, Any]:
+        return {
+            **self.last_values,
+            **{name: pd.concat(pieces) for name, pieces in self.pandas_pieces.items()},
+        }
+
+
+async def iterate_window_results(
+    runtime_input: WorkflowExecutionInput,
+    windows: list[TimeWindow],
+    overlap: datetime.timedelta,
+    execute: Callable[[WorkflowExecutionInput], Awaitable[WorkflowExecutionResult]],
+) -> AsyncIterator[tuple[TimeWindow, WorkflowExecutionResult]]:
+    """Execute the workflow window by window, only loading data of the next window when asked"""
+    for window in windows:
+        runtime_logger.info(
+            "Executing workflow for window from %s to %s",
+            window[0].isoformat(),
+            window[1].isoformat(),
+        )
+        yield window, await execute(window_execution_input(runtime_input, window, overlap))
+
+
+async def chunked_runtime_service(
+    runtime_input: WorkflowExecutionInput,
+    chunking: ChunkingConfiguration,
+    execute: Callable[[WorkflowExecutionInput], Awaitable[WorkflowExecutionResult]],
+) -> WorkflowExecutionResult:
+    """Execute the workflow for each window with execute and send the merged outputs
+
+    If the input wirings do not contain a time range, the workflow is executed only once.
+    The result of the first failing window is returned as is.
+    """
+    time_range = obtain_time_range(runtime_input.workflow_wiring)
+    if time_range is None:
+        runtime_logger.info("No time range to split into windows found in input wirings.")
+        return await execute(
+            runtime_input.copy(
+                update={
+                    "configuration": runtime_input.configuration.copy(update={"chunking": None})
+                }
+            )
+        )
+
+    runtime_service_measured_step = PerformanceMeasuredStep.create_and_begin("RUNTIME_SERVICE")
+    windows = split_time_range(*time_range, chunking.window)
+
+    merger = WindowOutputMerger()
+    async for window, window_result in iterate_window_results(
+        runtime_input, windows, chunking.overlap, execute
+    ):
+        if window_result.error is not None:
+            return window_result
+        merger.add(
+            window_result.output_results_by_output_name,
+            window,
+            is_last_window=window == windows[-1],
+        )
+
+    send_data_measured_step = PerformanceMeasuredStep.create_and_begin(
+        ProcessStage.SENDING_DATA_TO_ADAPTERS.value
+    )
+    try:
+        direct_return_data = await resolve_and_send_data_from_wiring(
+            runtime_input.workflow_wiring, merger.merged()
+        )
+    except AdapterHandlingException as exc:
+        runtime_logger.info(
+            "Adapter Handling Exception during sending merged data of all windows.",
+            exc_info=True,
+        )
+        return WorkflowExecutionResult.from_exception(
+            exc, ProcessStage.SENDING_DATA_TO_ADAPTERS, runtime_input.job_id
+        )
+    send_data_measured_step.stop()
+
+    wf_exec_result = WorkflowExecutionResult(
+        result="ok",
+        output_results_by_output_name=await store_large_outputs_in_thread(
+            direct_return_data, runtime_input.configuration.result_handle_min_rows
+        ),
+        job_id=runtime_input.job_id,
+    )
+    runtime_service_measured_step.stop()
+    wf_exec_result.measured_steps.send_data = send_data_measured_step
+    wf_exec_result.measured_steps.runtime_service_handling = runtime_service_measured_step
+    return wf_exec_result
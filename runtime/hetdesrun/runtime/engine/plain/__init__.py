@@ -1,8 +1,15 @@
 import logging
 from typing import Any
 
+from hetdesrun.models.run import ConfigurationInput, NodeSchedulingMode
 from hetdesrun.runtime import runtime_execution_logger
-from hetdesrun.runtime.engine.plain.workflow import Workflow
+from hetdesrun.runtime.configuration import execution_config
+from hetdesrun.runtime.engine.plain.scheduling import run_nodes_concurrently
+from hetdesrun.runtime.engine.plain.workflow import (
+    Workflow,
+    pruning_requested,
+    track_result_consumers,
+)
 from hetdesrun.runtime.logging import execution_context_filter
 
 logger = logging.getLogger(__name__)
@@ -13,5 +20,16 @@ runtime_execution_logger.addFilter(execution_context_filter)
 
 
 async def workflow_execution_plain(workflow: Workflow) -> dict[str, Any]:
+    exe_context_config = execution_config.get(ConfigurationInput())
+    if not exe_context_config.return_individual_node_results:
+        # only the workflow result and explicitly requested node results are retained
+        track_result_consumers(workflow)
+    if exe_context_config.node_scheduling == NodeSchedulingMode.CONCURRENT:
+        await run_nodes_concurrently(
+            workflow,
+            max_concurrent_nodes=exe_context_config.max_concurrent_nodes,
+            run_pure_plot_operators=exe_context_config.run_pure_plot_operators,
+            prune_unused_operators=pruning_requested(exe_context_config),
+        )
     res: dict[str, Any] = await workflow.result
     return res
@@ -1,14 +1,109 @@
 """Execution helpers"""
 
 import asyncio
+import contextvars
+import functools
+import logging
+import multiprocessing
 from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any
 
+from hetdesrun.component.load import import_func_from_code
+from hetdesrun.webservice.config import ComponentExecutor, get_config
+
+logger = logging.getLogger(__name__)
+
+_thread_pool_executor: ThreadPoolExecutor | None = None
+_process_pool_executor: ProcessPoolExecutor | None = None
+
+
+def get_thread_pool_executor() -> ThreadPoolExecutor:
+    """Obtain the thread pool for running synchronous component functions
+
+    The pool is created on first usage.
+    """
+    global _thread_pool_executor  # noqa: PLW0603
+    if _thread_pool_executor is None:
+        _thread_pool_executor = ThreadPoolExecutor(
+            max_workers=get_config().component_executor_max_workers,
+            thread_name_prefix="hd_component_executor",
+        )
+    return _thread_pool_executor
+
+
+def get_process_pool_executor() -> ProcessPoolExecutor:
+    """Obtain the process pool for running synchronous component functions
+
+    The pool is created on first usage. Worker processes are spawned instead of forked
+    since forking a process running an event loop and other threads is not safe.
+    """
+    global _process_pool_executor  # noqa: PLW0603
+    if _process_pool_executor is None:
+        _process_pool_executor = ProcessPoolExecutor(
+            max_workers=get_config().component_executor_max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool_executor
+
+
+def shutdown_component_executors() -> None:
+    """Shut down thread and process pool if they were created"""
+    global _thread_pool_executor, _process_pool_executor  # noqa: PLW0603
+    for executor in (_thread_pool_executor, _process_pool_executor):
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+    _thread_pool_executor = None
+    _process_pool_executor = None
+
+
+def run_func_from_code(code: str, func_name: str, kwargs: dict[str, Any]) -> Any:
+    """Import and run a function in a process pool worker
+
+    Since the imported module is registered, importing happens only once per worker process.
+    """
+    func = import_func_from_code(code, func_name)
+    return func(**kwargs)  # type: ignore
+
+
+async def run_in_executor(executor: Executor, func: Callable[..., Any], *args: Any) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
 
 async def run_func_or_coroutine(
-    func_or_coro: Callable[..., Any], kwargs: dict[str, Any]
+    func_or_coro: Callable[..., Any],
+    kwargs: dict[str, Any],
+    executor: ComponentExecutor | None = None,
+    code: str | None = None,
+    function_name: str | None = None,
 ) -> dict[str, Any]:
-    """Check if input is coroutine and depending on result either await it or call as function"""
+    """Check if input is coroutine and depending on result either await it or call as function
+
+    Functions are run via the provided executor or, if it is None, via the configured default
+    executor. Running in a process requires the code of the module the function is defined in,
+    since functions from dynamically imported component code cannot be pickled. Without code
+    the function is run in a thread instead.
+    """
     if asyncio.iscoroutinefunction(func_or_coro):
         return await func_or_coro(**kwargs)  # type: ignore
+
+    executor = executor if executor is not None else get_config().component_executor
+
+    if executor == ComponentExecutor.PROCESS and code is not None:
+        return await run_in_executor(  # type: ignore
+            get_process_pool_executor(),
+            run_func_from_code,
+            code,
+            function_name if function_name is not None else func_or_coro.__name__,
+            kwargs,
+        )
+
+    if executor in (ComponentExecutor.THREAD, ComponentExecutor.PROCESS):
+        # run in a copy of the current context to keep logging context and
+        # execution configuration available in the thread
+        return await run_in_executor(  # type: ignore
+            get_thread_pool_executor(),
+            functools.partial(contextvars.copy_context().run, func_or_coro, **kwargs),
+        )
+
     return func_or_coro(**kwargs)  # type: ignore
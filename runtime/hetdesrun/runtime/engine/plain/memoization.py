@@ -0,0 +1,175 @@
+"""Memoization of the results of deterministic components across executions
+
+Components whose COMPONENT_INFO contains "deterministic": True are pure functions of
+their inputs. Their results are kept in a size bounded least recently used cache, keyed by
+a hash of the component code and fingerprints of the inputs.
+
+Inputs provided by other deterministic components are identified by the memoization key of
+the providing node instead of the actual value. Hence for a chain of deterministic components
+only the fingerprint of the data entering the chain has to be computed, and with a cache hit
+at its end none of the components of the chain is computed at all.
+
+The cache is only accessed from the event loop and is therefore not thread-safe.
+"""
+
+import copy
+import datetime
+import hashlib
+import logging
+import sys
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class NotFingerprintable(Exception):
+    pass
+
+
+def _update_fingerprint(hasher: "hashlib._Hash", value: Any) -> None:
+    hasher.update(type(value).__name__.encode("utf8"))
+    if value is None or isinstance(
+        value, bool | int | float | str | datetime.datetime | datetime.date
+    ):
+        hasher.update(repr(value).encode("utf8"))
+    elif isinstance(value, pd.DataFrame | pd.Series):
+        try:
+            hashes = pd.util.hash_pandas_object(value, index=True)
+        except TypeError as e:  # e.g. unhashable objects like lists in cells
+            raise NotFingerprintable from e
+        hasher.update(hashes.to_numpy().tobytes())
+        if isinstance(value, pd.DataFrame):
+            hasher.update(repr(list(value.columns)).encode("utf8"))
+            hasher.update(repr(list(value.dtypes)).encode("utf8"))
+        else:
+            hasher.update(repr(value.name).encode("utf8"))
+            hasher.update(repr(value.dtype).encode("utf8"))
+        hasher.update(repr(value.index.names).encode("utf8"))
+        hasher.update(repr(value.attrs).encode("utf8"))
+    elif isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise NotFingerprintable
+        hasher.update(repr((value.dtype, value.shape)).encode("utf8"))
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, list | tuple):
+        hasher.update(str(len(value)).encode("utf8"))
+        for item in value:
+            _update_fingerprint(hasher, item)
+    elif isinstance(value, dict):
+        hasher.update(str(len(value)).encode("utf8"))
+        for key in sorted(value, key=repr):
+            _update_fingerprint(hasher, key)
+            _update_fingerprint(hasher, value[key])
+    else:
+        raise NotFingerprintable
+
+
+def fingerprint_value(value: Any) -> str | None:
+    """Content based fingerprint of an input value
+
+    Pandas objects are hashed via pd.util.hash_pandas_object. Returns None for values
+    which cannot be fingerprinted reliably, e.g. instances of arbitrary classes.
+    """
+    hasher = hashlib.sha256()
+    try:
+        _update_fingerprint(hasher, value)
+    except NotFingerprintable:
+        return None
+    return hasher.hexdigest()
+
+
+def component_result_key(code: str, function_name: str | None, input_keys: dict[str, str]) -> str:
+    """Combine code, entrypoint function and input keys to the key of a result"""
+    hasher = hashlib.sha256(code.encode("utf8"))
+    hasher.update(repr(function_name).encode("utf8"))
+    for input_name in sorted(input_keys):
+        hasher.update(input_name.encode("utf8"))
+        hasher.update(input_keys[input_name].encode("utf8"))
+    return hasher.hexdigest()
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory occupied by a value in bytes"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, list | tuple):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(key) + estimate_size(item) for key, item in value.items()
+        )
+    return sys.getsizeof(value)
+
+
+def copy_result(result: dict[str, Any]) -> dict[str, Any]:
+    """Copy result values, such that consumers cannot alter cached results"""
+    return {
+        key: value.copy(deep=True)
+        if isinstance(value, pd.DataFrame | pd.Series)
+        else copy.deepcopy(value)
+        for key, value in result.items()
+    }
+
+
+class ComponentResultCache:
+    """Least recently used cache of component results bounded by their estimated size"""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, tuple[dict[str, Any], int]] = OrderedDict()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            result, _ = self._entries[key]
+        except KeyError:
+            return None
+        self._entries.move_to_end(key)
+        return copy_result(result)
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        max_size = get_config().component_result_cache_max_bytes
+        result_size = estimate_size(result)
+        if result_size > max_size:
+            logger.debug("Result of size %d is too large to be memoized.", result_size)
+            return
+        try:
+            stored_result = copy_result(result)
+        except Exception:  # noqa: BLE001
+            logger.debug("Result could not be copied and is not memoized.", exc_info=True)
+            return
+
+        self.remove(key)
+        self._entries[key] = (stored_result, result_size)
+        self.size += result_size
+        while self.size > max_size:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+
+    def remove(self, key: str) -> None:
+        if key in self._entries:
+            _, removed_size = self._entries.pop(key)
+            self.size -= removed_size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+component_result_cache = ComponentResultCache()
+
+
+def memoization_enabled() -> bool:
+    return get_config().component_result_cache_max_bytes > 0
@@ -0,0 +1,129 @@
+"""Summaries of the results of individual operators
+
+If return_individual_node_results is set in the execution configuration, the results of all
+operators are returned. Instead of their complete values, which may be huge for large
+workflows, every output is described by its type, shape, dtypes, minimum and maximum, a few
+entries from its start and end, and its estimated size. Complete values are only included
+for scalars and for operators which are explicitly selected.
+"""
+
+import json
+import logging
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from hetdesrun.models.run import NodeOutputSummary, NodeResultSummary
+from hetdesrun.runtime.engine.plain.memoization import estimate_size
+from hetdesrun.runtime.engine.plain.workflow import ComputationNode
+from hetdesrun.utils import shorten_payload
+
+logger = logging.getLogger(__name__)
+
+NODE_RESULT_SAMPLE_SIZE = 5
+MAX_PREVIEW_CHARS = 200
+
+
+def jsonable_scalar(value: Any) -> Any:
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, pd.Timestamp | np.datetime64):
+        return None if pd.isna(value) else pd.Timestamp(value).isoformat()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def pandas_sample(value: pd.Series | pd.DataFrame) -> Any:
+    try:
+        return json.loads(str(value.to_json(orient="split", date_format="iso")))
+    except (TypeError, ValueError, OverflowError):
+        logger.debug("Could not sample %s for node result summary", type(value), exc_info=True)
+        return None
+
+
+def summarize_pandas_object(value: pd.Series | pd.DataFrame, summary: dict[str, Any]) -> None:
+    summary["shape"] = list(value.shape)
+    summary["head"] = pandas_sample(value.head(NODE_RESULT_SAMPLE_SIZE))
+    summary["tail"] = pandas_sample(value.tail(NODE_RESULT_SAMPLE_SIZE))
+    if isinstance(value, pd.Series):
+        summary["dtypes"] = str(value.dtype)
+        if (
+            pd.api.types.is_numeric_dtype(value.dtype)
+            or pd.api.types.is_datetime64_any_dtype(value.dtype)
+        ) and not pd.api.types.is_bool_dtype(value.dtype):
+            summary["min"] = jsonable_scalar(value.min())
+            summary["max"] = jsonable_scalar(value.max())
+        return
+    summary["dtypes"] = {str(column): str(dtype) for column, dtype in value.dtypes.items()}
+    comparable_columns = value.select_dtypes(include=["number", "datetime", "datetimetz"])
+    if len(comparable_columns.columns) > 0:
+        summary["min"] = {
+            str(column): jsonable_scalar(minimum)
+            for column, minimum in comparable_columns.min().items()
+        }
+        summary["max"] = {
+            str(column): jsonable_scalar(maximum)
+            for column, maximum in comparable_columns.max().items()
+        }
+
+
+def summarize_array(value: np.ndarray, summary: dict[str, Any]) -> None:
+    summary["shape"] = list(value.shape)
+    summary["dtypes"] = str(value.dtype)
+    if value.dtype.kind in "biuf" and value.size > 0:
+        flat_values = value.ravel()
+        summary["head"] = flat_values[:NODE_RESULT_SAMPLE_SIZE].tolist()
+        summary["tail"] = flat_values[-NODE_RESULT_SAMPLE_SIZE:].tolist()
+        if value.dtype.kind != "b":
+            summary["min"] = jsonable_scalar(np.nanmin(value))
+            summary["max"] = jsonable_scalar(np.nanmax(value))
+
+
+def summarize_value(value: Any, include_value: bool = False) -> NodeOutputSummary:
+    """Summary of an output value of an operator
+
+    Numbers, booleans, None and short strings are always included completely. Other values
+    are only included if include_value is True.
+    """
+    summary: dict[str, Any] = {"type": type(value).__name__, "bytes": estimate_size(value)}
+    try:
+        if isinstance(value, pd.Series | pd.DataFrame):
+            summarize_pandas_object(value, summary)
+        elif isinstance(value, np.ndarray):
+            summarize_array(value, summary)
+        elif isinstance(value, list | tuple | dict):
+            summary["shape"] = [len(value)]
+    except (TypeError, ValueError):
+        logger.debug("Could not summarize %s completely", type(value), exc_info=True)
+
+    if include_value or (
+        value is None
+        or isinstance(value, bool | int | float)
+        or (isinstance(value, str) and len(value) <= MAX_PREVIEW_CHARS)
+    ):
+        summary["value"] = value
+    elif not isinstance(value, pd.Series | pd.DataFrame | np.ndarray):
+        summary["preview"] = shorten_payload(str(value), MAX_PREVIEW_CHARS)
+    return NodeOutputSummary(**summary)
+
+
+async def summarize_node_results(
+    nodes: list[ComputationNode], full_result_operator_ids: list[str]
+) -> dict[str, NodeResultSummary]:
+    """Summaries of the results of computation nodes by hierarchical operator id"""
+    full_result_operator_id_set = set(full_result_operator_ids)
+    summaries: dict[str, NodeResultSummary] = {}
+    for node in nodes:
+        include_values = node.operator_hierarchical_id in full_result_operator_id_set
+        summaries[node.operator_hierarchical_id] = NodeResultSummary(
+            operator_hierarchical_name=node.operator_hierarchical_name,
+            outputs={
+                output_name: summarize_value(value, include_value=include_values)
+                for output_name, value in (await node.result).items()
+            },
+        )
+    return summaries
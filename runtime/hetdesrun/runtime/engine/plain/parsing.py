@@ -1,9 +1,14 @@
 """Parse workflow input into data structures of plain engine"""
 
+from collections import OrderedDict
 from collections.abc import Callable, Coroutine
-from typing import cast
+from typing import NamedTuple, cast
 
-from hetdesrun.component.load import ComponentCodeImportError, import_func_from_code
+from hetdesrun.component.load import (
+    ComponentCodeImportError,
+    component_info_from_func,
+    import_func_from_code,
+)
 from hetdesrun.datatypes import DataType, NamedDataTypedValue
 from hetdesrun.models.code import CodeModule
 from hetdesrun.models.component import ComponentOutput, ComponentRevision
@@ -16,9 +21,15 @@ from hetdesrun.models.workflow import (
     WorkflowOutput,
 )
 from hetdesrun.runtime import runtime_logger
-from hetdesrun.runtime.engine.plain.workflow import ComputationNode, Node, Workflow
+from hetdesrun.runtime.engine.plain.workflow import (
+    ComputationNode,
+    Node,
+    Workflow,
+    infer_required_params,
+)
 from hetdesrun.runtime.exceptions import WorkflowInputDataValidationError
 from hetdesrun.runtime.logging import job_id_context_filter
+from hetdesrun.webservice.config import ComponentExecutor, get_config
 
 runtime_logger.addFilter(job_id_context_filter)
 
@@ -101,6 +112,115 @@ def load_func(
     return component_func
 
 
+def executor_from_component_info(
+    component_func: Coroutine | Callable, component: ComponentRevision
+) -> ComponentExecutor | None:
+    """Obtain the executor hint from the COMPONENT_INFO of the component code
+
+    Returns None if no (valid) executor is specified, i.e. the configured default applies.
+    """
+    executor_hint = component_info_from_func(component_func).get("executor", None)
+    if executor_hint is None:
+        return None
+    try:
+        return ComponentExecutor(executor_hint)
+    except ValueError:
+        runtime_logger.warning(
+            "Ignoring invalid executor %s in COMPONENT_INFO of component revision %s."
+            " Must be one of %s.",
+            str(executor_hint),
+            str(component.uuid),
+            ", ".join(x.value for x in ComponentExecutor),
+        )
+        return None
+
+
+class ComponentExecutionPlan(NamedTuple):
+    """Immutable run-independent information to compute a component revision
+
+    Everything which only depends on the component revision and its code is determined
+    once. Creating a ComputationNode from a plan only binds operator specific information.
+    """
+
+    func: Coroutine | Callable
+    required_params: tuple[str, ...]
+    executor: ComponentExecutor | None
+    code: str
+    function_name: str
+    component_name: str
+    component_tag: str
+    has_only_plot_outputs: bool
+    deterministic: bool
+    side_effects: bool
+
+
+# The key contains the code itself, since code modules with the same uuid may differ
+# between executions of draft transformations.
+ComponentExecutionPlanKey = tuple[str, str | None, str, str, str, str, bool]
+
+_component_execution_plan_cache: OrderedDict[ComponentExecutionPlanKey, ComponentExecutionPlan] = (
+    OrderedDict()
+)
+
+
+def clear_component_execution_plan_cache() -> None:
+    _component_execution_plan_cache.clear()
+
+
+def compile_component_execution_plan(
+    component: ComponentRevision, code_module_dict: dict[str, CodeModule]
+) -> ComponentExecutionPlan:
+    component_func = load_func(component, code_module_dict)
+    component_info = component_info_from_func(component_func)
+    return ComponentExecutionPlan(
+        func=component_func,
+        required_params=tuple(infer_required_params(component_func)),
+        executor=executor_from_component_info(component_func, component),
+        code=code_module_dict[str(component.code_module_uuid)].code,
+        function_name=component.function_name,
+        component_name=component.name if component.name is not None else "UNKNOWN",
+        component_tag=component.tag,
+        has_only_plot_outputs=only_plot_outputs(component.outputs),
+        deterministic=component_info.get("deterministic", False) is True,
+        side_effects=component_info.get("side_effects", False) is True,
+    )
+
+
+def obtain_component_execution_plan(
+    component: ComponentRevision, code_module_dict: dict[str, CodeModule]
+) -> ComponentExecutionPlan:
+    """Get the execution plan of a component revision from cache or compile it
+
+    Plans are cached in a least recently used manner with at most
+    execution_plan_cache_size entries.
+    """
+    cache_size = get_config().execution_plan_cache_size
+    code_module = code_module_dict.get(str(component.code_module_uuid), None)
+    if cache_size == 0 or code_module is None:
+        # missing code modules are reported by load_func
+        return compile_component_execution_plan(component, code_module_dict)
+
+    key: ComponentExecutionPlanKey = (
+        str(component.uuid),
+        component.name,
+        component.tag,
+        component.function_name,
+        str(component.code_module_uuid),
+        code_module.code,
+        only_plot_outputs(component.outputs),
+    )
+    try:
+        plan = _component_execution_plan_cache[key]
+    except KeyError:
+        plan = compile_component_execution_plan(component, code_module_dict)
+        _component_execution_plan_cache[key] = plan
+        while len(_component_execution_plan_cache) > cache_size:
+            _component_execution_plan_cache.popitem(last=False)
+    else:
+        _component_execution_plan_cache.move_to_end(key)
+    return plan
+
+
 def parse_component_node(
     component_node: ComponentNode,
     component_dict: dict[str, ComponentRevision],
@@ -110,7 +230,8 @@ def parse_component_node(
 ) -> ComputationNode:
     """Parse component node into a ComputationNode
 
-    Includes importing and loading of component function
+    Includes importing and loading of component function if no execution plan of the
+    component revision is cached.
     """
     component_node_name = component_node.name if component_node.name is not None else "UNKNOWN"
     try:
@@ -124,20 +245,26 @@ def parse_component_node(
         runtime_logger.warning(msg)
         raise ComponentRevisionDoesNotExist(msg) from e
 
-    # Load entrypoint function
-    component_func = load_func(comp_rev, code_module_dict)
+    plan = obtain_component_execution_plan(comp_rev, code_module_dict)
 
     return ComputationNode(
-        func=component_func,
+        func=plan.func,
         component_id=component_node.component_uuid,
-        component_name=comp_rev.name if comp_rev.name is not None else "UNKNOWN",
-        component_tag=comp_rev.tag,
+        component_name=plan.component_name,
+        component_tag=plan.component_tag,
         operator_hierarchical_name=name_prefix + component_node_name + HIERARCHY_SEPARATOR
         if name_prefix != ""
         else component_node_name,
         inputs=None,  # inputs are added later by the surrounding workflow
-        has_only_plot_outputs=only_plot_outputs(comp_rev.outputs),
+        has_only_plot_outputs=plan.has_only_plot_outputs,
         operator_hierarchical_id=id_prefix + component_node.id + HIERARCHY_SEPARATOR,
+        executor=plan.executor,
+        code=plan.code,
+        function_name=plan.function_name,
+        required_params=list(plan.required_params),
+        deterministic=plan.deterministic,
+        # components without outputs can only be useful due to their side effects
+        has_side_effects=plan.side_effects or len(comp_rev.outputs) == 0,
     )
 
 
@@ -0,0 +1,184 @@
+"""Profiling of individual operators of a workflow execution
+
+If requested via the profile_operators execution configuration, every computation node of
+a component measures wall time, CPU time, memory peak and the sizes of its inputs and outputs
+while it runs. The memory peak is only measured for operators which do not run at the same
+time as other operators. The resulting OperatorProfile objects are returned with the
+execution result.
+
+Additionally the measurements can be exported as Prometheus metrics, which requires the
+optional prometheus_client package.
+"""
+
+import logging
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from hetdesrun.models.run import ConfigurationInput, DataSize, OperatorProfile
+from hetdesrun.runtime.context import ExecutionContext
+from hetdesrun.runtime.engine.plain.memoization import estimate_size
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+def profiling_requested(configuration: ConfigurationInput) -> bool:
+    return configuration.profile_operators or get_config().export_operator_metrics
+
+
+def measure_data_size(value: Any) -> DataSize:
+    rows: int | None = None
+    if isinstance(value, pd.DataFrame | pd.Series | list | tuple):
+        rows = len(value)
+    elif isinstance(value, np.ndarray):
+        rows = value.shape[0] if value.ndim > 0 else None
+    return DataSize(rows=rows, bytes=estimate_size(value))
+
+
+class OperatorMeasurement:
+    """Measures the computation of one operator
+
+    Time and memory are measured while the measurement is running, which should only cover
+    the actual component code, i.e. not the computation of nodes providing its inputs.
+
+    The peak memory traced by tracemalloc is global to the process and resetting it affects
+    all running measurements. Hence the memory peak is only reported for measurements which
+    did not overlap with other measurements, e.g. of operators run via concurrent node
+    scheduling or of other executions in the same process.
+    """
+
+    _running_measurements: set["OperatorMeasurement"] = set()
+
+    def __init__(self) -> None:
+        self.wall_time_seconds = 0.0
+        self.cpu_time_seconds = 0.0
+        self.peak_memory_bytes: int | None = None
+        self.overlapped = False
+
+    @contextmanager
+    def running(self) -> Iterator[None]:
+        running_measurements = OperatorMeasurement._running_measurements
+        if len(running_measurements) > 0:
+            self.overlapped = True
+            for measurement in running_measurements:
+                measurement.overlapped = True
+        running_measurements.add(self)
+
+        memory_before: int | None = None
+        if tracemalloc.is_tracing() and not self.overlapped:
+            memory_before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.wall_time_seconds = time.perf_counter() - wall_start
+            self.cpu_time_seconds = time.process_time() - cpu_start
+            running_measurements.discard(self)
+            if memory_before is not None and tracemalloc.is_tracing() and not self.overlapped:
+                self.peak_memory_bytes = max(tracemalloc.get_traced_memory()[1] - memory_before, 0)
+
+    def to_profile(
+        self,
+        context: ExecutionContext,
+        input_values: dict[str, Any],
+        function_result: dict[str, Any],
+        memoized: bool,
+    ) -> OperatorProfile:
+        return OperatorProfile(
+            operator_hierarchical_id=context.currently_executed_operator_hierarchical_id,
+            operator_hierarchical_name=context.currently_executed_operator_hierarchical_name,
+            transformation_id=context.currently_executed_transformation_id,
+            transformation_name=context.currently_executed_transformation_name,
+            transformation_tag=context.currently_executed_transformation_tag,
+            wall_time_seconds=self.wall_time_seconds,
+            cpu_time_seconds=self.cpu_time_seconds,
+            peak_memory_bytes=self.peak_memory_bytes,
+            memoized=memoized,
+            input_sizes={name: measure_data_size(value) for name, value in input_values.items()},
+            output_sizes={
+                name: measure_data_size(value) for name, value in function_result.items()
+            },
+        )
+
+
+@contextmanager
+def memory_tracing(active: bool) -> Iterator[None]:
+    """Trace memory allocations via tracemalloc if active and not already tracing"""
+    start_tracing = active and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if start_tracing:
+            tracemalloc.stop()
+
+
+_prometheus_metrics: dict[str, Any] | None = None
+
+
+def _get_prometheus_metrics() -> dict[str, Any] | None:
+    global _prometheus_metrics  # noqa: PLW0603
+    if _prometheus_metrics is None:
+        try:
+            from prometheus_client import Counter, Histogram
+        except ModuleNotFoundError:
+            logger.warning(
+                "Operator metrics export is configured, but prometheus_client is not installed."
+                " Add prometheus_client to the runtime dependencies to export operator metrics."
+            )
+            _prometheus_metrics = {}
+            return None
+        labels = ["transformation_id", "transformation_name", "operator_hierarchical_name"]
+        _prometheus_metrics = {
+            "wall_time": Histogram(
+                "hd_operator_wall_time_seconds",
+                "Duration of running the component code of an operator",
+                labels,
+            ),
+            "cpu_time": Counter(
+                "hd_operator_cpu_time_seconds",
+                "CPU time of the runtime process while the component code of an operator ran",
+                labels,
+            ),
+            "output_bytes": Histogram(
+                "hd_operator_output_bytes",
+                "Estimated memory size of all outputs of an operator",
+                labels,
+                buckets=[10**exponent for exponent in range(2, 11)],
+            ),
+            "memoized": Counter(
+                "hd_operator_memoized_total",
+                "Number of operator computations which used a memoized result",
+                labels,
+            ),
+        }
+    return _prometheus_metrics if len(_prometheus_metrics) > 0 else None
+
+
+def export_operator_metrics(operator_profiles: dict[str, OperatorProfile]) -> None:
+    """Record operator profiles in Prometheus metrics if prometheus_client is available"""
+    metrics = _get_prometheus_metrics()
+    if metrics is None:
+        return
+    for profile in operator_profiles.values():
+        labels = (
+            profile.transformation_id,
+            profile.transformation_name,
+            profile.operator_hierarchical_name,
+        )
+        metrics["wall_time"].labels(*labels).observe(profile.wall_time_seconds)
+        metrics["cpu_time"].labels(*labels).inc(max(profile.cpu_time_seconds, 0.0))
+        metrics["output_bytes"].labels(*labels).observe(
+            sum(size.bytes for size in profile.output_sizes.values())
+        )
+        if profile.memoized:
+            metrics["memoized"].labels(*labels).inc()
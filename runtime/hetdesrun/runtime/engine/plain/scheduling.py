@@ -0,0 +1,128 @@
+"""Concurrent scheduling of the computation nodes of a parsed workflow
+
+By default the plain engine evaluates a workflow lazily: requesting the result of
+the workflow requests the results of the nodes providing its outputs, which in turn
+request the results of the nodes providing their inputs, one after another.
+Independent branches of a workflow therefore never overlap.
+
+The scheduler in this module instead sorts all computation nodes topologically once
+and computes every node whose input providing nodes are finished concurrently.
+Since node results are cached, requesting the workflow result afterwards only
+collects the already computed outputs.
+"""
+
+import asyncio
+from typing import Any
+
+from hetdesrun.runtime import runtime_execution_logger
+from hetdesrun.runtime.engine.plain.workflow import (
+    ComputationNode,
+    Workflow,
+    obtain_all_nodes,
+    obtain_demanded_nodes,
+    resolve_providing_computation_node,
+)
+from hetdesrun.runtime.exceptions import CircularDependency
+from hetdesrun.runtime.logging import execution_context_filter
+
+
+def obtain_node_dependencies(
+    nodes: list[ComputationNode],
+) -> dict[ComputationNode, set[ComputationNode]]:
+    """Map each computation node to the computation nodes providing its inputs"""
+    return {
+        node: {
+            resolved[0]
+            for (another_node, output_name) in node.inputs.values()
+            if (resolved := resolve_providing_computation_node(another_node, output_name))
+            is not None
+        }
+        for node in nodes
+    }
+
+
+def obtain_nodes_to_schedule(
+    workflow: Workflow, run_pure_plot_operators: bool = True, prune_unused_operators: bool = False
+) -> dict[ComputationNode, set[ComputationNode]]:
+    """Determine the nodes to compute together with their scheduled dependencies
+
+    The demanded nodes (see obtain_demanded_nodes) and all nodes they depend on are
+    scheduled, i.e. exactly those nodes which would be computed by lazy evaluation.
+    """
+    all_nodes = obtain_all_nodes(workflow)
+    dependencies = obtain_node_dependencies(all_nodes)
+
+    to_visit = obtain_demanded_nodes(workflow, run_pure_plot_operators, prune_unused_operators)
+    scheduled: set[ComputationNode] = set()
+    while len(to_visit) > 0:
+        node = to_visit.pop()
+        # nodes outside of the workflow are left to lazy evaluation
+        if node in scheduled or node not in dependencies:
+            continue
+        scheduled.add(node)
+        to_visit.extend(dependencies[node])
+
+    # keep order of appearance for reproducible scheduling
+    return {node: dependencies[node] & scheduled for node in all_nodes if node in scheduled}
+
+
+async def _compute_node(node: ComputationNode) -> dict[str, Any]:
+    execution_context_filter.isolate_context()
+    return await node.result
+
+
+async def run_nodes_concurrently(
+    workflow: Workflow,
+    max_concurrent_nodes: int,
+    run_pure_plot_operators: bool = True,
+    prune_unused_operators: bool = False,
+) -> None:
+    """Compute all nodes of the workflow with at most max_concurrent_nodes running at once
+
+    Nodes are started as soon as all nodes providing their inputs are finished.
+    The first exception raised by a node cancels all other running nodes and is re-raised.
+    """
+    dependencies = obtain_nodes_to_schedule(
+        workflow, run_pure_plot_operators, prune_unused_operators
+    )
+
+    consumers: dict[ComputationNode, list[ComputationNode]] = {node: [] for node in dependencies}
+    for node, providing_nodes in dependencies.items():
+        for providing_node in providing_nodes:
+            consumers[providing_node].append(node)
+
+    missing_counts = {node: len(providing_nodes) for node, providing_nodes in dependencies.items()}
+    ready = [node for node, count in missing_counts.items() if count == 0]
+    running: dict[asyncio.Task, ComputationNode] = {}
+    finished_count = 0
+
+    while len(ready) > 0 or len(running) > 0:
+        while len(ready) > 0 and len(running) < max_concurrent_nodes:
+            node = ready.pop(0)
+            running[asyncio.create_task(_compute_node(node))] = node
+
+        done, _pending = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+
+        for task in done:
+            node = running.pop(task)
+            if (exc := task.exception()) is not None:
+                for other_task in running:
+                    other_task.cancel()
+                await asyncio.gather(*running.keys(), return_exceptions=True)
+                raise exc
+
+            finished_count += 1
+            for consumer in consumers[node]:
+                missing_counts[consumer] -= 1
+                if missing_counts[consumer] == 0:
+                    ready.append(consumer)
+
+    if finished_count < len(dependencies):
+        blocked_node = next(node for node, count in missing_counts.items() if count > 0)
+        msg = (
+            f"Circular Dependency detected: {len(dependencies) - finished_count} operators"
+            " could not be scheduled since they depend on each other, for example operator"
+            f" {blocked_node.operator_hierarchical_id}"
+        )
+        runtime_execution_logger.warning(msg)
+        raise CircularDependency(msg).set_context(blocked_node.context)
@@ -1,4 +1,5 @@
 from collections.abc import Callable, Coroutine
+from contextlib import nullcontext
 from inspect import Parameter, signature
 from typing import Any, Protocol, TypeVar
 
@@ -6,11 +7,18 @@ from asyncstdlib.functools import cached_property  # async compatible variant
 from pydantic import ValidationError
 
 from hetdesrun.datatypes import NamedDataTypedValue, parse_dynamically_from_datatypes
-from hetdesrun.models.run import HIERARCHY_SEPARATOR, ConfigurationInput
+from hetdesrun.models.run import HIERARCHY_SEPARATOR, ConfigurationInput, OperatorProfile
 from hetdesrun.runtime import runtime_execution_logger
 from hetdesrun.runtime.configuration import execution_config
 from hetdesrun.runtime.context import ExecutionContext
 from hetdesrun.runtime.engine.plain.execution import run_func_or_coroutine
+from hetdesrun.runtime.engine.plain.memoization import (
+    component_result_cache,
+    component_result_key,
+    fingerprint_value,
+    memoization_enabled,
+)
+from hetdesrun.runtime.engine.plain.profiling import OperatorMeasurement, profiling_requested
 from hetdesrun.runtime.exceptions import (
     CircularDependency,
     ComponentException,
@@ -22,6 +30,7 @@ from hetdesrun.runtime.exceptions import (
 )
 from hetdesrun.runtime.logging import execution_context_filter
 from hetdesrun.utils import Type
+from hetdesrun.webservice.config import ComponentExecutor
 
 runtime_execution_logger.addFilter(execution_context_filter)
 
@@ -42,6 +51,9 @@ class Node(Protocol):
     operator_hierarchical_id: str = "UNKNOWN"
     operator_hierarchical_name: str = "UNKNOWN"
     context: ExecutionContext
+    # number of consumers which did not read the result yet, None if the result is retained
+    remaining_consumers: int | None = None
+    result_released: bool = False
 
     @cached_property
     async def result(self) -> dict[str, Any]:  # Outputs can have any type
@@ -50,6 +62,17 @@ class Node(Protocol):
     def add_inputs(self, new_inputs: dict[str, tuple["Node", str]]) -> None: ...
 
 
+def infer_required_params(func: Coroutine | Callable) -> list[str]:
+    """Infer the function params which are actually required (i.e. no default value)"""
+    kwargable_params = [
+        param
+        for param in signature(func).parameters.values()  # type: ignore
+        if (param.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY))
+    ]
+    # only non-default-valued params are required:
+    return [param.name for param in kwargable_params if param.default is Parameter.empty]
+
+
 class ComputationNode:
     """Represents a function computation with multiple outputs together with input information
 
@@ -78,6 +101,12 @@ class ComputationNode:
         component_tag: str = "UNKNOWN",
         operator_hierarchical_id: str = "UNKNOWN",
         operator_hierarchical_name: str = "UNKNOWN",
+        executor: ComponentExecutor | None = None,
+        code: str | None = None,
+        function_name: str | None = None,
+        required_params: list[str] | None = None,
+        deterministic: bool = False,
+        has_side_effects: bool = False,
     ) -> None:
         """
         inputs is a dict {input_name : (another_node, output_name)}, i.e. mapping input names to
@@ -89,6 +118,18 @@ class ComputationNode:
         operator_hierarchical_id, component_id, operator_hierarchical_name and component_name can be
         provided to enrich logging and exception messages.
 
+        executor determines where func is run if it is a synchronous function. If it is None the
+        configured default executor is used. Running func in a process pool requires the code
+        of the module func is defined in and the function_name under which it can be imported.
+
+        required_params can be provided if they are already known to avoid inspecting func.
+
+        Results of deterministic nodes, i.e. nodes whose func is a pure function of its inputs,
+        are memoized across executions if a component result cache is configured.
+
+        Nodes with side effects, e.g. storing an object, are run even if no workflow output
+        depends on them when unused operators are pruned.
+
         The computation node inputs may or may not be complete, i.e. all required inputs are given
         or not. If not complete, computation of result may simply fail, e.g. with
             TypeError: <lambda>() missing 1 required positional argument: 'base_value'
@@ -105,8 +146,21 @@ class ComputationNode:
             self.add_inputs(inputs)
 
         self.func = func
-
-        self.required_params = self._infer_required_params()
+        self.executor = executor
+        self.code = code
+        self.function_name = function_name
+        self.deterministic = deterministic
+        self.has_side_effects = has_side_effects
+        self._memoization_key: str | None = None
+        self._memoization_key_determined = False
+        self.profile: OperatorProfile | None = None
+        self.remaining_consumers: int | None = None
+        self.result_released = False
+        self.result_requested = False
+
+        self.required_params = (
+            required_params if required_params is not None else self._infer_required_params()
+        )
 
         self._in_computation = False  # to detect cycles
 
@@ -130,13 +184,7 @@ class ComputationNode:
 
     def _infer_required_params(self) -> list[str]:
         """Infer the function params which are actually required (i.e. no default value)"""
-        kwargable_params = [
-            param
-            for param in signature(self.func).parameters.values()  # type: ignore
-            if (param.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY))
-        ]
-        # only non-default-valued params are required:
-        return [param.name for param in kwargable_params if param.default is Parameter.empty]
+        return infer_required_params(self.func)
 
     def all_required_inputs_set(self) -> bool:
         return set(self.required_params).issubset(set(self.inputs.keys()))
@@ -182,12 +230,54 @@ class ComputationNode:
                 ).set_context(self.context) from exc
         return input_value_dict
 
+    async def memoization_key(self) -> str | None:
+        """Key identifying the result of this node across executions
+
+        None if the node is not deterministic, memoization is disabled or some input
+        cannot be fingerprinted. Inputs provided by deterministic nodes are identified by
+        their memoization keys, such that these nodes do not need to be computed.
+        """
+        if not (self.deterministic and self.code is not None and memoization_enabled()):
+            return None
+        if not self._memoization_key_determined:
+            self._memoization_key = await self._determine_memoization_key(self.code)
+            self._memoization_key_determined = True
+        return self._memoization_key
+
+    async def _determine_memoization_key(self, code: str) -> str | None:
+        if not self.all_required_inputs_set():
+            return None
+        input_keys: dict[str, str] = {}
+        for input_name, (another_node, output_name) in self.inputs.items():
+            resolved = resolve_providing_computation_node(another_node, output_name)
+            # cycles and invalid wirings are left to the actual computation
+            if resolved is None or resolved[0]._in_computation:
+                return None
+            providing_node, providing_output_name = resolved
+            providing_node_key = await providing_node.memoization_key()
+            if providing_node_key is not None:
+                input_keys[input_name] = providing_node_key + providing_output_name
+                continue
+            try:
+                value_fingerprint = fingerprint_value(
+                    (await providing_node.result)[providing_output_name]
+                )
+            except KeyError:
+                return None
+            if value_fingerprint is None:
+                return None
+            input_keys[input_name] = value_fingerprint
+        return component_result_key(code, self.function_name, input_keys)
+
     async def _run_comp_func(self, input_values: dict[str, Any]) -> dict[str, Any]:
         """Running the component func with exception handling"""
         try:
             function_result: dict[str, Any] = await run_func_or_coroutine(
                 self.func,  # type: ignore
                 input_values,
+                executor=self.executor,
+                code=self.code,
+                function_name=self.function_name,
             )
             function_result = function_result if function_result is not None else {}
         except Exception as exc:  # uncaught exceptions from user code  # noqa: BLE001
@@ -217,6 +307,9 @@ class ComputationNode:
         return function_result
 
     async def _compute_result(self) -> dict[str, Any]:
+        check_result_not_released(self)
+        self.result_requested = True
+
         # set filter for contextualized logging
         execution_context_filter.bind_context(**self.context.dict())
 
@@ -225,11 +318,38 @@ class ComputationNode:
 
         self._check_inputs()
 
-        # Gather data from input sources (detects cycles):
-        input_values = await self._gather_data_from_inputs()
+        # only nodes of components are profiled, not the nodes providing constant data
+        profiling = self.code is not None and profiling_requested(
+            execution_config.get(ConfigurationInput())
+        )
+        measurement = OperatorMeasurement()
 
-        # Actual execution of current node
-        function_result = await self._run_comp_func(input_values)
+        memoization_key = await self.memoization_key()
+        memoized_result = (
+            component_result_cache.get(memoization_key) if memoization_key is not None else None
+        )
+        if memoized_result is not None:
+            runtime_execution_logger.info("Using memoized result of deterministic component")
+            input_values: dict[str, Any] = {}
+            function_result = memoized_result
+        else:
+            # Gather data from input sources (detects cycles):
+            input_values = await self._gather_data_from_inputs()
+
+            # Actual execution of current node
+            with measurement.running() if profiling else nullcontext():
+                function_result = await self._run_comp_func(input_values)
+
+            if memoization_key is not None:
+                component_result_cache.put(memoization_key, function_result)
+
+        for providing_node in {another_node for another_node, _ in self.inputs.values()}:
+            notify_result_consumed(providing_node)
+
+        if profiling:
+            self.profile = measurement.to_profile(
+                self.context, input_values, function_result, memoized=memoized_result is not None
+            )
 
         # cleanup
         self._in_computation = False
@@ -295,6 +415,8 @@ class Workflow:
             self.add_inputs(inputs)
 
         self._in_computation: bool = False
+        self.remaining_consumers: int | None = None
+        self.result_released = False
         self.has_only_plot_outputs = has_only_plot_outputs
         self.operator_hierarchical_id = operator_hierarchical_id
         self.operator_hierarchical_name = operator_hierarchical_name
@@ -340,6 +462,8 @@ class Workflow:
             + id_suffix
             + HIERARCHY_SEPARATOR,
             operator_hierarchical_id=self.operator_hierarchical_id + "" + HIERARCHY_SEPARATOR,
+            # providing constant values is cheap
+            executor=ComponentExecutor.EVENT_LOOP,
         )
         if add_new_provider_node_to_workflow:  # make it part of the workflow
             self.sub_nodes.append(Const_Node)
@@ -365,6 +489,7 @@ class Workflow:
     @cached_property
     async def result(self: Node | WorkflowType) -> dict[str, Any]:
         assert isinstance(self, Workflow)  # for mypy # noqa: S101
+        check_result_not_released(self)
         self._wire_workflow_inputs()
 
         execution_context_filter.bind_context(**self.context.dict())
@@ -402,12 +527,93 @@ class Workflow:
             except RuntimeExecutionError as e:
                 raise e
 
+        for sub_node in {sub_node for sub_node, _ in self.output_mappings.values()}:
+            notify_result_consumed(sub_node)
+
         # cleanup
         execution_context_filter.clear_context()
 
         return results
 
 
+def check_result_not_released(node: Node) -> None:
+    if node.result_released:
+        msg = "The result of the operator was requested after it was released."
+        runtime_execution_logger.warning(msg)
+        raise RuntimeExecutionError(msg).set_context(node.context)
+
+
+def release_result(node: Node) -> None:
+    """Drop the cached result of the node
+
+    Afterwards the result cannot be obtained anymore. Does nothing if the node has not been
+    computed yet.
+    """
+    try:
+        del node.result
+    except AttributeError:  # not computed
+        return
+    node.result_released = True
+
+
+def notify_result_consumed(node: Node) -> None:
+    """Called by every consumer of a node after reading its result
+
+    The result of the node is released when its last consumer has read it, unless it
+    is retained.
+
+    Consumers using a memoized result notify their providing nodes without reading their
+    results. If no consumer requested the result of a computation node without side effects,
+    the node is skipped: its result is marked as released, so that it is not computed
+    anymore, and its providing nodes are notified in turn. Hence a memoized result skips all
+    upstream nodes which are only needed by memoized or skipped nodes. This does not extend
+    beyond nested workflows, since they are consumers of their own inputs.
+    """
+    if node.remaining_consumers is None:
+        return
+    node.remaining_consumers -= 1
+    if node.remaining_consumers > 0:
+        return
+    if isinstance(node, ComputationNode) and not (
+        node.result_requested or node.has_side_effects or node.result_released
+    ):
+        node.result_released = True
+        for providing_node in {another_node for another_node, _ in node.inputs.values()}:
+            notify_result_consumed(providing_node)
+        return
+    release_result(node)
+
+
+def track_result_consumers(workflow: Workflow) -> None:
+    """Count the consumers of every node of the workflow
+
+    Consumers of a node are the computation nodes with an input provided by it and the
+    workflow mapping its outputs to workflow outputs. Afterwards the result of every node
+    is released as soon as all its consumers have read it, such that large intermediate
+    results do not stay in memory until the end of the execution.
+
+    The result of the workflow itself is retained. Must be called after all inputs are wired.
+    """
+    consumers: dict[Node, set[Node]] = {}
+
+    def collect_consumers(wf: Workflow) -> None:
+        for sub_node in wf.sub_nodes:
+            consumers.setdefault(sub_node, set())
+            if isinstance(sub_node, Workflow):
+                collect_consumers(sub_node)
+            else:
+                assert isinstance(sub_node, ComputationNode)  # hint for mypy  # noqa: S101
+                for another_node, _ in sub_node.inputs.values():
+                    consumers.setdefault(another_node, set()).add(sub_node)
+        for sub_node, _ in wf.output_mappings.values():
+            consumers.setdefault(sub_node, set()).add(wf)
+
+    collect_consumers(workflow)
+    for node, node_consumers in consumers.items():
+        if node is not workflow:
+            node.remaining_consumers = len(node_consumers)
+
+
 def obtain_all_nodes(wf: Workflow) -> list[ComputationNode]:
     all_nodes: list[ComputationNode] = []
     for node in wf.sub_nodes:
@@ -417,3 +623,55 @@ def obtain_all_nodes(wf: Workflow) -> list[ComputationNode]:
             assert isinstance(node, ComputationNode)  # hint for mypy  # noqa: S101
             all_nodes.append(node)
     return all_nodes
+
+
+def pruning_requested(configuration: ConfigurationInput) -> bool:
+    return configuration.prune_unused_operators and not configuration.return_individual_node_results
+
+
+def obtain_demanded_nodes(
+    wf: Workflow, run_pure_plot_operators: bool = True, prune_unused_operators: bool = False
+) -> list[ComputationNode]:
+    """Computation nodes whose results are requested directly during an execution
+
+    All other computation nodes are only run if a demanded node depends on them. Without
+    pruning every node is demanded. With pruning only the nodes providing the outputs of the
+    workflow and nodes with side effects are demanded, such that branches which do not
+    contribute to any of them are not run at all.
+
+    Pure plot operators are only demanded if run_pure_plot_operators is True.
+    """
+    all_nodes = obtain_all_nodes(wf)
+    if not prune_unused_operators:
+        candidates = all_nodes
+    else:
+        candidates = [
+            resolved[0]
+            for sub_node, output_name in wf.output_mappings.values()
+            if not (sub_node.has_only_plot_outputs is True and run_pure_plot_operators is False)
+            and (resolved := resolve_providing_computation_node(sub_node, output_name)) is not None
+        ] + [node for node in all_nodes if node.has_side_effects]
+
+    demanded: dict[ComputationNode, None] = {}  # ordered set
+    for node in candidates:
+        if run_pure_plot_operators or node.has_only_plot_outputs is False:
+            demanded[node] = None
+    return list(demanded)
+
+
+def resolve_providing_computation_node(
+    node: Node, output_name: str
+) -> tuple[ComputationNode, str] | None:
+    """Follow output mappings of (nested) workflows to the actually computing node
+
+    Returns None if the output cannot be resolved. The lazy evaluation of the
+    corresponding node then raises the appropriate exception.
+    """
+    while isinstance(node, Workflow):
+        try:
+            node, output_name = node.output_mappings[output_name]
+        except KeyError:
+            return None
+    if not isinstance(node, ComputationNode):
+        return None
+    return node, output_name
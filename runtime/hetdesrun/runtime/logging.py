@@ -71,6 +71,15 @@ class ExecutionContextFilter(logging.Filter):
     def clear_context(self) -> None:
         _WF_EXEC_LOGGING_CONTEXT_VAR.set({})
 
+    def isolate_context(self) -> None:
+        """Replace the context by a copy
+
+        asyncio tasks inherit a reference to the same context dictionary.
+        Calling this at the beginning of a task avoids that concurrently running
+        tasks overwrite each other's context.
+        """
+        _WF_EXEC_LOGGING_CONTEXT_VAR.set(dict(_get_execution_context()))
+
     def get_value(self, key: str) -> str | None:
         context_dict = _get_execution_context()
         return context_dict.get(key, None)
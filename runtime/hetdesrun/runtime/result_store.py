@@ -0,0 +1,156 @@
+"""Store for large outputs of executions
+
+If result_handle_min_rows is set in the execution configuration, Series and DataFrame outputs
+with at least that many rows are written as Arrow IPC files to the result store directory of
+the runtime. The execution result then only contains a result handle for such an output,
+instead of the complete data in its JSON.
+
+Stored results are memory mapped when they are read, such that pages of rows can be served
+by the /engine/results endpoint without loading the complete result. Results are removed
+after the configured retention time.
+
+The result store is a directory local to the runtime instance which executed the workflow.
+The backend does not proxy the /engine/results endpoints, so with several runtime instances
+the directory must be shared between them or downloads must reach the same instance.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Literal
+from uuid import UUID, uuid4
+
+import pandas as pd
+import pyarrow as pa
+from pydantic import BaseModel, Field
+
+from hetdesrun.runtime.transport import pandas_to_arrow_table
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+RESULT_HANDLE_KEY = "__hd_result_handle__"
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+ARROW_FILE_MEDIA_TYPE = "application/vnd.apache.arrow.file"
+
+_RESULT_FILE_SUFFIX = ".arrow"
+
+
+class ResultNotFoundError(Exception):
+    pass
+
+
+class ResultHandle(BaseModel):
+    """Reference to an output stored in the result store of the runtime"""
+
+    hd_result_handle__: Literal["SERIES", "DATAFRAME"] = Field(..., alias=RESULT_HANDLE_KEY)
+    id: UUID = Field(  # noqa: A003
+        ..., description="Download the data via the /engine/results/{id} endpoint."
+    )
+    num_rows: int
+    columns: list[str] | None = Field(None, description="Column names of DataFrames.")
+    size_bytes: int = Field(..., description="Size of the stored Arrow IPC file.")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+def result_file_path(result_id: UUID) -> Path:
+    return Path(get_config().result_store_directory) / (str(result_id) + _RESULT_FILE_SUFFIX)
+
+
+def remove_expired_results() -> None:
+    directory = Path(get_config().result_store_directory)
+    expiry_time = time.time() - get_config().result_store_retention_seconds
+    if not directory.is_dir():
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(_RESULT_FILE_SUFFIX) and entry.stat().st_mtime < expiry_time:
+                Path(entry.path).unlink(missing_ok=True)
+
+
+def store_result(value: pd.Series | pd.DataFrame) -> ResultHandle:
+    """Write a Pandas object to the result store
+
+    The file is written under a temporary name first, so that incomplete files are never
+    served. Raises if the object cannot be represented in Arrow.
+    """
+    table = pandas_to_arrow_table(value)
+    result_id = uuid4()
+    path = result_file_path(result_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    remove_expired_results()
+
+    temporary_path = path.with_suffix(".tmp")
+    with (
+        pa.OSFile(str(temporary_path), "wb") as sink,
+        pa.ipc.new_file(sink, table.schema) as writer,
+    ):
+        writer.write_table(table)
+    temporary_path.replace(path)
+
+    return ResultHandle(
+        hd_result_handle__="SERIES" if isinstance(value, pd.Series) else "DATAFRAME",
+        id=result_id,
+        num_rows=table.num_rows,
+        columns=[str(column) for column in value.columns]
+        if isinstance(value, pd.DataFrame)
+        else None,
+        size_bytes=path.stat().st_size,
+    )
+
+
+def load_result_table(result_id: UUID) -> pa.Table:
+    """Memory mapped Arrow table of a stored result
+
+    Slicing the returned table does not copy any data.
+    """
+    path = result_file_path(result_id)
+    if not path.is_file():
+        raise ResultNotFoundError(f"Found no stored result with id {result_id}.")
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+def delete_result(result_id: UUID) -> None:
+    path = result_file_path(result_id)
+    if not path.is_file():
+        raise ResultNotFoundError(f"Found no stored result with id {result_id}.")
+    path.unlink(missing_ok=True)
+
+
+def store_large_outputs(outputs: dict[str, Any], min_rows: int | None) -> dict[str, Any]:
+    """Replace Pandas outputs with at least min_rows rows by result handles
+
+    Outputs which cannot be stored, e.g. DataFrames with columns of mixed types,
+    are kept as they are.
+    """
+    if min_rows is None:
+        return outputs
+
+    stored_outputs: dict[str, Any] = {}
+    for name, value in outputs.items():
+        if isinstance(value, pd.Series | pd.DataFrame) and len(value) >= min_rows:
+            try:
+                stored_outputs[name] = store_result(value).dict(by_alias=True)
+                continue
+            except (pa.ArrowException, TypeError, ValueError, OSError):
+                logger.warning(
+                    "Could not store output %s in result store, returning it directly.",
+                    name,
+                    exc_info=True,
+                )
+        stored_outputs[name] = value
+    return stored_outputs
+
+
+async def store_large_outputs_in_thread(
+    outputs: dict[str, Any], min_rows: int | None
+) -> dict[str, Any]:
+    """Run store_large_outputs in a thread to not block the event loop while writing files"""
+    if min_rows is None:
+        return outputs
+    return await asyncio.to_thread(store_large_outputs, outputs, min_rows)
@@ -1,8 +1,10 @@
-from fastapi.encoders import jsonable_encoder
+import logging
+from functools import partial
 
 from hetdesrun.adapters import AdapterHandlingException
 from hetdesrun.datatypes import NamedDataTypedValue
 from hetdesrun.models.run import (
+    NodeResultSummary,
     PerformanceMeasuredStep,
     ProcessStage,
     WorkflowExecutionInput,
@@ -14,16 +16,25 @@ from hetdesrun.runtime import (
     UnexpectedComponentException,
     runtime_logger,
 )
+from hetdesrun.runtime.chunking import chunked_runtime_service
 from hetdesrun.runtime.configuration import execution_config
 from hetdesrun.runtime.engine.plain import workflow_execution_plain
+from hetdesrun.runtime.engine.plain.node_results import summarize_node_results
 from hetdesrun.runtime.engine.plain.parsing import (
     WorkflowParsingException,
     parse_workflow_input,
 )
-from hetdesrun.runtime.engine.plain.workflow import obtain_all_nodes
+from hetdesrun.runtime.engine.plain.profiling import memory_tracing, profiling_requested
+from hetdesrun.runtime.engine.plain.workflow import (
+    obtain_all_nodes,
+    obtain_demanded_nodes,
+    pruning_requested,
+    release_result,
+)
 from hetdesrun.runtime.exceptions import WorkflowInputDataValidationError
 from hetdesrun.runtime.logging import execution_context_filter, job_id_context_filter
-from hetdesrun.utils import model_to_pretty_json_str
+from hetdesrun.runtime.result_store import store_large_outputs_in_thread
+from hetdesrun.utils import log_payload, model_to_pretty_json_str
 from hetdesrun.wiring import (
     resolve_and_load_data_from_wiring,
     resolve_and_send_data_from_wiring,
@@ -39,6 +50,10 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
 
     This function is used by the runtime endpoint
     """
+    if runtime_input.configuration.chunking is not None:
+        return await chunked_runtime_service(
+            runtime_input, runtime_input.configuration.chunking, runtime_service
+        )
 
     runtime_service_measured_step = PerformanceMeasuredStep.create_and_begin("RUNTIME_SERVICE")
 
@@ -49,9 +64,20 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
         root_trafo_id=runtime_input.trafo_id,
     )
 
+    # rendering the complete input can take long, hence it is only logged at DEBUG level
     runtime_logger.info(
+        "Executing workflow of trafo %s with %d components, %d input wirings"
+        " and %d output wirings",
+        str(runtime_input.trafo_id),
+        len(runtime_input.components),
+        len(runtime_input.workflow_wiring.input_wirings),
+        len(runtime_input.workflow_wiring.output_wirings),
+    )
+    log_payload(
+        runtime_logger,
+        logging.DEBUG,
         "WORKFLOW EXECUTION INPUT JSON:\n%s",
-        model_to_pretty_json_str(runtime_input),
+        partial(model_to_pretty_json_str, runtime_input),
     )
 
     # Parse Workflow
@@ -137,20 +163,25 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
     )
 
     try:
-        workflow_result = await workflow_execution_plain(parsed_wf)
-
-        # make sure every computation node result is requested at least once
-        # to ensure that every node is run, even if in a part of the graph not leading
-        # to a final output. This is necessary for example for the Store Model component.
-        for computation_node in all_nodes:
-            _res = (
+        with memory_tracing(runtime_input.configuration.profile_operators):
+            workflow_result = await workflow_execution_plain(parsed_wf)
+
+            # make sure every demanded computation node result is requested at least once
+            # to ensure that it is run, even if in a part of the graph not leading to a final
+            # output. This is necessary for example for the Store Object component. If unused
+            # operators are pruned, only nodes with side effects are demanded additionally.
+            # Released results have been computed and read by all consumers already, or are
+            # not needed since all consumers used memoized results.
+            for computation_node in obtain_demanded_nodes(
+                parsed_wf,
+                run_pure_plot_operators=runtime_input.configuration.run_pure_plot_operators,
+                prune_unused_operators=pruning_requested(runtime_input.configuration),
+            ):
+                if computation_node.result_released:
+                    continue
                 await computation_node.result
-                if not (
-                    computation_node.has_only_plot_outputs is True
-                    and runtime_input.configuration.run_pure_plot_operators is False
-                )
-                else {}
-            )
+                if computation_node.remaining_consumers == 0:
+                    release_result(computation_node)
 
         pure_execution_measured_step.stop()
 
@@ -179,21 +210,12 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
         )
 
     if runtime_input.configuration.return_individual_node_results:
-        # prepare individual results
-        all_results_str = "\n".join(
-            [str(x.operator_hierarchical_id) + " " + str(await x.result) for x in all_nodes]
+        node_results: dict[str, NodeResultSummary] | None = await summarize_node_results(
+            all_nodes, runtime_input.configuration.full_node_results_operator_ids
         )
-
-        runtime_logger.info(
-            "Execution Results:\n%s",
-            (
-                all_results_str
-                if len(all_results_str) <= 100
-                else (all_results_str[:50] + " ... " + all_results_str[-50:])
-            ),
+        log_payload(
+            runtime_logger, logging.INFO, "Execution Results:\n%s", partial(str, node_results)
         )
-
-        node_results: str | None = all_results_str
     else:
         node_results = None
 
@@ -225,8 +247,17 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
     wf_exec_result = WorkflowExecutionResult(
         result="ok",
         node_results=node_results,
-        output_results_by_output_name=direct_return_data,
+        output_results_by_output_name=await store_large_outputs_in_thread(
+            direct_return_data, runtime_input.configuration.result_handle_min_rows
+        ),
         job_id=runtime_input.job_id,
+        operator_profiles={
+            node.operator_hierarchical_id: node.profile
+            for node in all_nodes
+            if node.profile is not None
+        }
+        if profiling_requested(runtime_input.configuration)
+        else None,
     )
 
     # attach measured steps
@@ -235,30 +266,20 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
     wf_exec_result.measured_steps.send_data = send_data_measured_step
 
     runtime_logger.info(
+        "Workflow execution finished with outputs %s",
+        ", ".join(wf_exec_result.output_results_by_output_name),
+    )
+    log_payload(
+        runtime_logger,
+        logging.DEBUG,
         "Workflow Execution Result Pydantic Object: \n%s",
-        wf_exec_result,
+        partial(str, wf_exec_result),
     )
 
-    # catch arbitrary serialisation errors
-    # (because user can produce arbitrary non-serializable objects)
-    currently_executed_process_stage = ProcessStage.ENCODING_RESULTS_TO_JSON
-    try:
-        jsonable_encoder(wf_exec_result)
-    except Exception as exc:  # noqa: BLE001
-        runtime_logger.info(
-            "Exception during workflow execution response serialisation: %s",
-            str(exc),
-            exc_info=True,
-        )
-        return WorkflowExecutionResult.from_exception(
-            exc, currently_executed_process_stage, runtime_input.job_id
-        )
-
-    runtime_logger.info("Workflow Execution Result serialized successfully.")
-
     runtime_service_measured_step.stop()
 
     wf_exec_result.measured_steps.runtime_service_handling = runtime_service_measured_step
 
-    # TODO: avoid double serialization
+    # Serialisation errors, e.g. due to arbitrary objects returned by components, are handled
+    # when the result is encoded, see encode_execution_result_json_or_error.
     return wf_exec_result
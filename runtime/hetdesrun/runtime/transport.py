@@ -0,0 +1,230 @@
+"""Transport of execution results between runtime and backend
+
+Encoding large Pandas outputs as JSON is slow and needs a multiple of their memory size.
+The JSON encoding of execution results therefore writes the JSON produced by Pandas for
+Series and DataFrame outputs directly into the response body, instead of building an
+intermediate jsonable structure which is encoded again.
+
+Additionally the runtime endpoint offers execution results as msgpack, if this media
+type is accepted by the client. Series and DataFrames are embedded as msgpack extension types
+containing Arrow IPC streams, such that their columns are transferred as contiguous buffers.
+All other parts of the result are encoded like in the JSON response. This also holds for
+Pandas objects which cannot be represented in Arrow, e.g. columns with mixed types.
+"""
+
+import json
+import logging
+from typing import Any
+
+import msgpack
+import pandas as pd
+import pyarrow as pa
+from fastapi.encoders import jsonable_encoder
+
+from hetdesrun.models.run import ProcessStage, WorkflowExecutionInfo, WorkflowExecutionResult
+
+logger = logging.getLogger(__name__)
+
+BINARY_RESULT_MEDIA_TYPE = "application/vnd.msgpack"
+
+SERIES_EXT_TYPE = 1
+DATAFRAME_EXT_TYPE = 2
+
+_SERIES_COLUMN = "__hd_series_values__"
+_SERIES_NAME_KEY = b"hd_series_name"
+_ATTRS_KEY = b"hd_attrs"
+
+
+def accepts_media_type(accept_header: str | None, media_type: str) -> bool:
+    if accept_header is None:
+        return False
+    return any(
+        media_range.split(";")[0].strip() == media_type for media_range in accept_header.split(",")
+    )
+
+
+def accepts_binary_result(accept_header: str | None) -> bool:
+    return accepts_media_type(accept_header, BINARY_RESULT_MEDIA_TYPE)
+
+
+def pandas_to_arrow_table(value: pd.Series | pd.DataFrame) -> pa.Table:
+    """Arrow table of a Pandas object, keeping index, series name and attrs"""
+    if isinstance(value, pd.Series):
+        table = pa.Table.from_pandas(value.to_frame(name=_SERIES_COLUMN), preserve_index=True)
+        extra_metadata = {_SERIES_NAME_KEY: json.dumps(value.name).encode("utf8")}
+    else:
+        table = pa.Table.from_pandas(value, preserve_index=True)
+        extra_metadata = {}
+    extra_metadata[_ATTRS_KEY] = json.dumps(value.attrs).encode("utf8")
+    return table.replace_schema_metadata({**(table.schema.metadata or {}), **extra_metadata})
+
+
+def arrow_table_to_pandas(table: pa.Table) -> pd.Series | pd.DataFrame:
+    """Pandas object of an Arrow table created by pandas_to_arrow_table"""
+    metadata = table.schema.metadata or {}
+    frame = table.to_pandas()
+    value: pd.Series | pd.DataFrame = frame
+    if _SERIES_NAME_KEY in metadata:
+        value = frame[_SERIES_COLUMN].rename(json.loads(metadata[_SERIES_NAME_KEY]))
+    value.attrs = json.loads(metadata.get(_ATTRS_KEY, b"{}"))
+    return value
+
+
+def arrow_table_to_ipc_stream(table: pa.Table) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return bytes(sink.getvalue())
+
+
+def encode_output_value(value: Any) -> Any:
+    if isinstance(value, pd.Series | pd.DataFrame):
+        try:
+            return msgpack.ExtType(
+                SERIES_EXT_TYPE if isinstance(value, pd.Series) else DATAFRAME_EXT_TYPE,
+                arrow_table_to_ipc_stream(pandas_to_arrow_table(value)),
+            )
+        except (pa.ArrowException, TypeError, ValueError):
+            logger.debug("Pandas object cannot be encoded via Arrow, using JSON.", exc_info=True)
+    return jsonable_encoder(value, custom_encoder=WorkflowExecutionResult.__config__.json_encoders)
+
+
+def encode_execution_result(result: WorkflowExecutionResult) -> bytes:
+    """Encode an execution result as msgpack with Arrow encoded Pandas outputs"""
+    encoded_result = jsonable_encoder(result, exclude={"output_results_by_output_name"})
+    encoded_result["output_results_by_output_name"] = {
+        name: encode_output_value(value)
+        for name, value in result.output_results_by_output_name.items()
+    }
+    return msgpack.packb(encoded_result)  # type: ignore[no-any-return]
+
+
+def _decode_ext_type(code: int, data: bytes) -> Any:
+    if code in (SERIES_EXT_TYPE, DATAFRAME_EXT_TYPE):
+        return arrow_table_to_pandas(pa.ipc.open_stream(data).read_all())
+    return msgpack.ExtType(code, data)
+
+
+def decode_execution_result(content: bytes) -> dict[str, Any]:
+    """Decode msgpack encoded execution result into a dict of its fields
+
+    Pandas outputs are restored as Series and DataFrame objects.
+    """
+    decoded: dict[str, Any] = msgpack.unpackb(content, ext_hook=_decode_ext_type)
+    return decoded
+
+
+def _dump_json(value: Any) -> str:
+    # same options as the JSONResponse of FastAPI
+    return json.dumps(value, ensure_ascii=False, allow_nan=True, indent=None, separators=(",", ":"))
+
+
+def _jsonable(value: Any) -> Any:
+    return jsonable_encoder(value, custom_encoder=WorkflowExecutionResult.__config__.json_encoders)
+
+
+def output_value_json_chunks(value: Any) -> list[str]:
+    """JSON of an output value, identical to the JSON encoding via pydantic
+
+    Pandas objects are written via their to_json method without decoding and encoding
+    the resulting JSON again.
+    """
+    if type(value) is pd.Series:
+        return [
+            '{"__hd_wrapped_data_object__":"SERIES","__metadata__":',
+            _dump_json(_jsonable(value.attrs)),
+            ',"__data__":',
+            value.to_json(date_format="iso", orient="split"),
+            ',"__data_parsing_options__":{"orient":"split"}}',
+        ]
+    if type(value) is pd.DataFrame:
+        return [
+            '{"__hd_wrapped_data_object__":"DATAFRAME","__metadata__":',
+            _dump_json(_jsonable(value.attrs)),
+            ',"__data__":',
+            value.to_json(date_format="iso"),
+            "}",
+        ]
+    return [_dump_json(_jsonable(value))]
+
+
+def encode_output_results_json(output_results_by_output_name: dict[str, Any]) -> list[bytes]:
+    """Encode the outputs of an execution result as JSON object in a single pass
+
+    Raises if some output cannot be serialized.
+    """
+    chunks = [b"{"]
+    for index, (name, value) in enumerate(output_results_by_output_name.items()):
+        chunks.append((b"," if index > 0 else b"") + _dump_json(name).encode("utf8") + b":")
+        chunks.extend(chunk.encode("utf8") for chunk in output_value_json_chunks(value))
+    chunks.append(b"}")
+    return chunks
+
+
+def encode_execution_result_json(
+    result: WorkflowExecutionInfo, output_results_json: list[bytes] | None = None
+) -> list[bytes]:
+    """Encode an execution result as JSON in a single pass
+
+    Returns the JSON as a list of chunks, which can be streamed as response body without
+    joining them. Outputs already encoded via encode_output_results_json can be provided as
+    output_results_json, then only the remaining fields are encoded. Raises if some output
+    cannot be serialized.
+    """
+    envelope = _dump_json(jsonable_encoder(result, exclude={"output_results_by_output_name"}))
+    return [
+        envelope[:-1].encode("utf8"),
+        b',"output_results_by_output_name":',
+        *(
+            encode_output_results_json(result.output_results_by_output_name)
+            if output_results_json is None
+            else output_results_json
+        ),
+        b"}",
+    ]
+
+
+def _encoding_error_result(
+    result: WorkflowExecutionResult, exc: Exception
+) -> WorkflowExecutionResult:
+    logger.info(
+        "Exception during workflow execution response serialisation: %s",
+        str(exc),
+        exc_info=True,
+    )
+    error_result = WorkflowExecutionResult.from_exception(
+        exc, ProcessStage.ENCODING_RESULTS_TO_JSON, result.job_id
+    )
+    error_result.measured_steps = result.measured_steps
+    return error_result
+
+
+def encode_output_results_json_or_error(
+    result: WorkflowExecutionResult,
+) -> tuple[WorkflowExecutionResult, list[bytes]]:
+    """Encode the outputs of an execution result or, if that fails, create an error result
+
+    Since components can return arbitrary objects, outputs may not be serializable.
+    Such errors are reported with process stage ENCODING_RESULTS_TO_JSON.
+    """
+    try:
+        return result, encode_output_results_json(result.output_results_by_output_name)
+    except Exception as exc:  # noqa: BLE001
+        error_result = _encoding_error_result(result, exc)
+        return error_result, encode_output_results_json(error_result.output_results_by_output_name)
+
+
+def encode_execution_result_json_or_error(
+    result: WorkflowExecutionResult,
+) -> tuple[WorkflowExecutionResult, list[bytes]]:
+    """Encode an execution result as JSON or, if that fails, a corresponding error result
+
+    Since components can return arbitrary objects, outputs may not be serializable.
+    Such errors are reported with process stage ENCODING_RESULTS_TO_JSON.
+    """
+    result, output_results_json = encode_output_results_json_or_error(result)
+    try:
+        return result, encode_execution_result_json(result, output_results_json)
+    except Exception as exc:  # noqa: BLE001
+        error_result = _encoding_error_result(result, exc)
+        return error_result, encode_execution_result_json(error_result)
@@ -0,0 +1,156 @@
+"""Pool of long-lived runtime worker processes
+
+If configured, workflow execution inputs are not executed in the process handling the
+request but dispatched to a pool of worker processes. The workers are started once and
+then live as long as the application. Since imported component code modules are registered
+under a hash of their code (see hetdesrun.component.load), each worker imports the code of a
+component only once and reuses the module in all subsequent executions.
+
+Execution inputs and results are transferred between processes via pickle, which is
+considerably more compact and faster than JSON for results containing Pandas objects.
+Results are pickled explicitly in the worker and unpickled explicitly here, such that results
+which cannot be transferred, e.g. since they contain instances of classes defined in component
+code, which is not imported in this process, lead to an error result instead of breaking the
+pool.
+
+This allows a single runtime service process to use several cores for CPU-bound workflows
+without running more webservice worker processes.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from uuid import UUID
+
+from hetdesrun.adapters.kafka.clients import close_kafka_clients
+from hetdesrun.models.repr_reference import ReproducibilityReference
+from hetdesrun.models.run import ProcessStage, WorkflowExecutionInput, WorkflowExecutionResult
+from hetdesrun.reference_context import (
+    get_deepcopy_of_reproducibility_reference_context,
+    set_reproducibility_reference_context,
+)
+from hetdesrun.runtime.engine.plain.profiling import export_operator_metrics
+from hetdesrun.runtime.service import runtime_service
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+_runtime_worker_pool: ProcessPoolExecutor | None = None
+
+# event loop of a worker process, used for all executions handled by this worker
+_worker_event_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _init_worker() -> None:
+    global _worker_event_loop  # noqa: PLW0603
+    _worker_event_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_event_loop)
+    logger.info("Runtime worker process initialized.")
+
+
+def _pickle_result(result: WorkflowExecutionResult) -> bytes:
+    try:
+        return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Could not pickle execution result in runtime worker.")
+        return pickle.dumps(
+            WorkflowExecutionResult.from_exception(
+                exc, ProcessStage.ENCODING_RESULTS_TO_JSON, result.job_id
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+
+def _unpickle_result(pickled_result: bytes, job_id: UUID) -> WorkflowExecutionResult:
+    try:
+        result = pickle.loads(pickled_result)  # noqa: S301
+    except Exception as exc:  # noqa: BLE001
+        # e.g. the result contains instances of classes defined in component code
+        logger.exception("Could not unpickle execution result of runtime worker.")
+        return WorkflowExecutionResult.from_exception(
+            exc, ProcessStage.ENCODING_RESULTS_TO_JSON, job_id
+        )
+    assert isinstance(result, WorkflowExecutionResult)  # noqa: S101
+    return result
+
+
+def _run_in_worker(
+    runtime_input: WorkflowExecutionInput, repr_reference: ReproducibilityReference
+) -> bytes:
+    """Entrypoint for executions inside a worker process, returning the pickled result"""
+    assert _worker_event_loop is not None  # noqa: S101
+    set_reproducibility_reference_context(repr_reference)
+    try:
+        return _pickle_result(_worker_event_loop.run_until_complete(runtime_service(runtime_input)))
+    finally:
+        # the event loop does not run between executions, e.g. consumers would miss
+        # heartbeats and be kicked from their consumer groups, so Kafka clients are not kept
+        _worker_event_loop.run_until_complete(close_kafka_clients())
+
+
+def get_runtime_worker_pool() -> ProcessPoolExecutor:
+    """Obtain the runtime worker pool, creating it on first usage
+
+    Worker processes are spawned instead of forked since forking a process running an
+    event loop and other threads is not safe.
+    """
+    global _runtime_worker_pool  # noqa: PLW0603
+    if _runtime_worker_pool is None:
+        _runtime_worker_pool = ProcessPoolExecutor(
+            max_workers=get_config().runtime_worker_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _runtime_worker_pool
+
+
+def shutdown_runtime_worker_pool() -> None:
+    global _runtime_worker_pool  # noqa: PLW0603
+    if _runtime_worker_pool is not None:
+        _runtime_worker_pool.shutdown(wait=True, cancel_futures=True)
+    _runtime_worker_pool = None
+
+
+async def dispatch_runtime_service(
+    runtime_input: WorkflowExecutionInput,
+) -> WorkflowExecutionResult:
+    """Run the runtime service in the worker pool if configured or else in this process
+
+    The reproducibility reference context is handed to the worker and the resolved
+    references of the result are set as context afterwards, such that callers
+    observe the same behaviour as for executions in this process.
+
+    Operator metrics are exported here if configured.
+    """
+    result: WorkflowExecutionResult
+    if get_config().runtime_worker_processes == 0:
+        result = await runtime_service(runtime_input)
+    else:
+        try:
+            pickled_result = await asyncio.get_running_loop().run_in_executor(
+                get_runtime_worker_pool(),
+                _run_in_worker,
+                runtime_input,
+                get_deepcopy_of_reproducibility_reference_context(),
+            )
+        except BrokenProcessPool as exc:
+            # e.g. a worker process was killed because it ran out of memory.
+            # The pool is not usable anymore and is replaced on next usage.
+            logger.exception("Runtime worker pool broke during execution.")
+            shutdown_runtime_worker_pool()
+            return WorkflowExecutionResult.from_exception(
+                exc, ProcessStage.EXECUTING_COMPONENT_CODE, runtime_input.job_id
+            )
+
+        result = _unpickle_result(pickled_result, runtime_input.job_id)
+        set_reproducibility_reference_context(result.resolved_reproducibility_references)
+
+    # metrics are exported here, since the metrics of worker processes are not served
+    if get_config().export_operator_metrics and result.operator_profiles is not None:
+        export_operator_metrics(result.operator_profiles)
+        if not runtime_input.configuration.profile_operators:
+            result.operator_profiles = None
+    return result
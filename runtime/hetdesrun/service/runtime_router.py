@@ -1,9 +1,31 @@
 import logging
+from uuid import UUID
+
+from fastapi import HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
 
 from hetdesrun import VERSION
 from hetdesrun.models.base import VersionInfo
 from hetdesrun.models.run import WorkflowExecutionInput, WorkflowExecutionResult
-from hetdesrun.runtime.service import runtime_service
+from hetdesrun.runtime.result_store import (
+    ARROW_FILE_MEDIA_TYPE,
+    ARROW_STREAM_MEDIA_TYPE,
+    ResultNotFoundError,
+    delete_result,
+    load_result_table,
+    result_file_path,
+)
+from hetdesrun.runtime.transport import (
+    BINARY_RESULT_MEDIA_TYPE,
+    accepts_binary_result,
+    accepts_media_type,
+    arrow_table_to_ipc_stream,
+    arrow_table_to_pandas,
+    encode_execution_result,
+    encode_execution_result_json_or_error,
+    output_value_json_chunks,
+)
+from hetdesrun.runtime.worker_pool import dispatch_runtime_service
 from hetdesrun.webservice.auth_dependency import get_auth_deps
 from hetdesrun.webservice.router import HandleTrailingSlashAPIRouter
 
@@ -16,11 +38,118 @@ runtime_router = HandleTrailingSlashAPIRouter(tags=["runtime"])
     "/runtime",
     response_model=WorkflowExecutionResult,
     dependencies=get_auth_deps(),
+    responses={
+        200: {
+            "content": {BINARY_RESULT_MEDIA_TYPE: {}},
+            "description": (
+                "Execution result as JSON or, if accepted by the client, as msgpack with"
+                " Pandas objects encoded as Arrow IPC streams."
+            ),
+        }
+    },
+)
+async def runtime_endpoint(runtime_input: WorkflowExecutionInput, request: Request) -> Response:
+    result = await dispatch_runtime_service(runtime_input)
+    if accepts_binary_result(request.headers.get("accept", None)):
+        try:
+            return Response(
+                content=encode_execution_result(result), media_type=BINARY_RESULT_MEDIA_TYPE
+            )
+        except Exception:  # noqa: BLE001
+            logger.info(
+                "Could not encode execution result as %s, responding with JSON instead.",
+                BINARY_RESULT_MEDIA_TYPE,
+                exc_info=True,
+            )
+    _, json_chunks = encode_execution_result_json_or_error(result)
+    return StreamingResponse(iter(json_chunks), media_type="application/json")
+
+
+@runtime_router.get(
+    "/results/{result_id}",
+    dependencies=get_auth_deps(),
+    responses={
+        200: {
+            "content": {"application/json": {}, ARROW_STREAM_MEDIA_TYPE: {}},
+            "description": (
+                "Rows of a stored result as wrapped Series or DataFrame JSON or, if accepted"
+                " by the client, as Arrow IPC stream. The Content-Range header contains the"
+                " returned rows and the total number of rows."
+            ),
+        },
+        404: {"description": "Result not found"},
+    },
+)
+async def result_endpoint(
+    result_id: UUID,
+    request: Request,
+    offset: int = Query(0, ge=0, description="Index of the first returned row."),
+    limit: int | None = Query(
+        None, gt=0, description="Maximum number of returned rows. All rows if not set."
+    ),
+) -> Response:
+    """Download a page of rows of a result stored by the runtime
+
+    The result handles in execution results contain the id of stored results.
+    """
+    try:
+        table = load_result_table(result_id)
+    except ResultNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+    page = table.slice(offset, limit)
+    headers = {
+        "Content-Range": (
+            f"rows {offset}-{offset + page.num_rows - 1}/{table.num_rows}"
+            if page.num_rows > 0
+            else f"rows */{table.num_rows}"
+        )
+    }
+    if accepts_media_type(request.headers.get("accept", None), ARROW_STREAM_MEDIA_TYPE):
+        return Response(
+            content=arrow_table_to_ipc_stream(page),
+            media_type=ARROW_STREAM_MEDIA_TYPE,
+            headers=headers,
+        )
+    return StreamingResponse(
+        iter(output_value_json_chunks(arrow_table_to_pandas(page))),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+@runtime_router.get(
+    "/results/{result_id}/file",
+    dependencies=get_auth_deps(),
+    response_class=FileResponse,
+    responses={404: {"description": "Result not found"}},
+)
+async def result_file_endpoint(result_id: UUID) -> FileResponse:
+    """Download a stored result as Arrow IPC file
+
+    Supports HTTP range requests, so the file can be downloaded in parts.
+    """
+    path = result_file_path(result_id)
+    if not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Found no stored result with id {result_id}.",
+        )
+    return FileResponse(path, media_type=ARROW_FILE_MEDIA_TYPE)
+
+
+@runtime_router.delete(
+    "/results/{result_id}",
+    dependencies=get_auth_deps(),
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={404: {"description": "Result not found"}},
 )
-async def runtime_endpoint(
-    runtime_input: WorkflowExecutionInput,
-) -> WorkflowExecutionResult:
-    return await runtime_service(runtime_input)
+async def delete_result_endpoint(result_id: UUID) -> None:
+    """Remove a stored result before its retention time has passed"""
+    try:
+        delete_result(result_id)
+    except ResultNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
 
 @runtime_router.get("/info", response_model=VersionInfo)
@@ -144,7 +144,71 @@ def model_to_pretty_json_str(pydantic_model: BaseModel) -> str:
 
     For logging etc.
     """
-    return json.dumps(json.loads(pydantic_model.json()), indent=2, sort_keys=True)
+    return pydantic_model.json(indent=2, sort_keys=True)
+
+
+def shorten_payload(payload: str, max_chars: int) -> str:
+    """Shorten payload string in the middle to at most max_chars plus a notice"""
+    if len(payload) <= max_chars:
+        return payload
+    kept_start = max_chars - max_chars // 2
+    return (
+        payload[:kept_start]
+        + f" ... [{len(payload) - max_chars} characters omitted] ... "
+        + payload[len(payload) - max_chars // 2 :]
+    )
+
+
+class LazyLogPayload:
+    """Payload which is only rendered when the log record is formatted
+
+    Pass it as argument of a logging call. Rendering is bounded by shortening the
+    result to max_chars, byte payloads are cut before decoding.
+    """
+
+    def __init__(self, payload: Callable[[], str] | bytes, max_chars: int) -> None:
+        self.payload = payload
+        self.max_chars = max_chars
+        self.rendered: str | None = None
+
+    def __str__(self) -> str:
+        # every handler formats the record, but the payload is rendered only once
+        if self.rendered is None:
+            self.rendered = self.render()
+        return self.rendered
+
+    def render(self) -> str:
+        if not isinstance(self.payload, bytes):
+            return shorten_payload(self.payload(), self.max_chars)
+        if len(self.payload) <= self.max_chars:
+            return self.payload.decode(errors="replace")
+        kept_start = self.max_chars - self.max_chars // 2
+        return (
+            self.payload[:kept_start].decode(errors="replace")
+            + f" ... [{len(self.payload) - self.max_chars} bytes omitted] ... "
+            + self.payload[len(self.payload) - self.max_chars // 2 :].decode(errors="replace")
+        )
+
+
+def log_payload(
+    logger_to_use: logging.Logger,
+    level: int,
+    msg: str,
+    payload: Callable[[], str] | bytes,
+) -> None:
+    """Log a potentially large payload according to the payload logging policy
+
+    The payload is skipped if it would not be emitted at the effective log level of the
+    logger, if payload logging is disabled or if the record is not sampled according to
+    the configured sample rate. msg must contain one %s placeholder for the payload.
+    """
+    max_chars = get_config().payload_log_max_chars
+    sample_rate = get_config().payload_log_sample_rate
+    if max_chars == 0 or not logger_to_use.isEnabledFor(level):
+        return
+    if sample_rate < 1.0 and random.random() >= sample_rate:  # noqa: S311
+        return
+    logger_to_use.log(level, msg, LazyLogPayload(payload, max_chars))
 
 
 def cache_conditionally(condition_func: Callable) -> Callable:
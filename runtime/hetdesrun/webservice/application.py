@@ -1,4 +1,3 @@
-import json
 import logging
 from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
@@ -14,6 +13,7 @@ from starlette.responses import JSONResponse, Response
 
 from hetdesrun import VERSION
 from hetdesrun.adapters.external_sources.config import get_external_sources_adapter_config
+from hetdesrun.adapters.kafka.clients import close_kafka_clients
 from hetdesrun.adapters.kafka.config import get_kafka_adapter_config
 from hetdesrun.adapters.sql_adapter.config import get_sql_adapter_config
 from hetdesrun.adapters.virtual_structure_adapter.config import get_vst_adapter_config
@@ -30,8 +30,12 @@ from hetdesrun.backend.service.transformation_router import (
 from hetdesrun.backend.service.virtual_structure_router import virtual_structure_router
 from hetdesrun.backend.service.wiring_router import wiring_router
 from hetdesrun.backend.service.workflow_router import workflow_router
+from hetdesrun.runtime.engine.plain.execution import shutdown_component_executors
+from hetdesrun.runtime.worker_pool import shutdown_runtime_worker_pool
+from hetdesrun.utils import log_payload
 from hetdesrun.webservice.auth_dependency import get_auth_deps
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import close_http_client_pools
 
 if get_config().hd_kafka_consumer_enabled:
     from hetdesrun.backend.kafka.consumer import get_kafka_worker_context
@@ -43,23 +47,15 @@ logger = logging.getLogger(__name__)
 class AdditionalLoggingRoute(APIRoute):
     """Additional logging and information in case of errors
 
-    Makes sure that requests are logged in every situation.
+    Makes sure that requests are logged in every situation. Request bodies are logged
+    according to the payload logging policy, see log_payload.
     """
 
     def get_route_handler(self) -> Callable:
         original_route_handler = super().get_route_handler()
 
         async def custom_route_handler(request: Request) -> Response:
-            try:
-                json_data = await request.json()
-            except json.decoder.JSONDecodeError:
-                body = await request.body()
-                logger.info("RECEIVED BODY (could not parse as json):\n%s", body.decode())
-            else:
-                logger.info(
-                    "RECEIVED JSON BODY: \n%s",
-                    json.dumps(json_data, indent=2, sort_keys=True),
-                )
+            log_payload(logger, logging.INFO, "RECEIVED BODY:\n%s", await request.body())
             try:
                 return await original_route_handler(request)  # type: ignore
             except RequestValidationError as exc:
@@ -95,6 +91,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:  # noqa: ARG001
         logger.info("Shutting down Kafka consumer...")
         kakfa_worker_context = get_kafka_worker_context()
         await kakfa_worker_context.stop()
+    shutdown_component_executors()
+    shutdown_runtime_worker_pool()
+    await close_http_client_pools()
+    await close_kafka_clients()
 
 
 def app_desc_part() -> str:
@@ -217,6 +217,17 @@ def init_app() -> FastAPI:  # noqa: PLR0912,PLR0915
             runtime_router, prefix="/engine"
         )  # auth dependency set individually per endpoint
 
+    if get_config().is_runtime_service and get_config().export_operator_metrics:
+        try:
+            from prometheus_client import make_asgi_app
+        except ModuleNotFoundError:
+            logger.warning(
+                "Operator metrics export is configured, but prometheus_client is not installed."
+                " The /metrics endpoint is not available."
+            )
+        else:
+            app.mount("/metrics", make_asgi_app())
+
     if get_config().is_backend_service and len(get_config().restrict_to_trafo_exec_service) == 0:
         if get_sql_adapter_config().active and not get_sql_adapter_config().service_in_runtime:
             app.include_router(sql_adapter_router)  # auth dependency set individually per endpoint
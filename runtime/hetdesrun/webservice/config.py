@@ -1,6 +1,7 @@
 import datetime
 import os
 import re
+import tempfile
 from enum import Enum
 from uuid import UUID
 
@@ -36,6 +37,14 @@ class InternalAuthMode(str, Enum):
     FORWARD_OR_FIXED = "FORWARD_OR_FIXED"
 
 
+class ComponentExecutor(str, Enum):
+    """Where synchronous component entrypoint functions are run"""
+
+    EVENT_LOOP = "event_loop"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
 class RuntimeConfig(BaseSettings):
     """Configuration for Hetida Designer Runtime
 
@@ -49,6 +58,28 @@ class RuntimeConfig(BaseSettings):
         + ", ".join(['"' + x.value + '"' for x in list(LogLevel)]),
     )
 
+    payload_log_max_chars: int = Field(
+        10000,
+        env="HD_PAYLOAD_LOG_MAX_CHARS",
+        ge=0,
+        description=(
+            "Maximal number of characters of request bodies, execution inputs and execution"
+            " results written to the log. Longer payloads are shortened in the middle."
+            " Set to 0 to not log payloads at all."
+        ),
+    )
+
+    payload_log_sample_rate: float = Field(
+        1.0,
+        env="HD_PAYLOAD_LOG_SAMPLE_RATE",
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Fraction of requests and executions for which payloads are logged."
+            " Payloads are only rendered if they are actually logged."
+        ),
+    )
+
     advanced_performance_measurement_active: bool = Field(
         True,
         env="HD_ADVANCED_PERFORMANCE_MEASUREMENT_INFORMATION",
@@ -78,6 +109,53 @@ class RuntimeConfig(BaseSettings):
             "such as a generic REST adapter"
         ),
     )
+    http_client_max_connections: int = Field(
+        100,
+        env="HD_HTTP_CLIENT_MAX_CONNECTIONS",
+        gt=0,
+        description=(
+            "Maximum number of simultaneous connections of the pools shared by outgoing"
+            " requests, e.g. from the backend to the runtime or to generic REST adapters"
+        ),
+    )
+    http_client_max_keepalive_connections: int = Field(
+        20,
+        env="HD_HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS",
+        ge=0,
+        description="Maximum number of idle connections which are kept open for reuse",
+    )
+    http_client_keepalive_expiry: float = Field(
+        5.0,
+        env="HD_HTTP_CLIENT_KEEPALIVE_EXPIRY",
+        ge=0.0,
+        description="Time (in seconds) after which idle connections are closed",
+    )
+    http_client_http2: bool = Field(
+        False,
+        env="HD_HTTP_CLIENT_HTTP2",
+        description=(
+            "Whether outgoing requests use HTTP/2 if the server supports it."
+            " Requires the h2 package. Note that HTTP/2 is only negotiated for https urls."
+        ),
+    )
+    adapter_max_concurrent_requests: int = Field(
+        32,
+        env="HD_ADAPTER_MAX_CONCURRENT_REQUESTS",
+        gt=0,
+        description=(
+            "Maximum number of requests to adapters which run at the same time"
+            " in one worker process"
+        ),
+    )
+    adapter_max_concurrent_requests_per_adapter: int = Field(
+        8,
+        env="HD_ADAPTER_MAX_CONCURRENT_REQUESTS_PER_ADAPTER",
+        gt=0,
+        description=(
+            "Maximum number of requests to the same adapter which run at the same time"
+            " in one worker process"
+        ),
+    )
     model_repo_path: str = Field(
         "/mnt/obj_repo",
         env="MODEL_REPO_PATH",
@@ -113,6 +191,18 @@ class RuntimeConfig(BaseSettings):
         env="HD_RESTRICT_TO_TRAFO_EXEC_SERVICE",
     )
 
+    latest_revision_id_cache_ttl: float = Field(
+        30.0,
+        env="HD_LATEST_REVISION_ID_CACHE_TTL",
+        ge=0,
+        description=(
+            "How long in seconds the id of the latest released revision of a revision group"
+            " is cached for executions triggered via Kafka. The cache of a worker process is"
+            " invalidated immediately when this process stores or deletes a revision of the"
+            " group. Set to 0 to disable caching."
+        ),
+    )
+
     enable_caching_for_non_draft_trafos_for_execution: bool = Field(
         False,
         env="HD_ENABLE_CACHING_FOR_NON_DRAFT_TRAFOS_FOR_EXEC",
@@ -123,6 +213,101 @@ class RuntimeConfig(BaseSettings):
         ),
     )
 
+    component_executor: ComponentExecutor = Field(
+        ComponentExecutor.EVENT_LOOP,
+        env="HD_COMPONENT_EXECUTOR",
+        description=(
+            "Where synchronous component entrypoint functions are run by default. One of "
+            + ", ".join(['"' + x.value + '"' for x in list(ComponentExecutor)])
+            + ". With event_loop they are called directly on the event loop of the runtime"
+            " worker process, which blocks other executions and requests handled by this process"
+            " while the function runs. With thread they are run in a bounded thread pool and with"
+            " process in a process pool, allowing to use several cores for CPU-heavy components."
+            ' Components can overwrite this via an "executor" entry in their COMPONENT_INFO.'
+            " Async entrypoint functions are always awaited on the event loop."
+        ),
+    )
+
+    component_executor_max_workers: int | None = Field(
+        None,
+        env="HD_COMPONENT_EXECUTOR_MAX_WORKERS",
+        gt=0,
+        description=(
+            "Maximum number of threads respectively processes of the pools used for"
+            " running synchronous component functions. If not set, Python's defaults"
+            " for thread and process pool executors apply."
+        ),
+    )
+
+    runtime_worker_processes: int = Field(
+        0,
+        env="HD_RUNTIME_WORKER_PROCESSES",
+        ge=0,
+        description=(
+            "Number of long-lived worker processes to which workflow executions of the runtime"
+            " are dispatched. Workers keep imported component code modules, such that"
+            " component code is only imported once per worker. If 0 (the default), executions"
+            " are run in the process handling the request."
+        ),
+    )
+
+    execution_plan_cache_size: int = Field(
+        512,
+        env="HD_EXECUTION_PLAN_CACHE_SIZE",
+        ge=0,
+        description=(
+            "Maximal number of compiled component execution plans kept by the runtime."
+            " A plan contains the loaded entrypoint function of a component revision together"
+            " with its required parameters and executor, such that executing the same"
+            " components again only binds the new input data. Least recently used plans are"
+            " dropped first. Set to 0 to disable caching."
+        ),
+    )
+
+    component_result_cache_max_bytes: int = Field(
+        0,
+        env="HD_COMPONENT_RESULT_CACHE_MAX_BYTES",
+        ge=0,
+        description=(
+            "Maximal estimated memory size in bytes of memoized results of deterministic"
+            ' components, i.e. components with "deterministic": True in their COMPONENT_INFO.'
+            " Such components are not computed again if they were already computed with the"
+            " same code and inputs. Least recently used results are dropped first."
+            " Defaults to 0, which disables memoization."
+        ),
+    )
+
+    export_operator_metrics: bool = Field(
+        False,
+        env="HD_EXPORT_OPERATOR_METRICS",
+        description=(
+            "Whether to profile every operator of every execution in the runtime and to"
+            " export the measured durations and data sizes as Prometheus metrics at the"
+            " /metrics endpoint of the runtime. Requires the prometheus_client package."
+        ),
+    )
+
+    result_store_directory: str = Field(
+        os.path.join(tempfile.gettempdir(), "hd_result_store"),
+        env="HD_RESULT_STORE_DIRECTORY",
+        description=(
+            "Directory in which the runtime stores large outputs as Arrow IPC files,"
+            " if result handles are requested via result_handle_min_rows in the execution"
+            " configuration. Stored results can be downloaded from the /engine/results"
+            " endpoint of the runtime."
+        ),
+    )
+
+    result_store_retention_seconds: int = Field(
+        3600,
+        env="HD_RESULT_STORE_RETENTION_SECONDS",
+        gt=0,
+        description=(
+            "Duration in seconds for which stored results are kept. Older results are"
+            " removed when new results are stored."
+        ),
+    )
+
     ensure_db_schema: bool = Field(
         True,
         env="HD_ENSURE_DB_SCHEMA",
@@ -353,6 +538,16 @@ class RuntimeConfig(BaseSettings):
 
     hd_runtime_verify_certs: bool = Field(True, env="HETIDA_DESIGNER_RUNTIME_VERIFY_CERTS")
 
+    hd_runtime_binary_result_transport: bool = Field(
+        True,
+        env="HETIDA_DESIGNER_RUNTIME_BINARY_RESULT_TRANSPORT",
+        description=(
+            "Whether the backend requests execution results from the runtime as msgpack with"
+            " Arrow encoded Pandas objects instead of JSON. Runtimes not supporting this"
+            " answer with JSON, which is handled as well."
+        ),
+    )
+
     # For scripts (e.g. transformation deployment)
     hd_backend_api_url: str = Field(
         "http://hetida-designer-backend:8090/api/",
@@ -452,6 +647,38 @@ class RuntimeConfig(BaseSettings):
         env="HETIDA_DESIGNER_KAFKA_RESPONSE_TOPIC",
     )
 
+    hd_kafka_consumer_max_concurrent_executions: int = Field(
+        1,
+        gt=0,
+        description=(
+            "How many execution trigger messages the Kafka consumer of a backend worker"
+            " process handles at the same time"
+        ),
+        env="HETIDA_DESIGNER_KAFKA_CONSUMER_MAX_CONCURRENT_EXECUTIONS",
+    )
+
+    hd_kafka_response_linger_ms: int = Field(
+        10,
+        ge=0,
+        description=(
+            "How long the producer waits for further execution result messages in order to"
+            " send them to the response topic together. Used if linger_ms is not set in"
+            " HETIDA_DESIGNER_KAFKA_PRODUCER_OPTIONS."
+        ),
+        env="HETIDA_DESIGNER_KAFKA_RESPONSE_LINGER_MS",
+    )
+
+    hd_kafka_max_uncompressed_message_size: int = Field(
+        512 * 1024 * 1024,
+        gt=0,
+        description=(
+            "Maximal size in bytes of received compressed Kafka adapter messages after"
+            " decompression. Messages announcing a larger uncompressed size in their"
+            " hd-uncompressed-size header are rejected."
+        ),
+        env="HETIDA_DESIGNER_KAFKA_MAX_UNCOMPRESSED_MESSAGE_SIZE",
+    )
+
     @validator("internal_auth_client_credentials")
     def internal_auth_client_credentials_set_if_internal_auth_mode_is_client(
         cls,
@@ -0,0 +1,162 @@
+"""Connection pools for outgoing HTTP requests
+
+Requests from the backend to the runtime, to generic REST adapters and to callback urls
+share the connection pools of this module instead of opening new connections for every
+execution. Call sites still create their own lightweight httpx.AsyncClient via
+pooled_async_client, e.g. to set headers or timeouts, but all clients with the same
+certificate verification setting send their requests through the same transport and
+therefore reuse kept-alive connections.
+
+The pools are bound to the event loop they are created in. The FastAPI lifespan closes them
+on shutdown. If a different event loop is used later, e.g. by the Kafka consumer or in tests,
+the pools of the previous event loop are closed on that loop if it is still running and new
+pools are created for the new one.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from typing import Any
+
+import httpcore
+import httpx
+from pydantic import BaseModel, Field
+
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClientPoolMetrics(BaseModel):
+    verify: bool
+    http2: bool
+    requests_total: int = Field(0, description="Number of requests sent via the pool.")
+    connections: int = Field(0, description="Number of currently open connections.")
+    idle_connections: int = Field(0, description="Number of open connections without requests.")
+    http2_connections: int = 0
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """Transport which delegates to a pooled transport without closing it
+
+    Closing a client which uses this transport leaves the connection pool open for
+    other clients.
+    """
+
+    def __init__(self, pool: "AsyncHttpClientPool") -> None:
+        self.pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.pool.requests_total += 1
+        return await self.pool.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class AsyncHttpClientPool:
+    def __init__(self, verify: bool) -> None:
+        self.verify = verify
+        self.http2 = http2_enabled()
+        self.requests_total = 0
+        self.transport = httpx.AsyncHTTPTransport(
+            verify=verify,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=get_config().http_client_max_connections,
+                max_keepalive_connections=get_config().http_client_max_keepalive_connections,
+                keepalive_expiry=get_config().http_client_keepalive_expiry,
+            ),
+        )
+
+    def connections(self) -> list[httpcore.AsyncConnectionInterface]:
+        """Open connections of the pool
+
+        httpx does not expose the httpcore connection pool of its transport via its public
+        API, hence its private _pool attribute is read. If it is missing or not a httpcore
+        connection pool, e.g. for other httpx versions, no connections are reported.
+        """
+        connection_pool = getattr(self.transport, "_pool", None)
+        if not isinstance(connection_pool, httpcore.AsyncConnectionPool):
+            return []
+        return list(connection_pool.connections)
+
+    def metrics(self) -> HttpClientPoolMetrics:
+        connections = self.connections()
+        return HttpClientPoolMetrics(
+            verify=self.verify,
+            http2=self.http2,
+            requests_total=self.requests_total,
+            connections=len(connections),
+            idle_connections=sum(1 for connection in connections if connection.is_idle()),
+            http2_connections=sum(1 for connection in connections if "HTTP/2" in connection.info()),
+        )
+
+
+_pools: dict[bool, AsyncHttpClientPool] = {}
+_pools_loop: asyncio.AbstractEventLoop | None = None
+
+
+def http2_enabled() -> bool:
+    if not get_config().http_client_http2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning(
+            "HTTP/2 is configured for outgoing requests, but the h2 package is not installed."
+            " Using HTTP/1.1 instead."
+        )
+        return False
+    return True
+
+
+def _close_pools_of_other_loop(other_loop: asyncio.AbstractEventLoop) -> None:
+    if len(_pools) == 0:
+        return
+    if other_loop.is_running():
+        # a running loop other than the current one runs in another thread
+        for pool in _pools.values():
+            asyncio.run_coroutine_threadsafe(pool.transport.aclose(), other_loop)
+    else:
+        logger.warning(
+            "Dropping %d HTTP client pools without closing them, since their event loop"
+            " is not running anymore.",
+            len(_pools),
+        )
+
+
+def get_async_http_client_pool(verify: bool) -> AsyncHttpClientPool:
+    global _pools_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if loop is not _pools_loop:
+        # connections of another event loop cannot be used in this one
+        if _pools_loop is not None:
+            _close_pools_of_other_loop(_pools_loop)
+        _pools.clear()
+        _pools_loop = loop
+    if verify not in _pools:
+        _pools[verify] = AsyncHttpClientPool(verify)
+    return _pools[verify]
+
+
+def pooled_async_client(*, verify: bool, **kwargs: Any) -> httpx.AsyncClient:
+    """AsyncClient which sends its requests via the shared connection pool
+
+    Further keyword arguments like headers or timeout are passed to httpx.AsyncClient.
+    Must be called from within a running event loop.
+    """
+    return httpx.AsyncClient(
+        verify=verify, transport=SharedTransport(get_async_http_client_pool(verify)), **kwargs
+    )
+
+
+def http_client_pool_metrics() -> list[HttpClientPoolMetrics]:
+    return [pool.metrics() for pool in _pools.values()]
+
+
+async def close_http_client_pools() -> None:
+    global _pools_loop  # noqa: PLW0603
+    if _pools_loop is asyncio.get_running_loop():
+        for pool in _pools.values():
+            await pool.transport.aclose()
+    _pools.clear()
+    _pools_loop = None
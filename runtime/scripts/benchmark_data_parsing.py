@@ -0,0 +1,114 @@
+"""Benchmark parsing of wrapped SERIES, DATAFRAME and MULTITSFRAME inputs
+
+Compares the parsing via the pydantic types from hdutils with the previous approach,
+which decoded wrapped json via pydantic and serialized the contained data again for
+pd.read_json.
+
+Run from the runtime directory:
+
+    python scripts/benchmark_data_parsing.py --rows 1000000
+"""
+
+import argparse
+import io
+import json
+import time
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from hdutils import (
+    MetaDataWrapped,
+    PydanticMultiTimeseriesPandasDataFrame,
+    PydanticPandasDataFrame,
+    PydanticPandasSeries,
+)
+
+
+def previous_parsing(v: str | dict, typ: str) -> pd.Series | pd.DataFrame:
+    try:
+        wrapped = (
+            MetaDataWrapped.parse_raw(v) if isinstance(v, str) else MetaDataWrapped.parse_obj(v)
+        )
+        data_content: Any = wrapped.data__
+        parsing_options = wrapped.data_parsing_options__
+    except Exception:  # noqa: BLE001
+        data_content = v
+        parsing_options = {}
+    if isinstance(data_content, str):
+        return pd.read_json(io.StringIO(data_content), typ=typ, **parsing_options)  # type: ignore
+    try:
+        return pd.read_json(data_content, typ=typ, **parsing_options)  # type: ignore
+    except Exception:  # noqa: BLE001
+        return pd.read_json(  # type: ignore
+            io.StringIO(json.dumps(data_content)), typ=typ, **parsing_options
+        )
+
+
+def wrapped_json(data: pd.Series | pd.DataFrame) -> str:
+    if isinstance(data, pd.Series):
+        return (
+            '{"__hd_wrapped_data_object__":"SERIES","__metadata__":{},"__data__":'
+            + str(data.to_json(date_format="iso", orient="split"))
+            + ',"__data_parsing_options__":{"orient":"split"}}'
+        )
+    return (
+        '{"__hd_wrapped_data_object__":"DATAFRAME","__metadata__":{},"__data__":'
+        + str(data.to_json(date_format="iso"))
+        + "}"
+    )
+
+
+def measure(func: Callable[[], Any], repetitions: int) -> float:
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--rows", type=int, default=1_000_000)
+    arg_parser.add_argument("--repetitions", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    timestamps = pd.date_range("2020-01-01", periods=args.rows, freq="s", tz="UTC")
+    values = np.random.default_rng(42).random(args.rows)
+    series = pd.Series(values, index=timestamps, name="value")
+    frame = pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "metric": np.where(np.arange(args.rows) % 2 == 0, "a", "b"),
+            "value": values,
+        }
+    )
+
+    class Model(BaseModel):
+        series: PydanticPandasSeries | None = None
+        frame: PydanticPandasDataFrame | None = None
+        multitsframe: PydanticMultiTimeseriesPandasDataFrame | None = None
+
+    for name, data, typ in (
+        ("series", series, "series"),
+        ("frame", frame, "frame"),
+        ("multitsframe", frame, "frame"),
+    ):
+        as_string = wrapped_json(data)
+        as_dict = json.loads(as_string)
+        for payload_name, payload in (("json string", as_string), ("decoded json", as_dict)):
+            previous = measure(partial(previous_parsing, payload, typ), args.repetitions)
+            current = measure(partial(Model.parse_obj, {name: payload}), args.repetitions)
+            print(  # noqa: T201
+                f"{name:>12} from {payload_name:<12}: previous {previous:7.3f}s,"
+                f" current {current:7.3f}s, speedup {previous / current:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark splitting timeseries records loaded from a generic REST adapter into Series
+
+Compares split_loaded_data_by_timeseries_id with the previous approach, which filtered the
+complete DataFrame once per requested timeseries id and sorted every slice. Since the
+previous approach scales with the number of ids, it is only measured for a sample of ids
+and extrapolated to all ids.
+
+Run from the runtime directory:
+
+    python scripts/benchmark_timeseries_split.py --series 500 --points 100000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from hetdesrun.adapters.generic_rest.load_ts_data import split_loaded_data_by_timeseries_id
+
+
+def previous_extraction(df: pd.DataFrame, ts_ids: list[str]) -> dict[str, pd.Series]:
+    extracted = {}
+    for ts_id in ts_ids:
+        extracted_df = df[df["timeseriesId"] == ts_id].copy()
+        extracted_df.index = extracted_df["timestamp"]
+        extracted[ts_id] = extracted_df["value"].sort_index()
+    return extracted
+
+
+def measure(func: Callable[[], Any], repetitions: int) -> float:
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--series", type=int, default=500)
+    arg_parser.add_argument("--points", type=int, default=100_000)
+    arg_parser.add_argument("--previous-sample", type=int, default=10)
+    arg_parser.add_argument("--repetitions", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    ts_ids = [f"ts_{number}" for number in range(args.series)]
+    num_rows = args.series * args.points
+    # adapters usually return records ordered by timestamp, not grouped by id
+    df = pd.DataFrame(
+        {
+            "timeseriesId": pd.array(np.tile(ts_ids, args.points), dtype="string"),
+            "timestamp": pd.date_range("2020-01-01", periods=args.points, freq="s", tz="UTC")
+            .repeat(args.series)
+            .to_numpy(),
+            "value": rng.random(num_rows),
+        }
+    )
+
+    current = measure(partial(split_loaded_data_by_timeseries_id, df, ts_ids), args.repetitions)
+    sample_ids = ts_ids[: args.previous_sample]
+    previous = (
+        measure(partial(previous_extraction, df, sample_ids), args.repetitions)
+        * len(ts_ids)
+        / len(sample_ids)
+    )
+    print(  # noqa: T201
+        f"{args.series} series x {args.points} points: previous {previous:8.2f}s"
+        f" (extrapolated from {len(sample_ids)} ids), current {current:8.2f}s,"
+        f" speedup {previous / current:6.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
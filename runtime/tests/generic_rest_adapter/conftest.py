@@ -0,0 +1,38 @@
+from collections.abc import Generator
+from unittest import mock
+
+import httpx
+import pytest
+
+
+class FramelikeResponseMock:
+    """Response of the framelike endpoints of a generic rest adapter
+
+    Requests sent to the adapter are collected in requests. If error is set,
+    it is raised instead of responding.
+    """
+
+    def __init__(self) -> None:
+        self.status_code = 200
+        self.content = b""
+        self.headers: dict[str, str] = {}
+        self.error: Exception | None = None
+        self.requests: list[httpx.Request] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.error is not None:
+            raise self.error
+        return httpx.Response(self.status_code, content=self.content, headers=self.headers)
+
+
+@pytest.fixture()
+def framelike_response_mock() -> Generator[FramelikeResponseMock, None, None]:
+    response_mock = FramelikeResponseMock()
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_framelike.pooled_async_client",
+        lambda verify, **kwargs: httpx.AsyncClient(  # noqa: ARG005
+            transport=httpx.MockTransport(response_mock.handle), **kwargs
+        ),
+    ):
+        yield response_mock
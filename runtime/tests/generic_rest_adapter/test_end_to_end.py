@@ -44,10 +44,14 @@ async def test_wiring_with_generic_rest_input(input_json_with_wiring_with_input,
 
                 assert status_code == 200
 
-                node_results = output["node_results"]
+                node_result_values = [
+                    output_summary["value"]
+                    for node_result in output["node_results"].values()
+                    for output_summary in node_result["outputs"].values()
+                ]
 
-                assert "32.0" in node_results  # intermediate result
-                assert "64.0" in node_results
+                assert 32.0 in node_result_values  # intermediate result
+                assert 64.0 in node_result_values
 
                 # now add sending metadata from the only output
                 json_with_wiring["workflow_wiring"]["output_wirings"] = [
@@ -9,6 +9,7 @@ from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.adapters.generic_rest.load_dataframe import (
     load_single_dataframe_from_adapter,
 )
+from hetdesrun.adapters.generic_rest.load_framelike import read_ndjson_stream
 from hetdesrun.adapters.generic_rest.send_framelike import encode_attributes
 from hetdesrun.models.data_selection import FilteredSource
 
@@ -107,68 +108,69 @@ async def mock_load_generic_rest_dataframe_with_timestamp_col(*args, **kwargs):
 
 
 @pytest.mark.asyncio
-async def test_end_to_end_load_dataframe_data_with_timestamp_column():
-    resp_mock = mock.Mock()
-    resp_mock.status_code = 200
-    resp_mock.raw = io.StringIO(
-        """\n
+async def test_end_to_end_load_dataframe_data_with_timestamp_column(framelike_response_mock):
+    framelike_response_mock.content = b"""\n
         {"timestamp": "2020-03-11T13:45:18.194000000Z", "a": 42.3}
         {"timestamp": "2020-03-11T14:45:18.194000000Z", "a": 41.7}
         {"timestamp": "2020-03-11T15:45:18.194000000Z", "a": 15.89922333}
         """
-    )
-    resp_mock.headers = {}
-    with mock.patch(  # noqa: SIM117
+    with mock.patch(
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
-        with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=resp_mock,
-        ):
-            loaded_data = await load_data(
-                {
-                    "inp_1": FilteredSource(ref_id="id_1", type=ExternalType.DATAFRAME),
-                },
-                adapter_key="end_to_end_only_dataframe_data",
-            )
+        loaded_data = await load_data(
+            {
+                "inp_1": FilteredSource(ref_id="id_1", type=ExternalType.DATAFRAME),
+            },
+            adapter_key="end_to_end_only_dataframe_data",
+        )
 
-            assert len(loaded_data) == 1
-            assert isinstance(loaded_data["inp_1"], pd.DataFrame)
-            assert loaded_data["inp_1"].shape == (3, 2)
-            assert isinstance(loaded_data["inp_1"].index.dtype, pd.DatetimeTZDtype)
+        assert len(loaded_data) == 1
+        assert isinstance(loaded_data["inp_1"], pd.DataFrame)
+        assert loaded_data["inp_1"].shape == (3, 2)
+        assert isinstance(loaded_data["inp_1"].index.dtype, pd.DatetimeTZDtype)
 
 
 @pytest.mark.asyncio
-async def test_end_to_end_load_dataframe_data_with_attrs():
-    resp_mock = mock.Mock()
-    resp_mock.status_code = 200
+async def test_end_to_end_load_dataframe_data_with_attrs(framelike_response_mock):
     attributes = {"b": 2}
-    resp_mock.headers = {"Data-Attributes": encode_attributes(attributes)}
-    resp_mock.raw = io.StringIO(
-        """\n
+    framelike_response_mock.headers = {"Data-Attributes": encode_attributes(attributes)}
+    framelike_response_mock.content = b"""\n
         {"timestamp": "2020-03-11T13:45:18.194000000Z", "a": 42.3}
         {"timestamp": "2020-03-11T14:45:18.194000000Z", "a": 41.7}
         {"timestamp": "2020-03-11T15:45:18.194000000Z", "a": 15.89922333}
         """
-    )
-    with mock.patch(  # noqa: SIM117
+    with mock.patch(
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
-        with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=resp_mock,
-        ):
-            loaded_data = await load_data(
-                {
-                    "inp_1": FilteredSource(ref_id="id_1", type=ExternalType.DATAFRAME),
-                },
-                adapter_key="end_to_end_only_dataframe_data",
-            )
-
-            assert len(loaded_data) == 1
-            assert isinstance(loaded_data["inp_1"], pd.DataFrame)
-            assert loaded_data["inp_1"].shape == (3, 2)
-            assert len(loaded_data["inp_1"].attrs) == 1
-            assert loaded_data["inp_1"].attrs == attributes
+        loaded_data = await load_data(
+            {
+                "inp_1": FilteredSource(ref_id="id_1", type=ExternalType.DATAFRAME),
+            },
+            adapter_key="end_to_end_only_dataframe_data",
+        )
+
+        assert len(loaded_data) == 1
+        assert isinstance(loaded_data["inp_1"], pd.DataFrame)
+        assert loaded_data["inp_1"].shape == (3, 2)
+        assert len(loaded_data["inp_1"].attrs) == 1
+        assert loaded_data["inp_1"].attrs == attributes
+
+
+@pytest.mark.asyncio
+async def test_read_ndjson_stream_agrees_with_read_json():
+    ndjson = (
+        b'\n  {"timestamp": "2020-03-11T13:45:18.194Z", "a": 42, "b": "x"}\n'
+        b'{"timestamp": "2020-03-11T14:45:18.194Z", "a": 41.7, "c": true}\n'
+        b'{"timestamp": "2020-03-11T15:45:18.194Z", "a": null, "b": "y"}'
+    )
+    expected = pd.read_json(io.BytesIO(ndjson), lines=True)
+
+    async def chunks(chunk_size):
+        for start in range(0, len(ndjson), chunk_size):
+            yield ndjson[start : start + chunk_size]
+
+    for chunk_size in (1, 10, len(ndjson)):
+        df = await read_ndjson_stream(chunks(chunk_size), parse_chunk_bytes=chunk_size)
+        pd.testing.assert_frame_equal(df, expected)
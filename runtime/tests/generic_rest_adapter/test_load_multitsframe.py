@@ -1,4 +1,3 @@
-import io
 from unittest import mock
 
 import pandas as pd
@@ -16,19 +15,18 @@ from hetdesrun.models.data_selection import FilteredSource
 
 
 @pytest.mark.asyncio
-async def test_load_single_multitsframe_from_adapter_end_to_end() -> None:
-    resp_mock = mock.Mock(
-        status_code=200,
-        headers={
-            "Data-Attributes": encode_attributes(
-                {
-                    "from": "2019-08-01T15:45:30.000Z",
-                    "to": "2019-08-01T15:46:00.000Z",
-                }
-            )
-        },
-        raw=io.StringIO(
-            """
+async def test_load_single_multitsframe_from_adapter_end_to_end(
+    framelike_response_mock,
+) -> None:
+    framelike_response_mock.headers = {
+        "Data-Attributes": encode_attributes(
+            {
+                "from": "2019-08-01T15:45:30.000Z",
+                "to": "2019-08-01T15:46:00.000Z",
+            }
+        )
+    }
+    framelike_response_mock.content = b"""
         {"timestamp": "2019-08-01T15:45:36.000Z", "metric": "a", "value": 1.0}
         {"timestamp": "2019-08-01T15:45:37.000Z", "metric": "b", "value": 1.2}
         {"timestamp": "2019-08-01T15:45:37.000Z", "metric": "c", "value": 0.5}
@@ -39,36 +37,30 @@ async def test_load_single_multitsframe_from_adapter_end_to_end() -> None:
         {"timestamp": "2019-08-01T15:45:57.000Z", "metric": "b", "value": 1.7}
         {"timestamp": "2019-08-01T15:45:56.000Z", "metric": "c", "value": 0.1}
         """
-        ),
-    )
-    with mock.patch(  # noqa: SIM117
+    with mock.patch(
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
-        with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=resp_mock,
-        ):
-            mtsf = await load_single_multitsframe_from_adapter(
-                FilteredSource(
-                    ref_id="id_1",
-                    type="multitsframe",
-                    filters={
-                        "from": "2019-08-01T15:45:30.000Z",
-                        "to": "2019-08-01T15:46:00.000Z",
-                    },
-                ),
+        mtsf = await load_single_multitsframe_from_adapter(
+            FilteredSource(
+                ref_id="id_1",
+                type="multitsframe",
+                filters={
+                    "from": "2019-08-01T15:45:30.000Z",
+                    "to": "2019-08-01T15:46:00.000Z",
+                },
+            ),
+            adapter_key="end_to_end_load_multitsframe",
+        )
+        assert mtsf.shape == (9, 3)
+        assert len(mtsf.attrs) == 2
+        assert mtsf.attrs["from"] == "2019-08-01T15:45:30.000Z"
+
+        with pytest.raises(AdapterClientWiringInvalidError):
+            mtsf = await load_data(
+                {"inp_1": FilteredSource(ref_id="id_1", type=ExternalType.MULTITSFRAME)},
                 adapter_key="end_to_end_load_multitsframe",
             )
-            assert mtsf.shape == (9, 3)
-            assert len(mtsf.attrs) == 2
-            assert mtsf.attrs["from"] == "2019-08-01T15:45:30.000Z"
-
-            with pytest.raises(AdapterClientWiringInvalidError):
-                mtsf = await load_data(
-                    {"inp_1": FilteredSource(ref_id="id_1", type=ExternalType.MULTITSFRAME)},
-                    adapter_key="end_to_end_load_multitsframe",
-                )
 
 
 @pytest.mark.asyncio
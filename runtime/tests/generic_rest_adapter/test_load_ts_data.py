@@ -1,39 +1,37 @@
-import io
 from unittest import mock
 
+import httpx
 import pandas as pd
 import pytest
-import requests
 
 from hetdesrun.adapters.exceptions import (
     AdapterClientWiringInvalidError,
     AdapterConnectionError,
+    AdapterHandlingException,
 )
 from hetdesrun.adapters.generic_rest import (
     load_data,
     load_grouped_timeseries_data_together,
 )
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
-from hetdesrun.adapters.generic_rest.load_ts_data import load_ts_data_from_adapter
+from hetdesrun.adapters.generic_rest.load_ts_data import (
+    load_ts_data_from_adapter,
+    split_loaded_data_by_timeseries_id,
+)
 from hetdesrun.models.data_selection import FilteredSource
 
 
 @pytest.mark.asyncio
-async def test_load_ts_adapter_request():
+async def test_load_ts_adapter_request(framelike_response_mock):
     with mock.patch(
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
-        resp_mock = mock.Mock()
-        resp_mock.status_code = 200
-        resp_mock.raw = io.StringIO(
-            """\n
+        framelike_response_mock.content = b"""\n
             {"timeseriesId": "1", "timestamp": "2020-03-11T13:45:18.194000000Z", "value": 42.3}
             {"timeseriesId": "1", "timestamp": "2020-03-11T14:45:18.194000000Z", "value": 41.7}
             {"timeseriesId": "1", "timestamp": "2020-03-11T15:45:18.194000000Z", "value": 15.89922333}
             """
-        )
-        resp_mock.headers = {}
 
         filtered_sources = [
             FilteredSource(
@@ -53,57 +51,55 @@ async def test_load_ts_adapter_request():
                 ("to", "2020-01-01T00:00:00Z"),
             }
         )
-        with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=resp_mock,
-        ) as get_request_mock:
-            df = await load_ts_data_from_adapter(
-                filtered_sources,
-                filter_params=filter_params,
-                adapter_key="test_load_ts_generic_adapter_key",
-            )
-
-            assert df.shape == (3, 3)
-            assert df["timeseriesId"].dtype == "string"
-
-            assert get_request_mock.call_count == 1
-            kwargs = get_request_mock.call_args.kwargs
-            assert len(kwargs["params"]) == 4
-            assert ("id", "1") in kwargs["params"]
-            assert ("filter_key", "filter_value") in kwargs["params"]
-            assert ("from", "2018-09-01T00:00:00Z") in kwargs["params"]
-            assert ("to", "2020-01-01T00:00:00Z") in kwargs["params"]
-
-            resp_mock.status_code = 400
-            resp_mock.text = "my adapter error"
-            with pytest.raises(AdapterConnectionError, match="my adapter error"):
-                await load_ts_data_from_adapter(
-                    filtered_sources,
-                    filter_params=filter_params,
-                    adapter_key="test_load_ts_generic_adapter_key",
-                )
+        df = await load_ts_data_from_adapter(
+            filtered_sources,
+            filter_params=filter_params,
+            adapter_key="test_load_ts_generic_adapter_key",
+        )
 
-            resp_mock.status_code = 404
-            resp_mock.text = "errorCode"
-            resp_mock.json = mock.Mock(return_value={"errorCode": "RESULT_EMPTY"})
+        assert df.shape == (3, 3)
+        assert df["timeseriesId"].dtype == "string"
 
-            df = await load_ts_data_from_adapter(
+        assert len(framelike_response_mock.requests) == 1
+        params = framelike_response_mock.requests[0].url.params.multi_items()
+        assert str(framelike_response_mock.requests[0].url).startswith(
+            "https://hetida.de/timeseries"
+        )
+        assert len(params) == 4
+        assert ("id", "1") in params
+        assert ("filter_key", "filter_value") in params
+        assert ("from", "2018-09-01T00:00:00Z") in params
+        assert ("to", "2020-01-01T00:00:00Z") in params
+
+        framelike_response_mock.status_code = 400
+        framelike_response_mock.content = b"my adapter error"
+        with pytest.raises(AdapterConnectionError, match="my adapter error"):
+            await load_ts_data_from_adapter(
                 filtered_sources,
                 filter_params=filter_params,
                 adapter_key="test_load_ts_generic_adapter_key",
             )
 
-            assert df.shape == (0, 3)
+        framelike_response_mock.status_code = 404
+        framelike_response_mock.content = b'{"errorCode": "RESULT_EMPTY"}'
 
-            resp_mock.status_code = 200
-            resp_mock.raw = io.StringIO("")
-            df = await load_ts_data_from_adapter(
-                filtered_sources,
-                filter_params=filter_params,
-                adapter_key="test_load_ts_generic_adapter_key",
-            )
+        df = await load_ts_data_from_adapter(
+            filtered_sources,
+            filter_params=filter_params,
+            adapter_key="test_load_ts_generic_adapter_key",
+        )
 
-            assert df.shape == (0, 3)
+        assert df.shape == (0, 3)
+
+        framelike_response_mock.status_code = 200
+        framelike_response_mock.content = b""
+        df = await load_ts_data_from_adapter(
+            filtered_sources,
+            filter_params=filter_params,
+            adapter_key="test_load_ts_generic_adapter_key",
+        )
+
+        assert df.shape == (0, 3)
 
 
 async def mock_load_generic_rest_ts_data(*args, **kwargs):
@@ -368,18 +364,14 @@ async def test_end_to_end_load_empty_ts_data_with_attrs():
 
 
 @pytest.mark.asyncio
-async def test_end_to_end_load_ts_with_exception():
+async def test_end_to_end_load_ts_with_exception(framelike_response_mock):
     with mock.patch(
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
-        with (
-            mock.patch(
-                "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-                return_value=mock.Mock(status_code=422, text="my adapter error"),
-            ),
-            pytest.raises(AdapterConnectionError, match="my adapter error"),
-        ):
+        framelike_response_mock.status_code = 422
+        framelike_response_mock.content = b"my adapter error"
+        with pytest.raises(AdapterConnectionError, match="my adapter error"):
             await load_data(
                 {
                     "inp_1": FilteredSource(
@@ -394,13 +386,8 @@ async def test_end_to_end_load_ts_with_exception():
                 adapter_key="end_to_end_only_ts_data",
             )
 
-        with (
-            mock.patch(
-                "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-                side_effect=requests.HTTPError("my http error"),
-            ),
-            pytest.raises(AdapterConnectionError, match="my http error"),
-        ):
+        framelike_response_mock.error = httpx.ConnectError("my http error")
+        with pytest.raises(AdapterConnectionError, match="my http error"):
             await load_data(
                 {
                     "inp_1": FilteredSource(
@@ -414,3 +401,39 @@ async def test_end_to_end_load_ts_with_exception():
                 },
                 adapter_key="end_to_end_only_ts_data",
             )
+
+
+def test_split_loaded_data_by_timeseries_id():
+    df = pd.DataFrame(
+        {
+            "timeseriesId": pd.array(["b", "a", "c", "a", "b", "a"], dtype="string"),
+            "timestamp": pd.to_datetime(
+                [
+                    "2020-01-01T00:00:02Z",
+                    "2020-01-01T00:00:03Z",
+                    "2020-01-01T00:00:01Z",
+                    "2020-01-01T00:00:01Z",
+                    "2020-01-01T00:00:01Z",
+                    "2020-01-01T00:00:02Z",
+                ]
+            ),
+            "value": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        }
+    )
+    df.attrs = {"a": {"unit": "m"}}
+
+    series_by_id = split_loaded_data_by_timeseries_id(df, ["a", "b", "d"])
+
+    assert list(series_by_id) == ["a", "b", "d"]
+    assert series_by_id["a"].tolist() == [4.0, 6.0, 2.0]
+    assert series_by_id["a"].index.is_monotonic_increasing
+    assert series_by_id["a"].index.name == "timestamp"
+    assert series_by_id["a"].name == "a"
+    assert series_by_id["a"].attrs == {"unit": "m"}
+    assert series_by_id["b"].tolist() == [5.0, 1.0]
+    assert series_by_id["b"].attrs == {}
+    assert len(series_by_id["d"]) == 0
+    assert series_by_id["d"].dtype == "float64"
+
+    with pytest.raises(AdapterHandlingException, match="Missing keys"):
+        split_loaded_data_by_timeseries_id(df.drop(columns="value"), ["a"])
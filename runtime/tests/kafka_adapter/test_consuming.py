@@ -13,6 +13,12 @@ from hetdesrun.adapters.kafka.models import (
 KafkaRawMessage = namedtuple("KafkaRawMessage", ["value"])
 
 
+@pytest.fixture(autouse=True)
+def _mocked_get_kafka_consumer():
+    with mock.patch("hetdesrun.adapters.kafka.clients.get_kafka_consumer"):
+        yield
+
+
 @pytest.fixture
 def mocked_receive_kafka_message():
     with mock.patch(
@@ -86,7 +92,7 @@ async def test_kafka_adapter_consuming_any_single_value_message_via_execution_en
     assert resp.status_code == 200
     assert resp.json()["error"] is None
 
-    mocked_receive_kafka_message.assert_called_once_with(mock.ANY)
+    mocked_receive_kafka_message.assert_called_once_with(mock.ANY, commit=False)
 
     assert resp.json()["output_results_by_output_name"]["output"] == {
         "a": 42.3,
@@ -128,7 +134,7 @@ async def test_kafka_adapter_consuming_any_multi_value_message_via_execution_end
     assert resp.status_code == 200
     assert resp.json()["error"] is None
 
-    mocked_receive_multi_value_kafka_message.assert_called_once_with(mock.ANY)
+    mocked_receive_multi_value_kafka_message.assert_called_once_with(mock.ANY, commit=False)
 
     assert resp.json()["output_results_by_output_name"]["output"] == {
         "a": 42.3,
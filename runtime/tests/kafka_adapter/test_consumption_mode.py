@@ -1,11 +1,28 @@
+import asyncio
 import string
 import uuid
+from collections import namedtuple
 from unittest import mock
 
+import pandas as pd
 import pytest
+from aiokafka.structs import TopicPartition
 
-from hetdesrun.adapters.kafka.consumption_mode import start_consumption_mode
-from hetdesrun.adapters.kafka.models import KafkaSingleValueMessage
+from hetdesrun.adapters.generic_rest.external_types import ExternalType
+from hetdesrun.adapters.kafka.consumption_mode import (
+    ConcurrentMessageProcessor,
+    collect_batch,
+    start_consumption_mode,
+)
+from hetdesrun.adapters.kafka.context import bind_kafka_messages, clear_kafka_messages_context
+from hetdesrun.adapters.kafka.models import (
+    KafkaConfig,
+    KafkaMessageValueRepresentation,
+    KafkaMultiValueMessage,
+    KafkaReceiveValue,
+    KafkaSingleValueMessage,
+)
+from hetdesrun.adapters.kafka.receive import receive_kafka_message
 from hetdesrun.models.execution import ExecByIdBase
 from hetdesrun.models.wiring import WorkflowWiring
 
@@ -34,6 +51,7 @@ class MockKafkaConsumer:
             mock_msg.partition = 42
             mock_msg.offset = 42
             mock_msg.timestamp = "unknown timestamp"
+            mock_msg.headers = []
             return mock_msg
         raise StopAsyncIteration
 
@@ -107,3 +125,341 @@ async def test_consumption_mode(
             }
         """
     ) in string_without_whitespace(caplog.text)
+
+
+ConsumerRecord = namedtuple(
+    "ConsumerRecord",
+    ["topic", "partition", "offset", "key", "value", "timestamp", "headers"],
+    defaults=[()],
+)
+
+
+class CommitRecordingConsumer:
+    def __init__(self):
+        self.commits = []
+
+    async def commit(self, offsets=None):
+        self.commits.append(offsets)
+
+
+def concurrent_kafka_config(**kwargs):
+    return KafkaConfig(
+        display_name="Concurrent",
+        topic="topic",
+        consumer_config={"group_id": "group", "enable_auto_commit": False},
+        consumer_commit_after=True,
+        consumption_mode_max_concurrent_messages=4,
+        **kwargs,
+    )
+
+
+async def process_messages(processor, records):
+    for record in records:
+        await processor.submit([record])
+        await processor.wait_for_free_slot()
+        if processor.failure is not None:
+            break
+    await processor.drain()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_message_processing_keeps_partition_order_and_commits():
+    records = [
+        ConsumerRecord("topic", partition, offset, None, b"", 0)
+        for offset in range(4)
+        for partition in range(2)
+    ]
+    running = set()
+    max_running = 0
+    handled = []
+
+    async def handle_messages(kafka_msgs, kafka_config_key, multi, batched):
+        nonlocal max_running
+        [kafka_msg] = kafka_msgs
+        running.add(kafka_msg)
+        max_running = max(max_running, len(running))
+        # earlier messages take longer
+        await asyncio.sleep(0.01 * (4 - kafka_msg.offset))
+        running.discard(kafka_msg)
+        handled.append((kafka_msg.partition, kafka_msg.offset))
+
+    consumer = CommitRecordingConsumer()
+    processor = ConcurrentMessageProcessor(
+        consumer, "config_key", concurrent_kafka_config(), multi=False
+    )
+    with mock.patch("hetdesrun.adapters.kafka.consumption_mode.handle_messages", handle_messages):
+        await process_messages(processor, records)
+
+    assert max_running == 2
+    for partition in range(2):
+        assert [offset for p, offset in handled if p == partition] == [0, 1, 2, 3]
+    assert processor.offset_tracker.committed == {
+        TopicPartition("topic", 0): 4,
+        TopicPartition("topic", 1): 4,
+    }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_message_processing_commits_only_completed_offsets():
+    records = [ConsumerRecord("topic", 0, offset, None, b"", 0) for offset in range(6)]
+
+    async def handle_messages(kafka_msgs, kafka_config_key, multi, batched):
+        if kafka_msgs[0].offset == 1:
+            await asyncio.sleep(0.05)
+            raise ValueError("failed")
+
+    consumer = CommitRecordingConsumer()
+    processor = ConcurrentMessageProcessor(
+        consumer, "config_key", concurrent_kafka_config(consumption_mode_ordering="none"), False
+    )
+    with mock.patch("hetdesrun.adapters.kafka.consumption_mode.handle_messages", handle_messages):
+        await process_messages(processor, records)
+
+    assert isinstance(processor.failure, ValueError)
+    assert processor.exception_occured
+    # messages after the failed one were handled concurrently, but are not committed
+    assert consumer.commits == [{TopicPartition("topic", 0): 1}]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_message_processing_forgets_revoked_partitions():
+    records = [
+        ConsumerRecord("topic", partition, offset, None, b"", 0)
+        for offset in range(2)
+        for partition in range(2)
+    ]
+    revoked = TopicPartition("topic", 1)
+    consumer = CommitRecordingConsumer()
+    # without consumer_commit_after and with auto commit, offsets are committed manually
+    processor = ConcurrentMessageProcessor(
+        consumer,
+        "config_key",
+        KafkaConfig(
+            display_name="Concurrent",
+            topic="topic",
+            consumer_config={"group_id": "group"},
+            consumption_mode_max_concurrent_messages=4,
+            consumption_mode_ordering="none",
+        ),
+        multi=False,
+    )
+    assert processor.commit_after
+
+    async def handle_messages(kafka_msgs, kafka_config_key, multi, batched):
+        [kafka_msg] = kafka_msgs
+        if kafka_msg.partition == 1 and kafka_msg.offset == 0:
+            processor.partitions_revoked([revoked])
+
+    with mock.patch("hetdesrun.adapters.kafka.consumption_mode.handle_messages", handle_messages):
+        await process_messages(processor, records)
+
+    assert processor.failure is None
+    # completing messages of the revoked partition does not commit it anymore
+    assert revoked not in consumer.commits[-1]
+    assert processor.offset_tracker.committed == {TopicPartition("topic", 0): 2}
+
+
+async def async_records(records, delay_after=None):
+    for number, record in enumerate(records):
+        if number == delay_after:
+            await asyncio.sleep(1)
+        yield record
+
+
+@pytest.mark.asyncio
+async def test_collect_batch():
+    records = [ConsumerRecord("topic", 0, offset, None, b"", 0) for offset in range(5)]
+
+    kafka_msgs = async_records(records)
+    batch, exhausted = await collect_batch(kafka_msgs, await anext(kafka_msgs), 3, 1000)
+    assert batch == records[:3]
+    assert not exhausted
+    batch, exhausted = await collect_batch(kafka_msgs, await anext(kafka_msgs), 3, 1000)
+    assert batch == records[3:]
+    assert exhausted
+
+    kafka_msgs = async_records(records, delay_after=2)
+    batch, exhausted = await collect_batch(kafka_msgs, await anext(kafka_msgs), 5, 20)
+    assert batch == records[:2]
+    assert not exhausted
+
+
+class MockMultiMessageKafkaConsumer(MockKafkaConsumer):
+    def __init__(self, topic, msg_objects):
+        self.msg_strs = [msg_object.json() for msg_object in msg_objects]
+        self.topic = topic
+
+    def __aiter__(self):
+        return async_records(
+            [
+                ConsumerRecord(self.topic, 0, offset, None, msg_str.encode("utf8"), 0)
+                for offset, msg_str in enumerate(self.msg_strs)
+            ]
+        )
+
+
+@pytest.mark.asyncio
+async def test_consumption_mode_with_batches(
+    two_kafka_configs,
+    _db_with_pass_through_component,  # noqa: PT019
+    caplog,
+):
+    two_kafka_configs["test_kafka_config2"] = KafkaConfig(
+        display_name="Test Kafka Config No 2",
+        topic="multi ts ingestion",
+        consumable=True,
+        consumption_mode_batch_max_messages=2,
+        consumption_mode_batch_max_wait_ms=1000,
+    )
+    payloads = [
+        KafkaSingleValueMessage(value={"value": {"number": number}, "data_type": "metadata(any)"})
+        for number in range(3)
+    ]
+    with (
+        mock.patch(
+            "hetdesrun.webservice.config.runtime_config.hd_kafka_consumption_mode",
+            new=ExecByIdBase(
+                id=uuid.UUID("1946d5f8-44a8-724c-176f-16f3e49963af"),
+                wiring=WorkflowWiring(
+                    input_wirings=[
+                        {
+                            "adapter_id": "kafka",
+                            "ref_id": "base",
+                            "ref_id_type": "THINGNODE",
+                            "ref_key": "test_kafka_config2_metadata(any)",
+                            "type": "metadata(any)",
+                            "filters": {"message_value_key": ""},
+                            "use_default_value": False,
+                            "workflow_input_name": "input",
+                        }
+                    ]
+                ),
+            ),
+        ),
+        mock.patch(
+            "hetdesrun.adapters.kafka.consumption_mode.create_aiokafka_consumer",
+            return_value=MockMultiMessageKafkaConsumer(
+                topic="multi ts ingestion", msg_objects=payloads
+            ),
+        ),
+    ):
+        await start_consumption_mode()
+
+    assert caplog.text.count("via Kakfa consumption mode from 2 message(s)") == 2
+    assert caplog.text.count("via Kakfa consumption mode from 1 message(s)") == 2
+    log_text = string_without_whitespace(caplog.text)
+    # values of metadata sources are passed as list of the values of all messages
+    assert string_without_whitespace('"output": [{"number": 0}, {"number": 1}]') in log_text
+    assert string_without_whitespace('"output": [{"number": 2}]') in log_text
+
+
+@pytest.mark.asyncio
+async def test_concurrent_consumption_mode_disables_auto_commit(
+    two_kafka_configs,
+    _db_with_pass_through_component,  # noqa: PT019
+):
+    two_kafka_configs["test_kafka_config2"] = KafkaConfig(
+        display_name="Test Kafka Config No 2",
+        topic="multi ts ingestion",
+        consumable=True,
+        consumer_config={"group_id": "group"},
+        consumption_mode_max_concurrent_messages=2,
+    )
+    payloads = [
+        KafkaSingleValueMessage(value={"value": {"number": number}, "data_type": "metadata(any)"})
+        for number in range(2)
+    ]
+    consumer = MockMultiMessageKafkaConsumer(topic="multi ts ingestion", msg_objects=payloads)
+    consumer.commit = mock.AsyncMock()
+    with (
+        mock.patch(
+            "hetdesrun.webservice.config.runtime_config.hd_kafka_consumption_mode",
+            new=ExecByIdBase(
+                id=uuid.UUID("1946d5f8-44a8-724c-176f-16f3e49963af"),
+                wiring=WorkflowWiring(
+                    input_wirings=[
+                        {
+                            "adapter_id": "kafka",
+                            "ref_id": "base",
+                            "ref_id_type": "THINGNODE",
+                            "ref_key": "test_kafka_config2_metadata(any)",
+                            "type": "metadata(any)",
+                            "filters": {"message_value_key": ""},
+                            "use_default_value": False,
+                            "workflow_input_name": "input",
+                        }
+                    ]
+                ),
+            ),
+        ),
+        mock.patch(
+            "hetdesrun.adapters.kafka.consumption_mode.create_aiokafka_consumer",
+            return_value=consumer,
+        ) as mocked_create_consumer,
+    ):
+        await start_consumption_mode()
+
+    consumer_config = mocked_create_consumer.call_args.args[1]
+    assert consumer_config == {"group_id": "group", "enable_auto_commit": False}
+    assert mocked_create_consumer.call_args.kwargs["listener"] is not None
+    # offsets are committed after the messages were handled
+    assert consumer.commit.await_args_list[-1].args == ({TopicPartition(consumer.topic, 0): 2},)
+
+
+@pytest.mark.asyncio
+async def test_receive_batched_multitsframes(two_kafka_configs):
+    multitsframes = [
+        pd.DataFrame(
+            {
+                "metric": ["a", "b"],
+                "timestamp": pd.to_datetime(
+                    [f"2024-01-01T0{hour}:00:00+00:00", f"2024-01-01T0{hour}:30:00+00:00"]
+                ),
+                "value": [float(hour), 2.0 * hour],
+            }
+        )
+        for hour in range(3)
+    ]
+    kafka_config = two_kafka_configs["test_kafka_config1"]
+    bind_kafka_messages(
+        {
+            "test_kafka_config1": [
+                KafkaMultiValueMessage.parse_raw(
+                    KafkaMultiValueMessage(
+                        values={
+                            "frame": KafkaMessageValueRepresentation(
+                                value=multitsframe, data_type=ExternalType.MULTITSFRAME
+                            ),
+                            "count": KafkaMessageValueRepresentation(
+                                value=number, data_type=ExternalType.METADATA_INT
+                            ),
+                        }
+                    ).json()
+                )
+                for number, multitsframe in enumerate(multitsframes)
+            ]
+        }
+    )
+    try:
+        received = await receive_kafka_message(
+            {
+                value_key: KafkaReceiveValue(
+                    kafka_config_key="test_kafka_config1",
+                    message_identifier="",
+                    message_value_key=value_key,
+                    kafka_config=kafka_config,
+                    external_type=external_type,
+                    input_name=value_key,
+                )
+                for value_key, external_type in (
+                    ("frame", ExternalType.MULTITSFRAME),
+                    ("count", ExternalType.METADATA_INT),
+                )
+            }
+        )
+    finally:
+        clear_kafka_messages_context()
+
+    assert received["count"] == [0, 1, 2]
+    assert len(received["frame"]) == 6
+    assert list(received["frame"]["value"]) == [0.0, 0.0, 1.0, 2.0, 2.0, 4.0]
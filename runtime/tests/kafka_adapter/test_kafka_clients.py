@@ -0,0 +1,122 @@
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+
+from hetdesrun.adapters.generic_rest.external_types import ExternalType
+from hetdesrun.adapters.kafka.clients import (
+    close_kafka_clients,
+    exclusive_kafka_consumer,
+    get_kafka_consumer,
+    get_kafka_producer,
+)
+from hetdesrun.adapters.kafka.models import KafkaMessageValue
+from hetdesrun.adapters.kafka.send import send_kafka_message
+
+
+class MockKafkaClient:
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self._closed = None
+        self.sent = []
+
+    async def start(self):
+        self._closed = False
+
+    async def stop(self):
+        self._closed = True
+
+    async def send_and_wait(self, topic, key, value, headers=None):  # noqa: ARG002
+        self.sent.append((topic, key, value))
+
+
+@pytest.fixture
+def mocked_aiokafka_clients():
+    with (
+        mock.patch(
+            "hetdesrun.adapters.kafka.clients.aiokafka.AIOKafkaProducer",
+            side_effect=MockKafkaClient,
+        ) as producer_class,
+        mock.patch(
+            "hetdesrun.adapters.kafka.clients.aiokafka.AIOKafkaConsumer",
+            side_effect=MockKafkaClient,
+        ) as consumer_class,
+    ):
+        yield producer_class, consumer_class
+
+
+@pytest.mark.asyncio
+async def test_kafka_clients_are_reused_and_recreated(two_kafka_configs, mocked_aiokafka_clients):
+    producer_class, consumer_class = mocked_aiokafka_clients
+    config = two_kafka_configs["test_kafka_config1"]
+
+    producer = await get_kafka_producer("test_kafka_config1", config)
+    assert await get_kafka_producer("test_kafka_config1", config) is producer
+    assert await get_kafka_producer("test_kafka_config2", config) is not producer
+    assert producer_class.call_count == 2
+
+    async with exclusive_kafka_consumer("test_kafka_config1", config) as consumer:
+        assert consumer.args == ("multi ts ingestion",)
+    assert await get_kafka_consumer("test_kafka_config1", config) is consumer
+    assert consumer_class.call_count == 1
+
+    # stopped clients are not healthy anymore
+    await producer.stop()
+    assert await get_kafka_producer("test_kafka_config1", config) is not producer
+    assert producer_class.call_count == 3
+
+    await close_kafka_clients()
+    assert consumer._closed is True
+    assert await get_kafka_consumer("test_kafka_config1", config) is not consumer
+    await close_kafka_clients()
+
+
+@pytest.mark.asyncio
+async def test_sending_uses_one_producer(two_kafka_configs, mocked_aiokafka_clients):
+    producer_class, _ = mocked_aiokafka_clients
+    msg_dict = {
+        None: KafkaMessageValue(
+            kafka_config_key="test_kafka_config2",
+            message_identifier="",
+            message_value_key=None,
+            kafka_config=two_kafka_configs["test_kafka_config2"],
+            external_type=ExternalType.METADATA_INT,
+            output_name="some_output",
+            value=42,
+        )
+    }
+
+    for _ in range(3):
+        await send_kafka_message(msg_dict)
+
+    assert producer_class.call_count == 1
+    producer = await get_kafka_producer(
+        "test_kafka_config2", two_kafka_configs["test_kafka_config2"]
+    )
+    assert len(producer.sent) == 3
+    await close_kafka_clients()
+
+
+@pytest.mark.asyncio
+async def test_kafka_clients_of_other_event_loop_are_stopped(
+    two_kafka_configs, mocked_aiokafka_clients
+):
+    config = two_kafka_configs["test_kafka_config1"]
+    other_loop = asyncio.new_event_loop()
+    other_thread = threading.Thread(target=other_loop.run_forever)
+    other_thread.start()
+    try:
+        producer = asyncio.run_coroutine_threadsafe(
+            get_kafka_producer("test_kafka_config1", config), other_loop
+        ).result()
+        assert await get_kafka_producer("test_kafka_config1", config) is not producer
+        # let the other event loop run the scheduled stop
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result()
+        assert producer._closed is True
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        other_thread.join()
+        other_loop.close()
+    await close_kafka_clients()
@@ -0,0 +1,212 @@
+from collections import namedtuple
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hetdesrun.adapters.exceptions import AdapterHandlingException
+from hetdesrun.adapters.generic_rest.external_types import ExternalType
+from hetdesrun.adapters.kafka.encoding import (
+    COMPRESSION_HEADER,
+    ENCODING_HEADER,
+    UNCOMPRESSED_SIZE_HEADER,
+    decode_message,
+    encode_message,
+)
+from hetdesrun.adapters.kafka.models import (
+    KafkaConfig,
+    KafkaMessageValueRepresentation,
+    KafkaMultiValueMessage,
+    KafkaReceiveValue,
+    KafkaSingleValueMessage,
+)
+from hetdesrun.adapters.kafka.receive import receive_kafka_message
+
+KafkaRawMessage = namedtuple("KafkaRawMessage", ["value", "headers"])
+
+
+def multits_frame(num_points: int = 3) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=num_points, freq="s", tz="UTC"),
+            "metric": pd.Series(["a", "b", "c"]).sample(num_points, replace=True, random_state=1),
+            "value": np.random.default_rng(42).random(num_points),
+        }
+    ).reset_index(drop=True)
+
+
+def multi_value_message() -> KafkaMultiValueMessage:
+    series = pd.Series(
+        [1.0, None, 3.5],
+        index=pd.date_range("2024-01-01", periods=3, freq="h", tz="UTC"),
+        name="temperature",
+    )
+    series.attrs = {"unit": "K"}
+    return KafkaMultiValueMessage(
+        job_id="some_job",
+        values={
+            "frame": KafkaMessageValueRepresentation(
+                value=multits_frame(), data_type=ExternalType.MULTITSFRAME
+            ),
+            "series": KafkaMessageValueRepresentation(
+                value=series, data_type=ExternalType.TIMESERIES_NUMERIC
+            ),
+            "metadata": KafkaMessageValueRepresentation(
+                value={"a": [1, 2], "b": "test"}, data_type=ExternalType.METADATA_ANY
+            ),
+        },
+    )
+
+
+@pytest.mark.parametrize("encoding", ["json", "msgpack", "arrow", "parquet"])
+@pytest.mark.parametrize("compression", [None, "zstd", "lz4", "gzip"])
+def test_encoded_messages_can_be_decoded(encoding, compression):
+    msg_object = multi_value_message()
+    encoded_message, headers = encode_message(msg_object, encoding, compression)
+
+    if encoding == "json" and compression is None:
+        assert headers is None
+    else:
+        assert (ENCODING_HEADER, encoding.encode("utf8")) in headers
+        assert dict(headers).get(COMPRESSION_HEADER) == (
+            None if compression is None else compression.encode("utf8")
+        )
+
+    decoded = decode_message(encoded_message, headers=headers, multi=True)
+    assert isinstance(decoded, KafkaMultiValueMessage)
+    assert decoded.job_id == "some_job"
+    assert decoded.message_creation_timestamp == msg_object.message_creation_timestamp
+    assert decoded.values["metadata"].value == {"a": [1, 2], "b": "test"}  # noqa: PD011
+    if encoding in ("arrow", "parquet"):
+        # Pandas objects are restored completely instead of their JSON representation
+        pd.testing.assert_frame_equal(
+            decoded.values["frame"].value,  # noqa: PD011
+            msg_object.values["frame"].value,  # noqa: PD011
+        )
+        pd.testing.assert_series_equal(
+            decoded.values["series"].value,  # noqa: PD011
+            msg_object.values["series"].value,  # noqa: PD011
+            check_freq=False,
+        )
+        assert decoded.values["series"].value.attrs == {"unit": "K"}  # noqa: PD011
+    assert decoded.json() == msg_object.json()
+
+
+def test_arrow_encoding_is_smaller_than_json():
+    msg_object = KafkaSingleValueMessage(
+        value=KafkaMessageValueRepresentation(
+            value=multits_frame(10000), data_type=ExternalType.MULTITSFRAME
+        )
+    )
+    json_size = len(encode_message(msg_object)[0])
+    assert len(encode_message(msg_object, "arrow")[0]) < json_size / 2
+    assert len(encode_message(msg_object, "arrow", "zstd")[0]) < json_size / 4
+
+
+def test_pandas_objects_not_representable_in_arrow_are_encoded_as_json():
+    msg_object = KafkaSingleValueMessage(
+        value=KafkaMessageValueRepresentation(
+            value=pd.DataFrame({"mixed": [1, "a", None]}), data_type=ExternalType.DATAFRAME
+        )
+    )
+    encoded_message, headers = encode_message(msg_object, "arrow")
+    decoded = decode_message(encoded_message, headers=headers)
+    assert decoded.value.value["__hd_wrapped_data_object__"] == "DATAFRAME"  # noqa: PD011
+
+
+def test_decoding_unknown_encoding_or_compression_fails():
+    with pytest.raises(ValueError, match="Unknown Kafka message encoding"):
+        decode_message(b"", headers=[(ENCODING_HEADER, b"avro")])
+    with pytest.raises(ValueError, match="Unknown Kafka message compression"):
+        decode_message(b"", headers=[(COMPRESSION_HEADER, b"lzma")])
+    with pytest.raises(ValueError, match="lacks the hd-uncompressed-size header"):
+        decode_message(b"", headers=[(COMPRESSION_HEADER, b"zstd")])
+
+
+def test_decoding_ignores_foreign_binary_and_null_headers():
+    msg_object = multi_value_message()
+    encoded_message, _ = encode_message(msg_object)
+
+    decoded = decode_message(
+        encoded_message,
+        headers=[("trace-id", b"\xff\xfe"), ("empty", None), (ENCODING_HEADER, None)],
+        multi=True,
+    )
+    assert decoded.job_id == "some_job"
+
+    encoded_message, headers = encode_message(msg_object, "msgpack", "zstd")
+    decoded = decode_message(
+        encoded_message, headers=[("trace-id", b"\xff\xfe"), *headers], multi=True
+    )
+    assert decoded.values["metadata"].value == {"a": [1, 2], "b": "test"}  # noqa: PD011
+
+    with pytest.raises(ValueError, match="is not valid UTF-8"):
+        decode_message(encoded_message, headers=[(ENCODING_HEADER, b"\xff\xfe")])
+
+
+@pytest.mark.parametrize("uncompressed_size", [b"abc", b"-1", b"1000001"])
+def test_decoding_rejects_invalid_or_too_large_uncompressed_size(uncompressed_size):
+    encoded_message, _ = encode_message(multi_value_message(), "msgpack", "zstd")
+    with pytest.raises(ValueError, match="Invalid hd-uncompressed-size|exceeds the maximum"):
+        decode_message(
+            encoded_message,
+            headers=[
+                (ENCODING_HEADER, b"msgpack"),
+                (COMPRESSION_HEADER, b"zstd"),
+                (UNCOMPRESSED_SIZE_HEADER, uncompressed_size),
+            ],
+            multi=True,
+            max_uncompressed_size=1000000,
+        )
+
+
+def test_kafka_config_rejects_unavailable_compression():
+    with (
+        mock.patch(
+            "hetdesrun.adapters.kafka.models.message_compression_available", return_value=False
+        ),
+        pytest.raises(ValueError, match="not supported by pyarrow"),
+    ):
+        KafkaConfig(display_name="Test", topic="test", message_compression="zstd")
+
+
+@pytest.mark.asyncio
+async def test_receiving_messages_according_to_their_headers():
+    kafka_config = KafkaConfig(display_name="Test", topic="test", consumable=True)
+    receive_message_dict = {
+        key: KafkaReceiveValue(
+            kafka_config_key="test_config",
+            message_identifier="",
+            message_value_key=key,
+            kafka_config=kafka_config,
+            external_type=external_type,
+            input_name=key,
+        )
+        for key, external_type in [
+            ("frame", ExternalType.MULTITSFRAME),
+            ("metadata", ExternalType.METADATA_ANY),
+        ]
+    }
+    msg_object = multi_value_message()
+
+    with mock.patch("hetdesrun.adapters.kafka.clients.get_kafka_consumer"):
+        with mock.patch(
+            "hetdesrun.adapters.kafka.receive.receive_encoded_message",
+            return_value=KafkaRawMessage(*encode_message(msg_object, "parquet", "lz4")),
+        ):
+            received = await receive_kafka_message(receive_message_dict)
+        pd.testing.assert_frame_equal(
+            received["frame"],
+            msg_object.values["frame"].value,  # noqa: PD011
+        )
+        assert received["metadata"] == {"a": [1, 2], "b": "test"}
+
+        with (
+            mock.patch(
+                "hetdesrun.adapters.kafka.receive.receive_encoded_message",
+                return_value=KafkaRawMessage(b"not msgpack", [(ENCODING_HEADER, b"msgpack")]),
+            ),
+            pytest.raises(AdapterHandlingException, match="Error parsing/validating"),
+        ):
+            await receive_kafka_message(receive_message_dict)
@@ -15,7 +15,10 @@ from hetdesrun.adapters.kafka.send import send_kafka_message
 
 @pytest.fixture
 def mocked_send_encoded_message():
-    with mock.patch("hetdesrun.adapters.kafka.send.send_encoded_message") as mocked_send_encoded:
+    with (
+        mock.patch("hetdesrun.adapters.kafka.send.get_kafka_producer"),
+        mock.patch("hetdesrun.adapters.kafka.send.send_encoded_message") as mocked_send_encoded,
+    ):
         yield mocked_send_encoded
 
 
@@ -50,6 +53,7 @@ async def test_producing(two_kafka_configs, mocked_send_encoded_message):
         topic="multi ts ingestion",
         encoded_message=mock.ANY,
         key=None,
+        headers=None,
     )
 
     received_encoded_message = mocked_send_encoded_message.call_args.kwargs["encoded_message"]
@@ -106,6 +110,7 @@ async def test_kafka_adapter_producing_any_single_value_message_via_execution_en
         topic="multi ts ingestion",
         encoded_message=mock.ANY,
         key=None,
+        headers=None,
     )
 
     received_encoded_message = mocked_send_encoded_message.call_args.kwargs["encoded_message"]
@@ -174,6 +179,7 @@ async def test_kafka_adapter_producing_any_multi_value_message_via_execution_end
         topic="multi ts ingestion",
         encoded_message=mock.ANY,
         key=None,
+        headers=None,
     )
 
     received_encoded_message = mocked_send_encoded_message.call_args.kwargs["encoded_message"]
@@ -1,5 +1,6 @@
 from copy import deepcopy
 from sqlite3 import Connection as SQLite3Connection
+from unittest import mock
 from uuid import UUID, uuid4
 
 import pytest
@@ -12,6 +13,7 @@ from hetdesrun.persistence.dbservice.exceptions import DBIntegrityError, DBNotFo
 from hetdesrun.persistence.dbservice.revision import (
     delete_single_transformation_revision,
     get_latest_revision_id,
+    get_latest_revision_id_with_caching,
     get_multiple_transformation_revisions,
     is_modifiable,
     is_unused,
@@ -735,3 +737,54 @@ def test_get_latest_revision_id(mocked_clean_test_db_session):
     assert get_latest_revision_id(tr_template_id) == get_uuid_from_seed(
         "test_get_latest_revision_2"
     )
+
+
+def test_get_latest_revision_id_with_caching(mocked_clean_test_db_session):
+    tr_template_id = get_uuid_from_seed("cached_template")
+    tr_object_template = TransformationRevision(
+        id=get_uuid_from_seed("test_cached_latest_revision_1"),
+        revision_group_id=tr_template_id,
+        name="Test",
+        description="Test description",
+        version_tag="1.0.1",
+        category="Test category",
+        state=State.DRAFT,
+        type=Type.COMPONENT,
+        content="code",
+        io_interface=IOInterface(),
+        test_wiring=WorkflowWiring(),
+        documentation="",
+    )
+    tr_object_1 = tr_object_template.copy()
+    tr_object_1.release()
+    store_single_transformation_revision(tr_object_1)
+
+    with mock.patch(
+        "hetdesrun.persistence.dbservice.revision.get_latest_revision_id",
+        wraps=get_latest_revision_id,
+    ) as mocked_get_latest_revision_id:
+        for _ in range(3):
+            assert get_latest_revision_id_with_caching(tr_template_id) == tr_object_1.id
+        assert mocked_get_latest_revision_id.call_count == 1
+
+        # releasing a new revision invalidates the cached id
+        tr_object_2 = tr_object_template.copy()
+        tr_object_2.id = get_uuid_from_seed("test_cached_latest_revision_2")
+        tr_object_2.version_tag = "1.0.2"
+        store_single_transformation_revision(tr_object_2)
+        tr_object_2.release()
+        update_or_create_single_transformation_revision(tr_object_2)
+        assert get_latest_revision_id_with_caching(tr_template_id) == tr_object_2.id
+
+        # deprecating it as well
+        tr_object_2.deprecate()
+        update_or_create_single_transformation_revision(tr_object_2)
+        assert get_latest_revision_id_with_caching(tr_template_id) == tr_object_1.id
+        assert mocked_get_latest_revision_id.call_count == 3
+
+        with mock.patch(
+            "hetdesrun.webservice.config.runtime_config.latest_revision_id_cache_ttl", 0
+        ):
+            get_latest_revision_id_with_caching(tr_template_id)
+            get_latest_revision_id_with_caching(tr_template_id)
+        assert mocked_get_latest_revision_id.call_count == 5
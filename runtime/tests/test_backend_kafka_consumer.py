@@ -223,7 +223,7 @@ async def test_consumer_successful_exec_by_id_input():
 @pytest.mark.asyncio
 async def test_consumer_successful_exec_latest_by_group_id_input():
     with mock.patch(
-        "hetdesrun.backend.kafka.consumer.get_latest_revision_id",
+        "hetdesrun.backend.kafka.consumer.get_latest_revision_id_with_caching",
         return_value=UUID("79ce1eb1-3ef8-4c74-9114-c856fd88dc89"),
     ) as _mocked_get_latest_id:
         results, kafka_ctx, mocked_producer = await run_kafka_msg(exec_latest_by_group_id_input_msg)
@@ -263,3 +263,63 @@ async def test_consumer_failed_exec_arbitray_exception():
     )
     assert kafka_ctx.last_unhandled_exception is not None
     assert isinstance(kafka_ctx.last_unhandled_exception, Exception)
+
+
+class MockMultiMessageKafkaConsumer(MockKafkaConsumer):
+    def __init__(self, exec_msg_str, number_of_messages):
+        super().__init__(exec_msg_str)
+        self.number_of_messages = number_of_messages
+
+    def __aiter__(self):
+        self.sent = 0
+        return self
+
+    async def __anext__(self):
+        if self.sent < self.number_of_messages:
+            self.sent += 1
+            return mock.Mock(value=self.exec_msg_str.encode("utf8"), key=None)
+        raise StopAsyncIteration
+
+
+@pytest.mark.asyncio
+async def test_consumer_handles_messages_concurrently():
+    running = 0
+    max_running = 0
+
+    async def mock_slow_execute_transformation_revision(*args, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return exec_result
+
+    with (
+        mock.patch(
+            "hetdesrun.webservice.config.runtime_config.hd_kafka_consumer_max_concurrent_executions",
+            3,
+        ),
+        mock.patch(
+            "hetdesrun.backend.kafka.consumer.KafkaWorkerContext.consumer",
+            new_callable=mock.PropertyMock,
+            return_value=MockMultiMessageKafkaConsumer(exec_by_id_input_msg, 7),
+        ),
+        mock.patch(
+            "hetdesrun.backend.kafka.consumer.KafkaWorkerContext.producer", mock.AsyncMock()
+        ) as mocked_producer,
+        mock.patch(
+            "hetdesrun.backend.kafka.consumer.perf_measured_execute_trafo_rev",
+            mock_slow_execute_transformation_revision,
+        ),
+    ):
+        from hetdesrun.backend.kafka.consumer import get_kafka_worker_context
+
+        kafka_ctx = get_kafka_worker_context()
+        kafka_ctx.last_unhandled_exception = None  # reset
+        await kafka_ctx.start()
+        await asyncio.wait([kafka_ctx.consumer_task])
+        await kafka_ctx.stop()
+
+    assert kafka_ctx.last_unhandled_exception is None
+    assert max_running == 3
+    assert mocked_producer.send_and_wait.call_count == 7
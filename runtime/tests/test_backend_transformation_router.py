@@ -5,11 +5,19 @@ from posixpath import join as posix_urljoin
 from unittest import mock
 from uuid import UUID
 
+import pandas as pd
 import pytest
 from fastapi import HTTPException
 
+from hetdesrun.backend.execution import (
+    execution_response_json,
+    prepare_execution_input,
+    run_execution_input,
+)
+from hetdesrun.backend.models.info import ExecutionResponseFrontendDto
 from hetdesrun.component.code import expand_code, update_code
-from hetdesrun.models.execution import ExecByIdInput, ExecLatestByGroupIdInput
+from hetdesrun.models.execution import ExecByIdBatchInput, ExecByIdInput, ExecLatestByGroupIdInput
+from hetdesrun.models.run import WorkflowExecutionResult
 from hetdesrun.models.wiring import InputWiring, WorkflowWiring
 from hetdesrun.persistence.dbservice.nesting import update_or_create_nesting
 from hetdesrun.persistence.dbservice.revision import (
@@ -18,6 +26,7 @@ from hetdesrun.persistence.dbservice.revision import (
     store_single_transformation_revision,
 )
 from hetdesrun.persistence.models.transformation import TransformationRevision
+from hetdesrun.runtime.transport import BINARY_RESULT_MEDIA_TYPE, encode_execution_result
 from hetdesrun.trafoutils.filter.params import FilterParams
 from hetdesrun.trafoutils.io.load import (
     load_json,
@@ -1525,6 +1534,182 @@ async def test_execute_for_transformation_revision_with_missing_input_wiring(
     assert "Workflow Input 'wf_input' has no wiring!" in response.json()["detail"]
 
 
+@pytest.mark.asyncio
+async def test_execute_batch_for_transformation_revision(
+    async_test_client, mocked_clean_test_db_session
+):
+    tr_component_1 = TransformationRevision(**tr_json_component_1)
+    tr_component_1.content = update_code(tr_component_1)
+    store_single_transformation_revision(tr_component_1)
+    tr_workflow_2 = TransformationRevision(**tr_json_workflow_2_update)
+
+    store_single_transformation_revision(tr_workflow_2)
+
+    update_or_create_nesting(tr_workflow_2)
+
+    wiring_with_missing_input = deepcopy(tr_workflow_2.test_wiring)
+    wiring_with_missing_input.input_wirings.pop(0)
+
+    batch_input = ExecByIdBatchInput(
+        id=tr_workflow_2.id,
+        wirings=[
+            wiring_with_missing_input,
+            tr_workflow_2.test_wiring,
+            tr_workflow_2.test_wiring,
+        ],
+        max_concurrent_executions=2,
+    )
+
+    async with async_test_client as ac:
+        response = await ac.post(
+            "/api/transformations/execute-batch",
+            json=json.loads(batch_input.json()),
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    lines_by_index = {line["index"]: line for line in lines}
+    assert sorted(lines_by_index) == [0, 1, 2]
+
+    assert lines_by_index[0]["execution_response"] is None
+    assert "Workflow Input 'wf_input' has no wiring!" in lines_by_index[0]["error"]
+    for index in (1, 2):
+        assert lines_by_index[index]["error"] is None
+        assert lines_by_index[index]["execution_response"]["result"] == "ok"
+        assert (
+            lines_by_index[index]["execution_response"]["job_id"] == lines_by_index[index]["job_id"]
+        )
+    assert lines_by_index[1]["job_id"] != lines_by_index[2]["job_id"]
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_loads_transformation_revision_once_and_reports_unexpected_errors(
+    async_test_client, mocked_clean_test_db_session
+):
+    tr_component_1 = TransformationRevision(**tr_json_component_1)
+    tr_component_1.content = update_code(tr_component_1)
+    store_single_transformation_revision(tr_component_1)
+    tr_workflow_2 = TransformationRevision(**tr_json_workflow_2_update)
+
+    store_single_transformation_revision(tr_workflow_2)
+
+    update_or_create_nesting(tr_workflow_2)
+
+    wiring_with_missing_input = deepcopy(tr_workflow_2.test_wiring)
+    wiring_with_missing_input.input_wirings.pop(0)
+
+    batch_input = ExecByIdBatchInput(
+        id=tr_workflow_2.id,
+        wirings=[
+            wiring_with_missing_input,
+            wiring_with_missing_input,
+            tr_workflow_2.test_wiring,
+        ],
+    )
+
+    with (
+        mock.patch(
+            "hetdesrun.backend.execution.read_single_transformation_revision",
+            wraps=read_single_transformation_revision,
+        ) as mocked_read,
+        mock.patch(
+            "hetdesrun.backend.execution.run_execution_input",
+            side_effect=RuntimeError("unexpected"),
+        ),
+    ):
+        async with async_test_client as ac:
+            response = await ac.post(
+                "/api/transformations/execute-batch",
+                json=json.loads(batch_input.json()),
+            )
+
+    assert response.status_code == 200
+    assert mocked_read.call_count == 1
+    lines_by_index = {line["index"]: line for line in map(json.loads, response.text.splitlines())}
+    assert sorted(lines_by_index) == [0, 1, 2]
+    assert "Workflow Input 'wf_input' has no wiring!" in lines_by_index[0]["error"]
+    assert "Workflow Input 'wf_input' has no wiring!" in lines_by_index[1]["error"]
+    assert lines_by_index[2]["execution_response"] is None
+    assert "unexpected" in lines_by_index[2]["error"]
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_with_series_and_dataframe_outputs(
+    async_test_client, mocked_clean_test_db_session
+):
+    tr_component_1 = TransformationRevision(**tr_json_component_1)
+    tr_component_1.content = update_code(tr_component_1)
+    store_single_transformation_revision(tr_component_1)
+    tr_workflow_2 = TransformationRevision(**tr_json_workflow_2_update)
+
+    store_single_transformation_revision(tr_workflow_2)
+
+    update_or_create_nesting(tr_workflow_2)
+
+    async def run_with_pandas_outputs(execution_input):
+        return ExecutionResponseFrontendDto(
+            result="ok",
+            job_id=execution_input.job_id,
+            output_results_by_output_name={
+                "series": pd.Series(
+                    [1.0, 2.0], index=pd.to_datetime(["2024-01-01", "2024-01-02"], utc=True)
+                ),
+                "frame": pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}),
+            },
+        )
+
+    batch_input = ExecByIdBatchInput(
+        id=tr_workflow_2.id, wirings=[tr_workflow_2.test_wiring, tr_workflow_2.test_wiring]
+    )
+
+    with mock.patch(
+        "hetdesrun.backend.execution.run_execution_input", side_effect=run_with_pandas_outputs
+    ):
+        async with async_test_client as ac:
+            response = await ac.post(
+                "/api/transformations/execute-batch",
+                json=json.loads(batch_input.json()),
+            )
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["index"] for line in lines) == [0, 1]
+    for line in lines:
+        assert line["error"] is None
+        outputs = line["execution_response"]["output_results_by_output_name"]
+        assert outputs["series"]["__hd_wrapped_data_object__"] == "SERIES"
+        assert outputs["frame"]["__hd_wrapped_data_object__"] == "DATAFRAME"
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_for_transformation_revision_without_valid_wiring(
+    async_test_client, mocked_clean_test_db_session
+):
+    tr_component_1 = TransformationRevision(**tr_json_component_1)
+    tr_component_1.content = update_code(tr_component_1)
+    store_single_transformation_revision(tr_component_1)
+    tr_workflow_2 = TransformationRevision(**tr_json_workflow_2_update)
+
+    store_single_transformation_revision(tr_workflow_2)
+
+    update_or_create_nesting(tr_workflow_2)
+
+    wiring_with_missing_input = deepcopy(tr_workflow_2.test_wiring)
+    wiring_with_missing_input.input_wirings.pop(0)
+
+    batch_input = ExecByIdBatchInput(id=tr_workflow_2.id, wirings=[wiring_with_missing_input])
+
+    async with async_test_client as ac:
+        response = await ac.post(
+            "/api/transformations/execute-batch",
+            json=json.loads(batch_input.json()),
+        )
+
+    assert response.status_code == 422
+    assert "Workflow Input 'wf_input' has no wiring!" in response.json()["detail"]
+
+
 @pytest.mark.asyncio
 async def test_execute_for_transformation_revision_without_job_id(
     async_test_client, mocked_clean_test_db_session
@@ -1608,6 +1793,79 @@ async def test_execute_for_separate_runtime_container(
             mocked_post.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_run_execution_input_with_binary_result_from_separate_runtime(
+    mocked_clean_test_db_session,
+):
+    tr_component_1 = TransformationRevision(**tr_json_component_1)
+    tr_component_1.content = update_code(tr_component_1)
+    store_single_transformation_revision(tr_component_1)
+    tr_workflow_2 = TransformationRevision(**tr_json_workflow_2_update)
+    store_single_transformation_revision(tr_workflow_2)
+    update_or_create_nesting(tr_workflow_2)
+
+    execution_input = prepare_execution_input(
+        ExecByIdInput(id=tr_workflow_2.id, wiring=tr_workflow_2.test_wiring)
+    )
+
+    resp_mock = mock.Mock()
+    resp_mock.status_code = 200
+    resp_mock.headers = {"content-type": BINARY_RESULT_MEDIA_TYPE}
+    resp_mock.content = encode_execution_result(
+        WorkflowExecutionResult(
+            output_results_by_output_name={
+                "wf_output": pd.Series(
+                    [1.0, 2.0], index=pd.to_datetime(["2024-01-01", "2024-01-02"], utc=True)
+                )
+            },
+            result="ok",
+            job_id=execution_input.job_id,
+        )
+    )
+    with (
+        mock.patch("hetdesrun.webservice.config.runtime_config.is_runtime_service", False),
+        mock.patch(
+            "hetdesrun.backend.execution.httpx.AsyncClient.post",
+            return_value=resp_mock,
+        ) as mocked_post,
+    ):
+        exec_response = await run_execution_input(execution_input)
+
+    assert BINARY_RESULT_MEDIA_TYPE in mocked_post.call_args.kwargs["headers"]["Accept"]
+    assert isinstance(exec_response.output_results_by_output_name["wf_output"], pd.Series)
+    # the frontend still receives the usual JSON representation
+    assert (
+        json.loads(exec_response.json())["output_results_by_output_name"]["wf_output"][
+            "__hd_wrapped_data_object__"
+        ]
+        == "SERIES"
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_execution_input_encodes_outputs_only_once(mocked_clean_test_db_session):
+    tr_component_1 = TransformationRevision(**tr_json_component_1)
+    tr_component_1.content = update_code(tr_component_1)
+    store_single_transformation_revision(tr_component_1)
+    tr_workflow_2 = TransformationRevision(**tr_json_workflow_2_update)
+    store_single_transformation_revision(tr_workflow_2)
+    update_or_create_nesting(tr_workflow_2)
+
+    execution_input = prepare_execution_input(
+        ExecByIdInput(id=tr_workflow_2.id, wiring=tr_workflow_2.test_wiring)
+    )
+    with mock.patch("hetdesrun.webservice.config.runtime_config.is_runtime_service", True):
+        exec_response = await run_execution_input(execution_input)
+
+    assert exec_response._output_results_json is not None
+    with mock.patch(
+        "hetdesrun.runtime.transport.output_value_json_chunks"
+    ) as mocked_output_value_json_chunks:
+        encoded = b"".join(execution_response_json(exec_response))
+    mocked_output_value_json_chunks.assert_not_called()
+    assert json.loads(encoded) == json.loads(exec_response.json())
+
+
 @pytest.mark.asyncio
 async def test_execute_for_transformation_revision_component_with_optional_inputs(
     async_test_client, mocked_clean_test_db_session
@@ -437,3 +437,32 @@ def test_hdctl_contains_correct_hdutils_py_file():
     ).decode("utf-8")
 
     assert hdctl_output.strip() == hdutils_py_content.strip()
+
+
+def test_update_code_keeps_execution_hints():
+    component = TransformationRevision(
+        io_interface=IOInterface(inputs=[], outputs=[]),
+        name="Test Component",
+        description="A test component",
+        category="Tests",
+        id="c6eff22c-21c4-43c6-9ae1-b2bdfb944565",
+        revision_group_id="c6eff22c-21c4-43c6-9ae1-b2bdfb944565",
+        version_tag="1.0.1",
+        state="DRAFT",
+        type="COMPONENT",
+        content=example_code_async.replace(
+            '"version_tag": "1.0.0"',
+            '"version_tag": "1.0.0", "executor": "process", "deterministic": True,'
+            ' "side_effects": True',
+        ),
+        test_wiring=[],
+    )
+    new_code = update_code(component)
+    assert '"executor": "process",' in new_code
+    assert '"deterministic": True,' in new_code
+    assert '"side_effects": True,' in new_code
+    assert '"version_tag": "1.0.1",' in new_code
+
+    component.content = example_code_async
+    new_code = update_code(component)
+    assert "executor" not in new_code
@@ -1,9 +1,14 @@
+import io
+import json
+from unittest import mock
+
 import numpy as np
 import pandas as pd
 import pytest
 from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_float_dtype
 from pydantic import BaseModel
 
+from hdutils import parse_decoded_pandas_data, parse_pandas_data_content
 from hetdesrun.datatypes import (
     DataType,
     PydanticMultiTimeseriesPandasDataFrame,
@@ -241,6 +246,75 @@ def test_dt_index_parsing():
     assert is_datetime64_any_dtype(test_obj.s.index.dtype)
 
 
+@pytest.mark.parametrize(
+    ("data", "typ", "parsing_options"),
+    [
+        ({"2020-01-01T00:00:00Z": 1, "2020-01-02T00:00:00Z": None}, "series", {}),
+        ([1.7e9, 1.8e9], "series", {}),
+        (
+            {
+                "name": "x",
+                "index": ["2020-01-01T00:00:00Z", "2020-01-02T00:00:00Z"],
+                "data": [1, None],
+            },
+            "series",
+            {"orient": "split"},
+        ),
+        ({"a": {"0": 1.0, "1": None}, "b": {"0": True, "1": False}}, "frame", {}),
+        ({"a": {"1": 1.0, "0": 2.0}, "b": {"0": 1, "1": 2}}, "frame", {}),
+        ({"a": {"0": 1.0}, "b": {"0": 1, "1": 2}}, "frame", {}),
+        (
+            {
+                "timestamp": ["2020-01-01T00:00:00Z", "2020-01-02T00:00:00Z"],
+                "metric": ["1", "2"],
+                "value": [1, 2.5],
+            },
+            "frame",
+            {},
+        ),
+        ([{"a": 1, "b": "x"}, {"a": 2, "b": None}], "frame", {"orient": "records"}),
+        ({"r1": {"a": 1}, "r2": {"a": 2}}, "frame", {"orient": "index"}),
+        ({"a": {"0": "1", "1": "2"}}, "frame", {"dtype": False}),
+        ({"created_at": {"0": 1600000000000, "1": 1600000001000}}, "frame", {}),
+    ],
+)
+def test_parsing_decoded_json_agrees_with_read_json(data, typ, parsing_options):
+    expected = pd.read_json(io.StringIO(json.dumps(data)), typ=typ, **parsing_options)
+    parsed = parse_decoded_pandas_data(data, typ, parsing_options)
+
+    if typ == "series":
+        pd.testing.assert_series_equal(parsed, expected)
+    else:
+        pd.testing.assert_frame_equal(parsed, expected)
+
+
+def test_parsing_decoded_json_falls_back_to_read_json_without_pandas_parsers():
+    data = {"a": {"0": 1.0, "1": None}, "b": {"0": True, "1": False}}
+    with mock.patch("hdutils.PANDAS_JSON_PARSERS_AVAILABLE", False):
+        with pytest.raises(NotImplementedError):
+            parse_decoded_pandas_data(data, "frame", {})
+        parsed = parse_pandas_data_content(data, "frame", {})
+
+    pd.testing.assert_frame_equal(parsed, pd.read_json(io.StringIO(json.dumps(data)), typ="frame"))
+
+
+def test_parsing_of_wrapped_json_string():
+    test_obj = ExampleObj(
+        s=json.dumps(
+            {
+                "__hd_wrapped_data_object__": "SERIES",
+                "__metadata__": {"unit": "m"},
+                "__data__": {"name": "x", "index": ["2020-01-01T00:00:00Z"], "data": [1.5]},
+                "__data_parsing_options__": {"orient": "split"},
+            }
+        )
+    )
+
+    assert test_obj.s.attrs == {"unit": "m"}
+    assert test_obj.s.name == "x"
+    assert is_datetime64_any_dtype(test_obj.s.index.dtype)
+
+
 def test_any_parsing():
     result = parse_dynamically_from_datatypes(
         [
@@ -3,6 +3,7 @@ import os
 from typing import Any
 from uuid import uuid4
 
+import pandas as pd
 import pytest
 from fastapi import HTTPException
 from httpx import AsyncClient
@@ -15,6 +16,7 @@ from hetdesrun.models.run import (
 )
 from hetdesrun.models.wiring import InputWiring, OutputWiring, WorkflowWiring
 from hetdesrun.persistence.models.transformation import TransformationRevision
+from hetdesrun.runtime.transport import BINARY_RESULT_MEDIA_TYPE, decode_execution_result
 from hetdesrun.trafoutils.io.load import load_json
 
 
@@ -155,6 +157,40 @@ async def test_direct_provisioning_series_metadata(
         }
 
 
+@pytest.mark.asyncio
+async def test_binary_result_transport(async_test_client: AsyncClient) -> None:
+    execution_input = gen_execution_input_from_single_component(
+        (
+            "./transformations/components/connectors/"
+            "pass-through-series_100_bfa27afc-dea8-b8aa-4b15-94402f0739b6.json"
+        ),
+        {
+            "input": (
+                '{"__hd_wrapped_data_object__": "SERIES",'
+                ' "__metadata__": {"test": 42},'
+                ' "__data__": {"2024-01-01T00:00:00Z": 2.3, "2024-01-01T01:00:00Z": null}}'
+            )
+        },
+    )
+    async with async_test_client as client:
+        response = await client.post(
+            "engine/runtime",
+            json=json.loads(execution_input.json()),
+            headers={"Accept": f"{BINARY_RESULT_MEDIA_TYPE}, application/json;q=0.9"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == BINARY_RESULT_MEDIA_TYPE
+    exec_result = WorkflowExecutionResult(**decode_execution_result(response.content))
+    assert exec_result.result == "ok"
+    series = exec_result.output_results_by_output_name["output"]
+    assert isinstance(series, pd.Series)
+    assert series.attrs == {"test": 42}
+    assert series.index[0] == pd.Timestamp("2024-01-01T00:00:00Z")
+    assert series.iloc[0] == 2.3
+    assert pd.isna(series.iloc[1])
+
+
 @pytest.mark.asyncio
 async def test_direct_provisioning_dataframe_metadata(
     async_test_client: AsyncClient,
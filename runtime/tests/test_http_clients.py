@@ -0,0 +1,82 @@
+import asyncio
+import threading
+from unittest import mock
+
+import httpx
+import pytest
+
+from hetdesrun.webservice.http_clients import (
+    close_http_client_pools,
+    get_async_http_client_pool,
+    http_client_pool_metrics,
+    pooled_async_client,
+)
+
+
+@pytest.mark.asyncio
+async def test_pooled_async_clients_share_transport():
+    pool = get_async_http_client_pool(verify=True)
+    assert get_async_http_client_pool(verify=False) is not pool
+    pool.transport = httpx.MockTransport(  # type: ignore[assignment]
+        lambda request: httpx.Response(200, json={"path": request.url.path})
+    )
+
+    for path in ("/a", "/b"):
+        async with pooled_async_client(verify=True, headers={"X-Test": "1"}) as client:
+            response = await client.get("http://example.com" + path)
+            assert response.json() == {"path": path}
+    assert get_async_http_client_pool(verify=True) is pool
+
+    metrics = {pool_metrics.verify: pool_metrics for pool_metrics in http_client_pool_metrics()}
+    assert metrics[True].requests_total == 2
+    assert metrics[False].requests_total == 0
+
+    await close_http_client_pools()
+    assert http_client_pool_metrics() == []
+    assert get_async_http_client_pool(verify=True) is not pool
+    await close_http_client_pools()
+
+
+@pytest.mark.asyncio
+async def test_http2_requires_h2():
+    with (
+        mock.patch("hetdesrun.webservice.config.runtime_config.http_client_http2", True),
+        mock.patch("importlib.util.find_spec", return_value=None),
+    ):
+        assert get_async_http_client_pool(verify=True).http2 is False
+    await close_http_client_pools()
+
+
+@pytest.mark.asyncio
+async def test_pools_of_other_event_loop_are_closed():
+    other_loop = asyncio.new_event_loop()
+    other_thread = threading.Thread(target=other_loop.run_forever)
+    other_thread.start()
+    try:
+
+        async def create_pool():
+            return get_async_http_client_pool(verify=True)
+
+        pool = asyncio.run_coroutine_threadsafe(create_pool(), other_loop).result()
+        pool.transport = mock.AsyncMock()  # type: ignore[assignment]
+        assert get_async_http_client_pool(verify=True) is not pool
+        # let the other event loop run the scheduled closing
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result()
+        pool.transport.aclose.assert_awaited_once()
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        other_thread.join()
+        other_loop.close()
+    await close_http_client_pools()
+
+
+@pytest.mark.asyncio
+async def test_metrics_without_httpcore_connection_pool():
+    pool = get_async_http_client_pool(verify=True)
+    assert pool.connections() == []
+    pool.transport = httpx.MockTransport(  # type: ignore[assignment]
+        lambda request: httpx.Response(200)  # noqa: ARG005
+    )
+    assert pool.connections() == []
+    assert pool.metrics().connections == 0
+    await close_http_client_pools()
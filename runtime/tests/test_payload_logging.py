@@ -0,0 +1,61 @@
+import logging
+from unittest import mock
+
+import pytest
+
+from hetdesrun.models.run import WorkflowExecutionInput
+from hetdesrun.runtime.service import runtime_service
+from hetdesrun.utils import LazyLogPayload, log_payload, shorten_payload
+
+test_logger = logging.getLogger(__name__)
+
+
+def test_shorten_payload():
+    assert shorten_payload("abcdef", 6) == "abcdef"
+    assert shorten_payload("abcdefghij", 4) == "ab ... [6 characters omitted] ... ij"
+    assert str(LazyLogPayload(b"abcdefghij", 5)) == "abc ... [5 bytes omitted] ... ij"
+    assert str(LazyLogPayload("ä".encode(), 5)) == "ä"
+
+
+def test_log_payload_renders_only_logged_payloads(caplog):
+    render = mock.Mock(return_value="x" * 100)
+
+    with caplog.at_level(logging.WARNING, logger=__name__):
+        log_payload(test_logger, logging.INFO, "Payload: %s", render)
+    render.assert_not_called()
+
+    with (
+        caplog.at_level(logging.INFO, logger=__name__),
+        mock.patch("hetdesrun.webservice.config.runtime_config.payload_log_sample_rate", 0.0),
+    ):
+        log_payload(test_logger, logging.INFO, "Payload: %s", render)
+    render.assert_not_called()
+
+    with (
+        caplog.at_level(logging.INFO, logger=__name__),
+        mock.patch("hetdesrun.webservice.config.runtime_config.payload_log_max_chars", 10),
+    ):
+        log_payload(test_logger, logging.INFO, "Payload: %s", render)
+    render.assert_called_once()
+    assert "Payload: xxxxx ... [90 characters omitted] ... xxxxx" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_runtime_service_logs_only_summary_of_execution_input_at_info_level(
+    caplog, input_json_with_wiring
+):
+    runtime_input = WorkflowExecutionInput.parse_obj(input_json_with_wiring)
+
+    with (
+        caplog.at_level(logging.INFO, logger="hetdesrun_runtime_service"),
+        mock.patch(
+            "hetdesrun.runtime.service.model_to_pretty_json_str", return_value="{}"
+        ) as mocked_render,
+    ):
+        result = await runtime_service(runtime_input)
+
+    assert result.result == "ok"
+    mocked_render.assert_not_called()
+    assert "WORKFLOW EXECUTION INPUT JSON" not in caplog.text
+    assert "Executing workflow of trafo" in caplog.text
+    assert "Workflow execution finished with outputs" in caplog.text
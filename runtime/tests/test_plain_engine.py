@@ -1,15 +1,46 @@
+import asyncio
 import logging
+import os
+import threading
+import time
+from unittest import mock
 
+import numpy as np
+import pandas as pd
 import pytest
 
-from hetdesrun.runtime.engine.plain.workflow import ComputationNode, Workflow
+from hetdesrun.component.load import import_func_from_code
+from hetdesrun.models.run import ConfigurationInput, NodeSchedulingMode
+from hetdesrun.runtime.configuration import execution_config
+from hetdesrun.runtime.engine.plain import workflow_execution_plain
+from hetdesrun.runtime.engine.plain.execution import shutdown_component_executors
+from hetdesrun.runtime.engine.plain.memoization import (
+    ComponentResultCache,
+    component_result_cache,
+    estimate_size,
+    fingerprint_value,
+)
+from hetdesrun.runtime.engine.plain.node_results import (
+    summarize_node_results,
+    summarize_value,
+)
+from hetdesrun.runtime.engine.plain.parsing import executor_from_component_info
+from hetdesrun.runtime.engine.plain.profiling import OperatorMeasurement, memory_tracing
+from hetdesrun.runtime.engine.plain.scheduling import obtain_nodes_to_schedule
+from hetdesrun.runtime.engine.plain.workflow import (
+    ComputationNode,
+    Workflow,
+    obtain_demanded_nodes,
+)
 from hetdesrun.runtime.exceptions import (
     CircularDependency,
     ComponentException,
     MissingInputSource,
     MissingOutputException,
     RuntimeExecutionError,
+    UnexpectedComponentException,
 )
+from hetdesrun.webservice.config import ComponentExecutor
 
 
 @pytest.mark.asyncio
@@ -305,3 +336,584 @@ async def test_nested_workflow():
 
     res = await wf.result
     assert res["sum_result"] == 3.7
+
+
+def concurrency_test_workflow(node_duration: float) -> tuple[Workflow, list[int]]:
+    running_counts: list[int] = []
+    currently_running = [0]
+
+    def provide_value():
+        return {"a": 1.0}
+
+    async def slow_increment(*, x):
+        currently_running[0] += 1
+        running_counts.append(currently_running[0])
+        await asyncio.sleep(node_duration)
+        currently_running[0] -= 1
+        return {"y": x + 1}
+
+    def add_values(*, c, d, e):
+        return {"sum": c + d + e}
+
+    source_node = ComputationNode(func=provide_value)
+    branch_nodes = [
+        ComputationNode(func=slow_increment, inputs={"x": (source_node, "a")}) for _ in range(3)
+    ]
+    target_node = ComputationNode(
+        func=add_values,
+        inputs={
+            inp_name: (branch_node, "y")
+            for inp_name, branch_node in zip(["c", "d", "e"], branch_nodes, strict=True)
+        },
+    )
+    wf = Workflow(
+        sub_nodes=[source_node, *branch_nodes, target_node],
+        input_mappings={},
+        output_mappings={"sum_result": (target_node, "sum")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+    return wf, running_counts
+
+
+@pytest.mark.asyncio
+async def test_concurrent_node_scheduling_overlaps_independent_branches():
+    wf, running_counts = concurrency_test_workflow(node_duration=0.2)
+
+    execution_config.set(ConfigurationInput(node_scheduling=NodeSchedulingMode.CONCURRENT))
+    start = time.monotonic()
+    res = await workflow_execution_plain(wf)
+    duration = time.monotonic() - start
+
+    assert res["sum_result"] == 6.0
+    assert max(running_counts) == 3
+    assert duration < 0.5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_node_scheduling_respects_concurrency_limit():
+    wf, running_counts = concurrency_test_workflow(node_duration=0.01)
+
+    execution_config.set(
+        ConfigurationInput(node_scheduling=NodeSchedulingMode.CONCURRENT, max_concurrent_nodes=2)
+    )
+    res = await workflow_execution_plain(wf)
+
+    assert res["sum_result"] == 6.0
+    assert max(running_counts) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_node_scheduling_nested_workflow():
+    def provide_two_values():
+        return {"a": 1.2, "b": 2.5}
+
+    def add_two_values(*, c, d):
+        return {"sum": c + d}
+
+    def double(*, x):
+        return {"doubled": 2 * x}
+
+    source_node = ComputationNode(func=provide_two_values)
+    target_node_in_sub_wf = ComputationNode(func=add_two_values)
+    sub_wf = Workflow(
+        sub_nodes=[target_node_in_sub_wf],
+        input_mappings={
+            "sub_wf_first_inp": (target_node_in_sub_wf, "c"),
+            "sub_wf_second_inp": (target_node_in_sub_wf, "d"),
+        },
+        output_mappings={"sub_wf_sum_outp": (target_node_in_sub_wf, "sum")},
+        inputs={
+            "sub_wf_first_inp": (source_node, "a"),
+            "sub_wf_second_inp": (source_node, "b"),
+        },
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+    doubling_node = ComputationNode(func=double, inputs={"x": (sub_wf, "sub_wf_sum_outp")})
+
+    wf = Workflow(
+        sub_nodes=[doubling_node, source_node, sub_wf],
+        input_mappings={},
+        output_mappings={"doubled_sum": (doubling_node, "doubled")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+    assert obtain_nodes_to_schedule(wf) == {
+        doubling_node: {target_node_in_sub_wf},
+        source_node: set(),
+        target_node_in_sub_wf: {source_node},
+    }
+
+    execution_config.set(ConfigurationInput(node_scheduling=NodeSchedulingMode.CONCURRENT))
+    res = await workflow_execution_plain(wf)
+    assert res["doubled_sum"] == 7.4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_node_scheduling_cycle_detection():
+    def add_two_values(*, c, d):
+        return {"sum": c + d}
+
+    first_node = ComputationNode(func=add_two_values)
+    second_node = ComputationNode(
+        func=add_two_values, inputs={"c": (first_node, "sum"), "d": (first_node, "sum")}
+    )
+    first_node.add_inputs({"c": (second_node, "sum"), "d": (second_node, "sum")})
+
+    wf = Workflow(
+        sub_nodes=[first_node, second_node],
+        input_mappings={},
+        output_mappings={"sum_result": (second_node, "sum")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+    execution_config.set(ConfigurationInput(node_scheduling=NodeSchedulingMode.CONCURRENT))
+    with pytest.raises(CircularDependency):
+        await workflow_execution_plain(wf)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_node_scheduling_raises_component_exception():
+    def provide_value():
+        return {"a": 1.0}
+
+    def fail(*, x):
+        raise ValueError("Error in user code!")
+
+    source_node = ComputationNode(func=provide_value)
+    failing_node = ComputationNode(func=fail, inputs={"x": (source_node, "a")})
+
+    wf = Workflow(
+        sub_nodes=[source_node, failing_node],
+        input_mappings={},
+        output_mappings={"result": (failing_node, "y")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+    execution_config.set(ConfigurationInput(node_scheduling=NodeSchedulingMode.CONCURRENT))
+    with pytest.raises(UnexpectedComponentException):
+        await workflow_execution_plain(wf)
+
+
+executor_test_code = """\
+import os
+import threading
+
+COMPONENT_INFO = {"inputs": {"x": "INT"}, "outputs": {"y": "INT"}, "executor": "thread"}
+
+
+def main(*, x):
+    return {
+        "y": x + 1,
+        "pid": os.getpid(),
+        "thread_id": threading.get_ident(),
+    }
+"""
+
+
+@pytest.mark.asyncio
+async def test_sync_component_run_in_thread_executor():
+    func = import_func_from_code(executor_test_code, "main")
+    node = ComputationNode(func=func, executor=ComponentExecutor.THREAD)
+    node.add_inputs({"x": (ComputationNode(func=lambda: {"x": 1}), "x")})
+
+    res = await node.result
+    assert res["y"] == 2
+    assert res["pid"] == os.getpid()
+    assert res["thread_id"] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_sync_component_run_in_process_executor():
+    func = import_func_from_code(executor_test_code, "main")
+    node = ComputationNode(
+        func=func,
+        executor=ComponentExecutor.PROCESS,
+        code=executor_test_code,
+        function_name="main",
+    )
+    node.add_inputs({"x": (ComputationNode(func=lambda: {"x": 1}), "x")})
+
+    try:
+        res = await node.result
+    finally:
+        shutdown_component_executors()
+    assert res["y"] == 2
+    assert res["pid"] != os.getpid()
+
+
+def test_executor_from_component_info():
+    func = import_func_from_code(executor_test_code, "main")
+    component = mock.Mock(uuid="c6eff22c-21c4-43c6-9ae1-b2bdfb944565")
+    assert executor_from_component_info(func, component) == ComponentExecutor.THREAD
+
+    func = import_func_from_code(executor_test_code.replace('"thread"', '"gpu"'), "main")
+    assert executor_from_component_info(func, component) is None
+
+    func = import_func_from_code(executor_test_code.replace(', "executor": "thread"', ""), "main")
+    assert executor_from_component_info(func, component) is None
+
+
+def memoization_test_chain(x: float, calls: list[str]) -> tuple[ComputationNode, ComputationNode]:
+    def double(*, a):
+        calls.append("double")
+        return {"b": a * 2}
+
+    def increment(*, b):
+        calls.append("increment")
+        return {"c": b + 1}
+
+    source_node = ComputationNode(func=lambda: {"a": pd.Series([x, 2.0])})
+    double_node = ComputationNode(
+        func=double,
+        inputs={"a": (source_node, "a")},
+        code="double",
+        function_name="double",
+        deterministic=True,
+    )
+    increment_node = ComputationNode(
+        func=increment,
+        inputs={"b": (double_node, "b")},
+        code="increment",
+        function_name="increment",
+        deterministic=True,
+    )
+    return double_node, increment_node
+
+
+@pytest.mark.asyncio
+async def test_deterministic_component_results_are_memoized_across_executions():
+    component_result_cache.clear()
+    calls: list[str] = []
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.component_result_cache_max_bytes", 10**6
+    ):
+        _, increment_node = memoization_test_chain(1.0, calls)
+        assert (await increment_node.result)["c"].tolist() == [3.0, 5.0]
+        assert calls == ["double", "increment"]
+
+        # same inputs in another execution: the whole chain is skipped
+        _, increment_node = memoization_test_chain(1.0, calls)
+        result = await increment_node.result
+        assert result["c"].tolist() == [3.0, 5.0]
+        assert calls == ["double", "increment"]
+
+        # memoized results are copies
+        result["c"][0] = 42.0
+        _, increment_node = memoization_test_chain(1.0, calls)
+        assert (await increment_node.result)["c"].tolist() == [3.0, 5.0]
+
+        # changed input data
+        _, increment_node = memoization_test_chain(3.0, calls)
+        assert (await increment_node.result)["c"].tolist() == [7.0, 5.0]
+        assert calls == ["double", "increment"] * 2
+
+    # disabled memoization
+    _, increment_node = memoization_test_chain(3.0, calls)
+    await increment_node.result
+    assert calls == ["double", "increment"] * 3
+    component_result_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_nodes_only_needed_by_memoized_nodes_are_skipped():
+    component_result_cache.clear()
+    execution_config.set(ConfigurationInput())
+    calls: list[str] = []
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.component_result_cache_max_bytes", 10**6
+    ):
+        for _ in range(2):
+            double_node, increment_node = memoization_test_chain(1.0, calls)
+            wf = Workflow(
+                sub_nodes=[double_node.inputs["a"][0], double_node, increment_node],
+                input_mappings={},
+                output_mappings={"c": (increment_node, "c")},
+                tr_id="UNKNOWN",
+                tr_name="UNKNOWN",
+                tr_tag="UNKNOWN",
+            )
+            res = await workflow_execution_plain(wf)
+            assert res["c"].tolist() == [3.0, 5.0]
+
+            # like the runtime service, request all demanded nodes which are not released
+            for node in obtain_demanded_nodes(wf):
+                if not node.result_released:
+                    await node.result
+
+    assert calls == ["double", "increment"]
+    assert double_node.result_released is True
+    component_result_cache.clear()
+
+
+def test_fingerprint_value():
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": ["x", "y"]})
+    assert fingerprint_value(df) == fingerprint_value(df.copy())
+    assert fingerprint_value(df) != fingerprint_value(df.rename(columns={"a": "c"}))
+    assert fingerprint_value(df) != fingerprint_value(df.set_axis([3, 4]))
+    assert fingerprint_value(df["a"]) != fingerprint_value(df["a"].rename("c"))
+    assert fingerprint_value({"x": 1, "y": [1.0, "z"]}) == fingerprint_value(
+        {"y": [1.0, "z"], "x": 1}
+    )
+    assert fingerprint_value(1) != fingerprint_value(1.0)
+    assert fingerprint_value(object()) is None
+    assert fingerprint_value(pd.Series([[1], [2]])) is None
+
+
+def test_component_result_cache_evicts_least_recently_used():
+    cache = ComponentResultCache()
+    value = np.zeros(100)
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.component_result_cache_max_bytes",
+        2 * estimate_size({"v": value}),
+    ):
+        cache.put("first", {"v": value})
+        cache.put("second", {"v": value})
+        assert cache.get("first") is not None
+        cache.put("third", {"v": value})
+        assert len(cache) == 2
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+
+        cache.put("too_large", {"v": np.zeros(1000)})
+        assert cache.get("too_large") is None
+
+
+@pytest.mark.asyncio
+async def test_computation_node_profile():
+    def create_frame(*, n):
+        return {"df": pd.DataFrame({"a": np.arange(n, dtype=float)}), "n": n}
+
+    source_node = ComputationNode(func=lambda: {"n": 1000})
+    node = ComputationNode(
+        func=create_frame,
+        inputs={"n": (source_node, "n")},
+        component_id="c6eff22c-21c4-43c6-9ae1-b2bdfb944565",
+        component_name="Create Frame",
+        operator_hierarchical_id="\\wf\\op\\",
+        operator_hierarchical_name="\\Workflow\\Create Frame\\",
+        code="code",
+    )
+
+    execution_config.set(ConfigurationInput(profile_operators=True))
+    with memory_tracing(True):
+        await node.result
+
+    assert source_node.profile is None  # nodes without code are not profiled
+    profile = node.profile
+    assert profile is not None
+    assert profile.operator_hierarchical_id == "\\wf\\op\\"
+    assert profile.transformation_name == "Create Frame"
+    assert profile.wall_time_seconds >= 0.0
+    assert profile.peak_memory_bytes is not None
+    assert profile.peak_memory_bytes >= 8000
+    assert profile.input_sizes["n"].rows is None
+    assert profile.output_sizes["df"].rows == 1000
+    assert profile.output_sizes["df"].bytes >= 8000
+    assert profile.memoized is False
+
+    execution_config.set(ConfigurationInput())
+    node = ComputationNode(func=create_frame, inputs={"n": (source_node, "n")}, code="code")
+    await node.result
+    assert node.profile is None
+
+
+@pytest.mark.asyncio
+async def test_memory_peak_is_not_reported_for_overlapping_measurements():
+    async def measure(measurement, started, proceed):
+        with measurement.running():
+            started.set()
+            await proceed.wait()
+            memory = np.zeros(10000)  # noqa: F841
+
+    first, second, single = OperatorMeasurement(), OperatorMeasurement(), OperatorMeasurement()
+    first_started, second_started, proceed = asyncio.Event(), asyncio.Event(), asyncio.Event()
+    with memory_tracing(True):
+        first_task = asyncio.create_task(measure(first, first_started, proceed))
+        await first_started.wait()
+        second_task = asyncio.create_task(measure(second, second_started, proceed))
+        await second_started.wait()
+        proceed.set()
+        await asyncio.gather(first_task, second_task)
+
+        single_started = asyncio.Event()
+        await measure(single, single_started, proceed)
+
+    assert first.overlapped
+    assert second.overlapped
+    assert first.peak_memory_bytes is None
+    assert second.peak_memory_bytes is None
+    assert first.wall_time_seconds > 0.0
+    assert single.peak_memory_bytes is not None
+    assert single.peak_memory_bytes >= 80000
+
+
+def release_test_workflow() -> tuple[Workflow, list[ComputationNode]]:
+    source_node = ComputationNode(func=lambda: {"x": pd.Series(np.ones(1000))})
+    nodes = [source_node]
+    for _ in range(3):
+        nodes.append(
+            ComputationNode(func=lambda *, x: {"x": x + 1}, inputs={"x": (nodes[-1], "x")})
+        )
+
+    inner_workflow = Workflow(
+        sub_nodes=nodes,
+        input_mappings={},
+        output_mappings={"x": (nodes[-1], "x")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+    sum_node = ComputationNode(
+        func=lambda *, x, y: {"sum": x.sum() + y.sum()},
+        inputs={"x": (inner_workflow, "x"), "y": (source_node, "x")},
+    )
+    wf = Workflow(
+        sub_nodes=[inner_workflow, sum_node],
+        input_mappings={},
+        output_mappings={"sum": (sum_node, "sum"), "x": (inner_workflow, "x")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+    return wf, [*nodes, sum_node]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scheduling", list(NodeSchedulingMode))
+async def test_intermediate_results_are_released_after_last_consumer(scheduling):
+    wf, nodes = release_test_workflow()
+    execution_config.set(ConfigurationInput(node_scheduling=scheduling))
+
+    res = await workflow_execution_plain(wf)
+
+    assert res["sum"] == 5000.0
+    assert res["x"].sum() == 4000.0
+    assert all(node.result_released for node in nodes)
+    assert not wf.result_released
+
+    with pytest.raises(RuntimeExecutionError, match="released"):
+        await nodes[1].result
+
+
+@pytest.mark.asyncio
+async def test_node_results_are_retained_if_requested():
+    wf, nodes = release_test_workflow()
+    execution_config.set(ConfigurationInput(return_individual_node_results=True))
+
+    await workflow_execution_plain(wf)
+
+    assert not any(node.result_released for node in nodes)
+    assert (await nodes[1].result)["x"].sum() == 2000.0
+
+
+@pytest.mark.asyncio
+async def test_node_results_are_summarized():
+    wf, nodes = release_test_workflow()
+    for index, node in enumerate(nodes):
+        node.operator_hierarchical_id = f"operator_{index}"
+    execution_config.set(ConfigurationInput(return_individual_node_results=True))
+    await workflow_execution_plain(wf)
+
+    summaries = await summarize_node_results(nodes, [nodes[1].operator_hierarchical_id])
+
+    provided_x = summaries[nodes[0].operator_hierarchical_id].outputs["x"]
+    assert provided_x.type == "Series"
+    assert provided_x.shape == [1000]
+    assert provided_x.dtypes == "float64"
+    assert provided_x.min == provided_x.max == 1.0
+    assert provided_x.head["data"] == [1.0] * 5
+    assert provided_x.bytes > 8000
+    assert provided_x.value is None
+    assert summaries[nodes[1].operator_hierarchical_id].outputs["x"].value.sum() == 2000.0
+
+
+def test_summarize_value():
+    frame_summary = summarize_value(
+        pd.DataFrame(
+            {
+                "timestamp": pd.date_range("2024-01-01", periods=10, tz="UTC"),
+                "value": np.arange(10.0),
+                "metric": "a",
+            }
+        )
+    )
+    assert frame_summary.shape == [10, 3]
+    assert frame_summary.dtypes["metric"] == "object"
+    assert frame_summary.min == {"timestamp": "2024-01-01T00:00:00+00:00", "value": 0.0}
+    assert frame_summary.max["value"] == 9.0
+    assert frame_summary.tail["index"] == [5, 6, 7, 8, 9]
+
+    array_summary = summarize_value(np.array([[1, 2], [3, 4]]))
+    assert array_summary.shape == [2, 2]
+    assert (array_summary.min, array_summary.max) == (1, 4)
+
+    assert summarize_value(2.5).value == 2.5
+    long_string_summary = summarize_value("x" * 1000)
+    assert long_string_summary.value is None
+    assert len(long_string_summary.preview) < 300
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scheduling", list(NodeSchedulingMode))
+async def test_unused_operators_are_pruned(scheduling):
+    stored_values = []
+
+    def provide_value():
+        return {"value": 2.0}
+
+    def double(*, x):
+        return {"doubled": 2 * x}
+
+    def fail(*, x):  # noqa: ARG001
+        raise ValueError("Unused operator must not be run")
+
+    def store(*, x):
+        stored_values.append(x)
+        return {}
+
+    source_node = ComputationNode(func=provide_value)
+    doubling_node = ComputationNode(func=double, inputs={"x": (source_node, "value")})
+    unused_node = ComputationNode(func=fail, inputs={"x": (source_node, "value")})
+    storing_node = ComputationNode(
+        func=store, inputs={"x": (doubling_node, "doubled")}, has_side_effects=True
+    )
+    wf = Workflow(
+        sub_nodes=[source_node, doubling_node, unused_node, storing_node],
+        input_mappings={},
+        output_mappings={"doubled": (doubling_node, "doubled")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+    assert obtain_demanded_nodes(wf) == [source_node, doubling_node, unused_node, storing_node]
+    demanded_nodes = obtain_demanded_nodes(wf, prune_unused_operators=True)
+    assert demanded_nodes == [doubling_node, storing_node]
+    assert obtain_nodes_to_schedule(wf, prune_unused_operators=True) == {
+        source_node: set(),
+        doubling_node: {source_node},
+        storing_node: {doubling_node},
+    }
+
+    # pruning is opt-in
+    assert ConfigurationInput().prune_unused_operators is False
+    execution_config.set(
+        ConfigurationInput(node_scheduling=scheduling, prune_unused_operators=True)
+    )
+    res = await workflow_execution_plain(wf)
+    for node in demanded_nodes:
+        if not node.result_released:
+            await node.result
+
+    assert res["doubled"] == 4.0
+    assert stored_values == [4.0]
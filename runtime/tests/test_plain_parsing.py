@@ -1,7 +1,14 @@
+from unittest import mock
+
 import pytest
 
 from hetdesrun.models.run import WorkflowExecutionInput
-from hetdesrun.runtime.engine.plain.parsing import parse_workflow_input
+from hetdesrun.runtime.engine.plain.parsing import (
+    _component_execution_plan_cache,
+    clear_component_execution_plan_cache,
+    load_func,
+    parse_workflow_input,
+)
 
 
 @pytest.mark.asyncio
@@ -18,3 +25,56 @@ async def test_plain_wf_parsing_and_execution(input_json_with_wiring):
 
     assert "z" in res
     assert res["z"] == 4.0
+
+
+@pytest.mark.asyncio
+async def test_component_execution_plans_are_cached(input_json_with_wiring):
+    clear_component_execution_plan_cache()
+    wf_exe_inp = WorkflowExecutionInput.parse_obj(input_json_with_wiring)
+
+    with mock.patch(
+        "hetdesrun.runtime.engine.plain.parsing.load_func", wraps=load_func
+    ) as wrapped_load_func:
+        first_wf = parse_workflow_input(
+            wf_exe_inp.workflow, wf_exe_inp.components, wf_exe_inp.code_modules
+        )
+        loading_count = wrapped_load_func.call_count
+        assert loading_count > 0
+
+        second_wf = parse_workflow_input(
+            wf_exe_inp.workflow, wf_exe_inp.components, wf_exe_inp.code_modules
+        )
+        assert wrapped_load_func.call_count == loading_count
+
+    # nodes are created per run and hold their own results
+    assert first_wf.sub_nodes[0] is not second_wf.sub_nodes[0]
+    assert (await first_wf.result)["z"] == 4.0
+    assert (await second_wf.result)["z"] == 4.0
+
+    # changed code results in a new plan
+    changed_code_module = wf_exe_inp.code_modules[0].copy()
+    changed_code_module.code = changed_code_module.code + "\n# changed\n"
+    with mock.patch(
+        "hetdesrun.runtime.engine.plain.parsing.load_func", wraps=load_func
+    ) as wrapped_load_func:
+        parse_workflow_input(
+            wf_exe_inp.workflow,
+            wf_exe_inp.components,
+            [changed_code_module, *wf_exe_inp.code_modules[1:]],
+        )
+        assert wrapped_load_func.call_count > 0
+    clear_component_execution_plan_cache()
+
+
+def test_component_execution_plan_cache_is_bounded(input_json_with_wiring):
+    clear_component_execution_plan_cache()
+    wf_exe_inp = WorkflowExecutionInput.parse_obj(input_json_with_wiring)
+
+    with mock.patch("hetdesrun.webservice.config.runtime_config.execution_plan_cache_size", 1):
+        parse_workflow_input(wf_exe_inp.workflow, wf_exe_inp.components, wf_exe_inp.code_modules)
+        assert len(_component_execution_plan_cache) == 1
+
+    with mock.patch("hetdesrun.webservice.config.runtime_config.execution_plan_cache_size", 0):
+        clear_component_execution_plan_cache()
+        parse_workflow_input(wf_exe_inp.workflow, wf_exe_inp.components, wf_exe_inp.code_modules)
+        assert len(_component_execution_plan_cache) == 0
@@ -0,0 +1,215 @@
+import datetime
+
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from hetdesrun.models.run import (
+    ChunkingConfiguration,
+    WorkflowExecutionInput,
+    WorkflowExecutionResult,
+)
+from hetdesrun.models.wiring import InputWiring
+from hetdesrun.runtime.chunking import (
+    WindowOutputMerger,
+    chunked_runtime_service,
+    obtain_time_range,
+    split_time_range,
+    window_execution_input,
+)
+from hetdesrun.runtime.service import runtime_service
+
+
+def test_split_time_range():
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    windows = split_time_range(
+        start, start + datetime.timedelta(days=2, hours=12), datetime.timedelta(days=1)
+    )
+    assert windows == [
+        (start, start + datetime.timedelta(days=1)),
+        (start + datetime.timedelta(days=1), start + datetime.timedelta(days=2)),
+        (start + datetime.timedelta(days=2), start + datetime.timedelta(days=2, hours=12)),
+    ]
+    assert split_time_range(start, start, datetime.timedelta(days=1)) == [(start, start)]
+
+
+@pytest.mark.asyncio
+async def test_chunked_runtime_service_merges_window_outputs(input_json_with_wiring_with_input):
+    input_json_with_wiring_with_input["workflow_wiring"]["input_wirings"][0]["filters"] = {
+        "value": "32",
+        "timestampFrom": "2024-01-01T00:00:00.000Z",
+        "timestampTo": "2024-01-04T00:00:00.000Z",
+    }
+    runtime_input = WorkflowExecutionInput.parse_obj(input_json_with_wiring_with_input)
+    assert obtain_time_range(runtime_input.workflow_wiring) == (
+        datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2024, 1, 4, tzinfo=datetime.timezone.utc),
+    )
+
+    loaded_ranges = []
+
+    async def execute_window(window_input: WorkflowExecutionInput) -> WorkflowExecutionResult:
+        assert window_input.configuration.chunking is None
+        filters = window_input.workflow_wiring.input_wirings[0].filters
+        loaded_ranges.append((filters["timestampFrom"], filters["timestampTo"]))
+        index = pd.date_range(filters["timestampFrom"], filters["timestampTo"], freq="6h", tz="UTC")
+        return WorkflowExecutionResult(
+            result="ok",
+            output_results_by_output_name={"z": pd.Series(1.0, index=index)},
+            job_id=window_input.job_id,
+        )
+
+    result = await chunked_runtime_service(
+        runtime_input,
+        ChunkingConfiguration(
+            window=datetime.timedelta(days=1), overlap=datetime.timedelta(hours=12)
+        ),
+        execute_window,
+    )
+
+    assert loaded_ranges == [
+        # the overlap is not loaded before the start of the requested time range
+        ("2024-01-01T00:00:00.000Z", "2024-01-02T00:00:00.000Z"),
+        ("2024-01-01T12:00:00.000Z", "2024-01-03T00:00:00.000Z"),
+        ("2024-01-02T12:00:00.000Z", "2024-01-04T00:00:00.000Z"),
+    ]
+    assert result.result == "ok"
+    merged_series = result.output_results_by_output_name["z"]
+    # overlaps and window ends are removed, each timestamp occurs exactly once
+    assert merged_series.index.is_unique
+    assert len(merged_series) == 13
+    assert merged_series.index[0] == pd.Timestamp("2024-01-01T00:00:00Z")
+    assert merged_series.index[-1] == pd.Timestamp("2024-01-04T00:00:00Z")
+
+
+def test_window_execution_input_restricts_windows_to_time_range_of_each_wiring(
+    input_json_with_wiring_with_input,
+):
+    input_json_with_wiring_with_input["workflow_wiring"]["input_wirings"][0]["filters"] = {
+        "timestampFrom": "2024-01-01T00:00:00.000Z",
+        "timestampTo": "2024-01-04T00:00:00.000Z",
+    }
+    runtime_input = WorkflowExecutionInput.parse_obj(input_json_with_wiring_with_input)
+    runtime_input.workflow_wiring.input_wirings.append(
+        InputWiring(
+            workflow_input_name="narrow_inp",
+            adapter_id=1,
+            ref_id="TEST-ID",
+            filters={
+                "timestampFrom": "2024-01-02T06:00:00.000Z",
+                "timestampTo": "2024-01-02T18:00:00.000Z",
+            },
+        )
+    )
+    windows = split_time_range(
+        *obtain_time_range(runtime_input.workflow_wiring), datetime.timedelta(days=1)
+    )
+
+    loaded_ranges = [
+        [
+            (input_wiring.filters["timestampFrom"], input_wiring.filters["timestampTo"])
+            for input_wiring in window_execution_input(
+                runtime_input, window, datetime.timedelta(hours=12)
+            ).workflow_wiring.input_wirings
+        ]
+        for window in windows
+    ]
+
+    assert loaded_ranges == [
+        [
+            ("2024-01-01T00:00:00.000Z", "2024-01-02T00:00:00.000Z"),
+            # window before the time range of the wiring
+            ("2024-01-02T06:00:00.000Z", "2024-01-02T06:00:00.000Z"),
+        ],
+        [
+            ("2024-01-01T12:00:00.000Z", "2024-01-03T00:00:00.000Z"),
+            ("2024-01-02T06:00:00.000Z", "2024-01-02T18:00:00.000Z"),
+        ],
+        [
+            ("2024-01-02T12:00:00.000Z", "2024-01-04T00:00:00.000Z"),
+            # only the overlap intersects the time range of the wiring
+            ("2024-01-02T12:00:00.000Z", "2024-01-02T18:00:00.000Z"),
+        ],
+    ]
+
+
+def test_chunked_execution_input_with_invalid_timestamp_filter(
+    input_json_with_wiring_with_input,
+):
+    input_json_with_wiring_with_input["workflow_wiring"]["input_wirings"][0]["filters"] = {
+        "timestampFrom": "yesterday",
+        "timestampTo": "2024-01-04T00:00:00.000Z",
+    }
+    # only validated if the time range is split into windows
+    WorkflowExecutionInput.parse_obj(input_json_with_wiring_with_input)
+
+    input_json_with_wiring_with_input["configuration"]["chunking"] = {"window": "P1D"}
+    with pytest.raises(ValidationError, match="is not a valid timestamp"):
+        WorkflowExecutionInput.parse_obj(input_json_with_wiring_with_input)
+
+
+@pytest.mark.asyncio
+async def test_chunked_runtime_service_returns_failed_window_result(
+    input_json_with_wiring_with_input,
+):
+    input_json_with_wiring_with_input["workflow_wiring"]["input_wirings"][0]["filters"] = {
+        "value": "32",
+        "timestampFrom": "2024-01-01T00:00:00.000Z",
+        "timestampTo": "2024-01-04T00:00:00.000Z",
+    }
+    runtime_input = WorkflowExecutionInput.parse_obj(input_json_with_wiring_with_input)
+    executed_windows = []
+
+    async def execute_window(window_input: WorkflowExecutionInput) -> WorkflowExecutionResult:
+        executed_windows.append(window_input)
+        try:
+            raise ValueError("Window failed")
+        except ValueError as exc:
+            return WorkflowExecutionResult.from_exception(
+                exc, "EXECUTING_COMPONENT_CODE", window_input.job_id
+            )
+
+    result = await chunked_runtime_service(
+        runtime_input, ChunkingConfiguration(window=datetime.timedelta(days=1)), execute_window
+    )
+    assert result.result == "failure"
+    assert result.error.message == "Window failed"
+    assert len(executed_windows) == 1
+
+
+@pytest.mark.asyncio
+async def test_runtime_service_with_chunking_without_time_range(input_json_with_wiring):
+    input_json_with_wiring["configuration"]["chunking"] = {"window": "P1D"}
+    runtime_input = WorkflowExecutionInput.parse_obj(input_json_with_wiring)
+
+    result = await runtime_service(runtime_input)
+
+    assert result.result == "ok"
+    assert result.output_results_by_output_name["z"] == 4.0
+
+
+def test_window_output_merger():
+    merger = WindowOutputMerger()
+    first_window = (
+        datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc),
+    )
+    second_window = (first_window[1], datetime.datetime(2024, 1, 3, tzinfo=datetime.timezone.utc))
+    for window, is_last_window in ((first_window, False), (second_window, True)):
+        merger.add(
+            {
+                "frame": pd.DataFrame(
+                    {
+                        "timestamp": pd.to_datetime([window[0], window[1]]),
+                        "value": [1.0, 2.0],
+                    }
+                ),
+                "mean": window[1].day,
+            },
+            window,
+            is_last_window,
+        )
+
+    merged = merger.merged()
+    assert merged["frame"]["timestamp"].dt.day.tolist() == [1, 2, 3]
+    assert merged["mean"] == 3
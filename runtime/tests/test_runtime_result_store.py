@@ -0,0 +1,104 @@
+import asyncio
+import io
+from unittest import mock
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from hetdesrun.runtime.result_store import (
+    ARROW_STREAM_MEDIA_TYPE,
+    RESULT_HANDLE_KEY,
+    load_result_table,
+    store_large_outputs,
+    store_large_outputs_in_thread,
+)
+from hetdesrun.runtime.transport import arrow_table_to_pandas
+
+
+def test_store_large_outputs(tmp_path):
+    series = pd.Series(
+        [1.0, 2.0, 3.0],
+        index=pd.date_range("2024-01-01", periods=3, tz="UTC"),
+        name="values",
+    )
+    series.attrs = {"unit": "m"}
+    frame = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.result_store_directory", str(tmp_path)
+    ):
+        outputs = store_large_outputs({"series": series, "frame": frame, "number": 2.0}, 3)
+        assert store_large_outputs({"series": series}, None)["series"] is series
+
+        handle = outputs["series"]
+        assert handle[RESULT_HANDLE_KEY] == "SERIES"
+        assert handle["num_rows"] == 3
+        assert handle["columns"] is None
+        assert outputs["frame"] is frame
+        assert outputs["number"] == 2.0
+
+        stored_series = arrow_table_to_pandas(load_result_table(handle["id"]))
+        pd.testing.assert_series_equal(stored_series, series, check_freq=False)
+        assert stored_series.attrs == {"unit": "m"}
+
+
+@pytest.mark.asyncio
+async def test_store_large_outputs_in_thread(tmp_path):
+    frame = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.result_store_directory", str(tmp_path)
+    ):
+        assert (await store_large_outputs_in_thread({"frame": frame}, None))["frame"] is frame
+        with mock.patch(
+            "hetdesrun.runtime.result_store.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as mocked_to_thread:
+            handle = (await store_large_outputs_in_thread({"frame": frame}, 2))["frame"]
+        mocked_to_thread.assert_called_once()
+        assert handle[RESULT_HANDLE_KEY] == "DATAFRAME"
+        assert load_result_table(handle["id"]).num_rows == 2
+
+
+@pytest.mark.asyncio
+async def test_result_endpoints(async_test_client, tmp_path):
+    frame = pd.DataFrame({"a": range(10), "b": [str(i) for i in range(10)]})
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.result_store_directory", str(tmp_path)
+    ):
+        handle = store_large_outputs({"frame": frame}, 1)["frame"]
+        assert handle["columns"] == ["a", "b"]
+        url = f"/engine/results/{handle['id']}"
+
+        async with async_test_client as client:
+            response = await client.get(url, params={"offset": 2, "limit": 3})
+            assert response.status_code == 200
+            assert response.headers["content-range"] == "rows 2-4/10"
+            wrapped = response.json()
+            assert wrapped["__hd_wrapped_data_object__"] == "DATAFRAME"
+            assert wrapped["__data__"]["a"] == {"2": 2, "3": 3, "4": 4}
+
+            response = await client.get(
+                url, params={"offset": 8}, headers={"Accept": ARROW_STREAM_MEDIA_TYPE}
+            )
+            assert response.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+            assert response.headers["content-range"] == "rows 8-9/10"
+            page = arrow_table_to_pandas(pa.ipc.open_stream(response.content).read_all())
+            pd.testing.assert_frame_equal(page, frame.iloc[8:])
+
+            response = await client.get(url + "/file")
+            assert response.status_code == 200
+            stored_frame = arrow_table_to_pandas(
+                pa.ipc.open_file(io.BytesIO(response.content)).read_all()
+            )
+            pd.testing.assert_frame_equal(stored_frame, frame)
+
+            response = await client.get(url + "/file", headers={"Range": "bytes=0-5"})
+            assert response.status_code == 206
+            assert response.content == b"ARROW1"
+
+            response = await client.delete(url)
+            assert response.status_code == 204
+            response = await client.get(url)
+            assert response.status_code == 404
@@ -0,0 +1,83 @@
+import json
+from unittest import mock
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+
+from hetdesrun.models.run import ProcessStage, WorkflowExecutionResult
+from hetdesrun.runtime.transport import (
+    encode_execution_result_json,
+    encode_execution_result_json_or_error,
+    encode_output_results_json,
+)
+
+
+def test_json_encoding_of_execution_result_equals_pydantic_encoding():
+    series = pd.Series(
+        [1.0, np.nan, 3.0],
+        index=pd.date_range("2024-01-01", periods=3, freq="h", tz="UTC"),
+        name="values",
+    )
+    series.attrs = {"unit": "°C"}
+    result = WorkflowExecutionResult(
+        result="ok",
+        job_id=uuid4(),
+        output_results_by_output_name={
+            "series": series,
+            "frame": pd.DataFrame(
+                {
+                    "timestamp": pd.date_range("2024-01-01", periods=3, tz="UTC"),
+                    "value": [1.0, None, 3.0],
+                    "metric": ["a", "b", "c"],
+                }
+            ),
+            "empty_series": pd.Series([], dtype=float),
+            "array": np.array([1, 2]),
+            "number": 1.5,
+            "nested": {"key": [1, None]},
+        },
+    )
+
+    encoded = b"".join(encode_execution_result_json(result))
+
+    assert json.loads(encoded) == json.loads(json.dumps(jsonable_encoder(result)))
+
+
+def test_json_encoding_of_execution_result_without_outputs():
+    result = WorkflowExecutionResult(result="ok", job_id=uuid4(), output_results_by_output_name={})
+
+    encoded = b"".join(encode_execution_result_json(result))
+
+    assert json.loads(encoded) == json.loads(json.dumps(jsonable_encoder(result)))
+
+
+def test_json_encoding_errors_are_reported_as_failed_execution():
+    result = WorkflowExecutionResult(
+        result="ok", job_id=uuid4(), output_results_by_output_name={"result": str}
+    )
+
+    error_result, chunks = encode_execution_result_json_or_error(result)
+
+    assert error_result.result == "failure"
+    assert error_result.job_id == result.job_id
+    assert error_result.error.process_stage == ProcessStage.ENCODING_RESULTS_TO_JSON
+    assert json.loads(b"".join(chunks))["error"]["process_stage"] == "ENCODING_RESULTS_TO_JSON"
+
+
+def test_json_encoding_of_execution_result_with_already_encoded_outputs():
+    result = WorkflowExecutionResult(
+        result="ok",
+        job_id=uuid4(),
+        output_results_by_output_name={"series": pd.Series([1.0, 2.0]), "number": 1.5},
+    )
+    output_results_json = encode_output_results_json(result.output_results_by_output_name)
+
+    with mock.patch(
+        "hetdesrun.runtime.transport.output_value_json_chunks"
+    ) as mocked_output_value_json_chunks:
+        encoded = b"".join(encode_execution_result_json(result, output_results_json))
+
+    mocked_output_value_json_chunks.assert_not_called()
+    assert json.loads(encoded) == json.loads(json.dumps(jsonable_encoder(result)))
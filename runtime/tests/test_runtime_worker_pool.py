@@ -0,0 +1,100 @@
+import os
+import pickle
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+
+from hetdesrun.models.run import ProcessStage, WorkflowExecutionInput, WorkflowExecutionResult
+from hetdesrun.runtime.worker_pool import (
+    _pickle_result,
+    _unpickle_result,
+    dispatch_runtime_service,
+    get_runtime_worker_pool,
+    shutdown_runtime_worker_pool,
+)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_runtime_service_without_worker_pool(input_json_with_wiring):
+    runtime_input = WorkflowExecutionInput.parse_obj(input_json_with_wiring)
+
+    with mock.patch("hetdesrun.runtime.worker_pool.get_runtime_worker_pool") as mocked_get_pool:
+        result = await dispatch_runtime_service(runtime_input)
+
+    mocked_get_pool.assert_not_called()
+    assert result.result == "ok"
+    assert result.output_results_by_output_name["z"] == 4.0
+
+
+@pytest.mark.asyncio
+async def test_dispatch_runtime_service_to_worker_pool(input_json_with_wiring):
+    runtime_input = WorkflowExecutionInput.parse_obj(input_json_with_wiring)
+
+    with mock.patch("hetdesrun.webservice.config.runtime_config.runtime_worker_processes", 1):
+        try:
+            first_result = await dispatch_runtime_service(runtime_input)
+            second_result = await dispatch_runtime_service(runtime_input)
+            worker_pids = {process.pid for process in get_runtime_worker_pool()._processes.values()}
+        finally:
+            shutdown_runtime_worker_pool()
+
+    assert first_result.result == "ok"
+    assert first_result.output_results_by_output_name["z"] == 4.0
+    assert second_result.output_results_by_output_name["z"] == 4.0
+    assert first_result.job_id == runtime_input.job_id
+
+    assert len(worker_pids) == 1
+    assert os.getpid() not in worker_pids
+
+
+@pytest.mark.asyncio
+async def test_dispatch_runtime_service_returns_and_exports_operator_profiles(
+    input_json_with_wiring,
+):
+    runtime_input = WorkflowExecutionInput.parse_obj(input_json_with_wiring)
+    result = await dispatch_runtime_service(runtime_input)
+    assert result.operator_profiles is None
+
+    with (
+        mock.patch("hetdesrun.webservice.config.runtime_config.export_operator_metrics", True),
+        mock.patch("hetdesrun.runtime.worker_pool.export_operator_metrics") as mocked_export,
+    ):
+        result = await dispatch_runtime_service(runtime_input)
+        assert result.operator_profiles is None
+        exported_profiles = mocked_export.call_args.args[0]
+        assert len(exported_profiles) == 2
+
+        runtime_input.configuration.profile_operators = True
+        result = await dispatch_runtime_service(runtime_input)
+
+    assert result.operator_profiles is not None
+    assert set(result.operator_profiles) == set(exported_profiles)
+    for operator_id, profile in result.operator_profiles.items():
+        assert profile.operator_hierarchical_id == operator_id
+        assert profile.peak_memory_bytes is not None
+        assert len(profile.output_sizes) > 0
+
+
+def test_results_which_cannot_be_transferred_from_workers_become_error_results():
+    job_id = uuid4()
+    result = WorkflowExecutionResult(
+        result="ok",
+        output_results_by_output_name={"x": lambda: 1},
+        job_id=job_id,
+    )
+    unpicklable_result = _unpickle_result(_pickle_result(result), job_id)
+    assert unpicklable_result.result == "failure"
+    assert unpicklable_result.error.process_stage == ProcessStage.ENCODING_RESULTS_TO_JSON
+    assert unpicklable_result.job_id == job_id
+
+    # e.g. an instance of a class defined in component code not imported in this process
+    pickled_result = pickle.dumps(result.copy(update={"output_results_by_output_name": {}}))
+    with mock.patch(
+        "hetdesrun.runtime.worker_pool.pickle.loads",
+        side_effect=AttributeError("Can't get attribute 'Model' on <module 'component'>"),
+    ):
+        not_unpicklable_result = _unpickle_result(pickled_result, job_id)
+    assert not_unpicklable_result.result == "failure"
+    assert not_unpicklable_result.error.process_stage == ProcessStage.ENCODING_RESULTS_TO_JSON
+    assert "Can't get attribute" in not_unpicklable_result.error.message
@@ -190,9 +190,13 @@ async def test_running_workflow(async_test_client: AsyncClient) -> None:
     assert status_code == 200
     assert output["result"] == "ok"
 
-    node_results = output["node_results"]
-    assert "2.0" in node_results
-    assert "4.0" in node_results
+    node_result_values = [
+        output_summary["value"]
+        for node_result in output["node_results"].values()
+        for output_summary in node_result["outputs"].values()
+    ]
+    assert 2.0 in node_result_values
+    assert 4.0 in node_result_values
 
 
 series_input_workflow_json = {
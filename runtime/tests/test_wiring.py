@@ -1,5 +1,14 @@
+import asyncio
+from unittest import mock
+
 import pytest
 
+from hetdesrun.adapters import SOURCE_ADAPTERS, register_source_adapter
+from hetdesrun.adapters.concurrency import adapter_request_slot
+from hetdesrun.adapters.exceptions import AdapterHandlingException
+from hetdesrun.models.wiring import InputWiring, WorkflowWiring
+from hetdesrun.wiring import resolve_and_load_data_from_wiring
+
 
 async def run_workflow_with_client(workflow_json, open_async_test_client):
     response = await open_async_test_client.post("engine/runtime", json=workflow_json)
@@ -15,10 +24,14 @@ async def test_wiring_basics(input_json_with_wiring, async_test_client):
 
         assert output["result"] == "ok"
 
-        node_results = output["node_results"]
+        node_result_values = [
+            output_summary["value"]
+            for node_result in output["node_results"].values()
+            for output_summary in node_result["outputs"].values()
+        ]
 
-        assert "2.0" in node_results
-        assert "4.0" in node_results
+        assert 2.0 in node_result_values
+        assert 4.0 in node_result_values
 
         # does returning via direct sink provisioning work?
         assert output["output_results_by_output_name"]["z"] == 4.0
@@ -53,7 +66,93 @@ async def test_wiring_direct_input_provisioning(
 
         assert status_code == 200
 
-        node_results = output["node_results"]
+        node_result_values = [
+            output_summary["value"]
+            for node_result in output["node_results"].values()
+            for output_summary in node_result["outputs"].values()
+        ]
+
+        assert 32.0 in node_result_values  # intermediate result
+        assert 64.0 in node_result_values
+
+
+@pytest.mark.asyncio
+async def test_adapters_are_called_concurrently():
+    other_adapter_called = asyncio.Event()
+
+    async def load_from_first_adapter(sources, adapter_key):  # noqa: ARG001
+        # only finishes if the second adapter is called in the meantime
+        await asyncio.wait_for(other_adapter_called.wait(), timeout=5)
+        return {name: 1.0 for name in sources}
+
+    async def load_from_second_adapter(sources, adapter_key):  # noqa: ARG001
+        other_adapter_called.set()
+        return {name: 2.0 for name in sources}
+
+    with mock.patch.dict(SOURCE_ADAPTERS):
+        register_source_adapter("first", load_from_first_adapter)
+        register_source_adapter("second", load_from_second_adapter)
+        loaded_data = await resolve_and_load_data_from_wiring(
+            WorkflowWiring(
+                input_wirings=[
+                    InputWiring(workflow_input_name="a", adapter_id="first", ref_id="a"),
+                    InputWiring(workflow_input_name="b", adapter_id="second", ref_id="b"),
+                ]
+            )
+        )
+    assert loaded_data == {"a": 1.0, "b": 2.0}
 
-        assert "32.0" in node_results  # intermediate result
-        assert "64.0" in node_results
+
+@pytest.mark.asyncio
+async def test_failing_adapter_cancels_loads_of_other_adapters():
+    other_load_cancelled = asyncio.Event()
+
+    async def load_from_slow_adapter(sources, adapter_key):  # noqa: ARG001
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            other_load_cancelled.set()
+            raise
+        return {name: 1.0 for name in sources}
+
+    async def load_from_failing_adapter(sources, adapter_key):  # noqa: ARG001
+        raise AdapterHandlingException("Could not load data")
+
+    with mock.patch.dict(SOURCE_ADAPTERS):
+        register_source_adapter("slow", load_from_slow_adapter)
+        register_source_adapter("failing", load_from_failing_adapter)
+        with pytest.raises(AdapterHandlingException, match="Could not load data"):
+            await resolve_and_load_data_from_wiring(
+                WorkflowWiring(
+                    input_wirings=[
+                        InputWiring(workflow_input_name="a", adapter_id="slow", ref_id="a"),
+                        InputWiring(workflow_input_name="b", adapter_id="failing", ref_id="b"),
+                    ]
+                )
+            )
+    assert other_load_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_adapter_request_slots_are_limited():
+    running: dict[str, int] = {"first": 0, "second": 0, "total": 0}
+    max_running = running.copy()
+
+    async def request(adapter_key):
+        async with adapter_request_slot(adapter_key):
+            for key in (adapter_key, "total"):
+                running[key] += 1
+                max_running[key] = max(max_running[key], running[key])
+            await asyncio.sleep(0.01)
+            for key in (adapter_key, "total"):
+                running[key] -= 1
+
+    with (
+        mock.patch("hetdesrun.webservice.config.runtime_config.adapter_max_concurrent_requests", 3),
+        mock.patch(
+            "hetdesrun.webservice.config.runtime_config.adapter_max_concurrent_requests_per_adapter",
+            2,
+        ),
+    ):
+        await asyncio.gather(*(request(key) for key in ["first", "second"] * 5))
+    assert max_running == {"first": 2, "second": 2, "total": 3}